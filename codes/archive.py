@@ -0,0 +1,145 @@
+import bisect
+import numpy as np
+
+from hypervolume import Hypervolume
+
+class ParetoArchive:
+	"""
+	External elitist archive of feasible non-dominated placements (2 objectives).
+
+	Points are kept sorted by power consumption (ascending); for a non-dominated
+	set the network cost is then strictly decreasing, so both the dominance check
+	and the insertion position are found with a binary search.
+	"""
+	def __init__(self, maxSize=None, pruning='crowding', epsilon=None):
+		if pruning not in ('crowding', 'epsilon', 'hypervolume'):
+			raise ValueError(f"Unknown pruning strategy: {pruning}")
+		if pruning == 'epsilon' and epsilon is None:
+			raise ValueError("Epsilon pruning requires an epsilon value")
+		# Pruning always keeps both extremes, so at least two slots are needed
+		if maxSize is not None and maxSize < 2:
+			raise ValueError(f"Archive maxSize must be at least 2, got {maxSize}")
+
+		self.maxSize = maxSize
+		self.pruning = pruning
+		# Box size per objective (power, net) for the epsilon grid
+		self.epsilon = np.broadcast_to(np.asarray(epsilon, dtype=float), (2,)) if epsilon is not None else None
+
+		# Parallel sorted lists: power ascending <=> -net ascending
+		self.powers = []
+		self.negNets = []
+		self.solutions = []
+
+	def __len__(self):
+		return len(self.powers)
+
+	def __iter__(self):
+		for power, neg_net, chromosome in zip(self.powers, self.negNets, self.solutions):
+			yield power, -neg_net, chromosome
+
+	def isDominated(self, power, net):
+		"""True if (power, net) is dominated by or equal to an archived point."""
+		idx = bisect.bisect_right(self.powers, power)
+		# Predecessor has the lowest net cost among all points with power <= given power
+		return idx > 0 and -self.negNets[idx - 1] <= net
+
+	def add(self, power, net, chromosome=None):
+		"""
+		Insert a point if it is non-dominated. Removes every archived point it dominates.
+		Returns True if the point was accepted.
+		"""
+		if self.isDominated(power, net):
+			return False
+
+		# Dominated points form one contiguous block: power >= new power and net >= new net
+		start = bisect.bisect_left(self.powers, power)
+		end = bisect.bisect_right(self.negNets, -net, lo=start)
+
+		self.powers[start:end] = [power]
+		self.negNets[start:end] = [-net]
+		self.solutions[start:end] = [chromosome]
+
+		if self.maxSize is not None and len(self.powers) > self.maxSize:
+			self._prune()
+		return True
+
+	def update(self, individuals):
+		"""Offer every feasible individual to the archive. Returns the number accepted."""
+		accepted = 0
+		for ind in individuals:
+			if ind.isConstraintViolated:
+				continue
+			power = ind.objectives['power_consumption']
+			net = ind.objectives['net_communication']
+			# Cheap reject before copying the chromosome
+			if self.isDominated(power, net):
+				continue
+			if self.add(power, net, list(ind.chromosome_list)):
+				accepted += 1
+		return accepted
+
+	def shrink(self, maxSize):
+		"""Lower maxSize and prune the surplus points with the archive's own strategy."""
+		if maxSize is not None and maxSize < 2:
+			raise ValueError(f"Archive maxSize must be at least 2, got {maxSize}")
+		self.maxSize = maxSize
+		if maxSize is not None and len(self.powers) > maxSize:
+			self._prune()
+
+	def toArray(self):
+		"""Archive objectives as (N, 2) array [[power, net], ...] sorted by power."""
+		if not self.powers:
+			return np.empty((0, 2))
+		return np.column_stack((self.powers, -np.asarray(self.negNets)))
+
+	def _remove(self, idx):
+		del self.powers[idx]
+		del self.negNets[idx]
+		del self.solutions[idx]
+
+	def _prune(self):
+		if self.pruning == 'epsilon':
+			self._pruneEpsilonGrid()
+		while len(self.powers) > self.maxSize:
+			if self.pruning == 'hypervolume':
+				self._remove(self._leastContributorIndex())
+			else:
+				self._remove(self._mostCrowdedIndex())
+
+	def _mostCrowdedIndex(self):
+		"""Interior point with the smallest crowding distance (extremes are always kept)."""
+		front = self.toArray()
+		scale = front[-1] - front[0]
+		scale = np.abs(scale)
+		scale[scale == 0] = 1.0
+
+		# Sorted order holds for both objectives, so neighbours are simply idx-1 and idx+1
+		gaps = np.abs(front[2:] - front[:-2]) / scale
+		crowding = gaps.sum(axis=1)
+		return int(np.argmin(crowding)) + 1
+
+	def _leastContributorIndex(self):
+		"""Interior point with the smallest exclusive hypervolume contribution (extremes are always kept)."""
+		front = self.toArray()
+		# Interior contributions only depend on the neighbours, not on the reference point
+		contrib = Hypervolume.contributions(front, front.max(axis=0))
+		return int(np.argmin(contrib[1:-1])) + 1
+
+	def _pruneEpsilonGrid(self):
+		"""Keep one point per epsilon box: the one closest to the box's lower corner."""
+		front = self.toArray()
+		boxes = np.floor(front / self.epsilon)
+		# Both objectives are monotone in sorted order, so points sharing a box are contiguous
+		corner_dist = np.linalg.norm((front - boxes * self.epsilon) / self.epsilon, axis=1)
+
+		keep = []
+		run_start = 0
+		for i in range(1, len(front) + 1):
+			if i == len(front) or np.any(boxes[i] != boxes[run_start]):
+				keep.append(run_start + int(np.argmin(corner_dist[run_start:i])))
+				run_start = i
+
+		if len(keep) < len(front):
+			self.powers = [self.powers[i] for i in keep]
+			self.negNets = [self.negNets[i] for i in keep]
+			self.solutions = [self.solutions[i] for i in keep]
@@ -0,0 +1,58 @@
+import os
+import numpy as np
+
+class ConvergenceTrace:
+	"""
+	Rekaman konvergensi satu run: setiap k generasi, titik objektif feasible di rank 0
+	beserta jumlah evaluasi. Disimpan sebagai array float32 (.npy) yang sudah dialokasikan
+	di awal dan di-memory-map, sehingga satu rekaman hanya menulis beberapa baris.
+
+	Format baris: [generation, evaluations, power, net]
+	Baris yang belum terpakai berisi NaN; generasi tanpa solusi feasible ditulis sebagai
+	satu baris dengan power/net NaN.
+	"""
+	COLUMNS = 4
+
+	def __init__(self, path, maxRecords, maxPointsPerRecord):
+		self.path = path
+		os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+		capacity = maxRecords * max(1, maxPointsPerRecord)
+		self.data = np.lib.format.open_memmap(path, mode='w+', dtype=np.float32,
+											  shape=(capacity, self.COLUMNS))
+		self.data[:] = np.nan
+		self.rows = 0
+
+	def record(self, generation, evaluations, front):
+		"""front: list individu (rank 0). Hanya yang feasible yang direkam."""
+		points = [(ind.objectives['power_consumption'], ind.objectives['net_communication'])
+				  for ind in front if not ind.isConstraintViolated]
+		count = max(1, len(points))
+		if self.rows + count > len(self.data):
+			return # Kapasitas habis, rekaman diabaikan daripada memperbesar file
+
+		block = self.data[self.rows:self.rows + count]
+		block[:, 0] = generation
+		block[:, 1] = evaluations
+		if points:
+			block[:, 2:] = points
+		self.rows += count
+
+	def close(self):
+		self.data.flush()
+		del self.data
+
+	@staticmethod
+	def load(path):
+		"""Return list (generation, evaluations, front (N, 2)) terurut per generasi."""
+		data = np.load(path, mmap_mode='r')
+		used = np.asarray(data[~np.isnan(data[:, 0])], dtype=float)
+
+		records = []
+		if len(used) == 0:
+			return records
+		# Baris satu rekaman selalu berurutan, batasnya = perubahan nomor generasi
+		bounds = np.flatnonzero(np.diff(used[:, 0])) + 1
+		for block in np.split(used, bounds):
+			points = block[~np.isnan(block[:, 2]), 2:]
+			records.append((int(block[0, 0]), int(block[0, 1]), points))
+		return records
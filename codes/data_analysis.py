@@ -64,15 +64,17 @@ class ThesisStatisticalAnalyzer:
 	def _cliffs_delta(self, x, y):
 		"""
 		Calculates Cliff's Delta effect size (Non-parametric).
+		Rank-based: sort y once, then count for every x how many y are smaller / larger
+		with binary search -> O((m+n) log n) instead of the O(m*n) pair loop.
 		Returns: delta value, interpretation string
 		"""
-		m, n = len(x), len(y)
-		dom = 0
-		for i in x:
-			for j in y:
-				if i > j: dom += 1
-				elif i < j: dom -= 1
-		delta = dom / (m * n)
+		x = np.asarray(x, dtype=float)
+		y_sorted = np.sort(np.asarray(y, dtype=float))
+		m, n = len(x), len(y_sorted)
+
+		less = np.searchsorted(y_sorted, x, side='left')           # y < x
+		greater = n - np.searchsorted(y_sorted, x, side='right')   # y > x
+		delta = (np.sum(less) - np.sum(greater)) / (m * n)
 		
 		# Interpretation
 		abs_d = abs(delta)
@@ -83,6 +85,18 @@ class ThesisStatisticalAnalyzer:
 		
 		return delta, size
 
+	def _bootstrap_ci(self, differences, n_boot=2000, alpha=0.05, seed=0):
+		"""
+		Percentile bootstrap CI of the mean paired difference.
+		All resamples are drawn at once as an (n_boot, n) index matrix.
+		"""
+		differences = np.asarray(differences, dtype=float)
+		rng = np.random.default_rng(seed)
+		idx = rng.integers(0, len(differences), size=(n_boot, len(differences)))
+		boot_means = differences[idx].mean(axis=1)
+		low, high = np.quantile(boot_means, [alpha / 2, 1 - alpha / 2])
+		return low, high
+
 	def _cohens_d(self, x, y):
 		"""
 		Calculates Cohen's d effect size (Parametric).
@@ -92,6 +106,77 @@ class ThesisStatisticalAnalyzer:
 		dof = nx + ny - 2
 		return (np.mean(x) - np.mean(y)) / np.sqrt(((nx-1)*np.std(x, ddof=1) ** 2 + (ny-1)*np.std(y, ddof=1) ** 2) / dof)
 
+	def _analyze_pair(self, data_classic, data_hybrid, metric, alpha=0.05, label=""):
+		"""
+		Shapiro-Wilk on diff -> T-Test (if normal) OR Wilcoxon (if not), plus effect size
+		and a bootstrap CI of the mean difference. Returns one result row (or None).
+		"""
+		# Drop NaNs for robust handling
+		clean_df = pd.DataFrame({'Classic': data_classic, 'Hybrid': data_hybrid}).dropna()
+		
+		data_classic = clean_df['Classic']
+		data_hybrid = clean_df['Hybrid']
+		
+		n = len(clean_df)
+		if n < 8:
+			print(f"Warning: Skipping {label}{metric} due to insufficient data (n={n})")
+			return None
+
+		# 1. Calculate Differences
+		differences = data_hybrid - data_classic
+
+		# 2. Normality Test (Shapiro-Wilk) on DIFFERENCES
+		# Note: For paired tests, we check normality of the *difference*, not the groups.
+		stat_shapiro, p_shapiro = stats.shapiro(differences)
+		is_normal = p_shapiro > alpha
+
+		# 3. Choose Test & Effect Size
+		if is_normal:
+			test_name = "Paired T-Test"
+			stat_test, p_value = stats.ttest_rel(data_hybrid, data_classic)
+			
+			# Effect Size: Cohen's d
+			eff_size = self._cohens_d(data_hybrid, data_classic)
+			eff_interp = "Small" if abs(eff_size) < 0.5 else "Medium" if abs(eff_size) < 0.8 else "Large"
+			
+		else:
+			test_name = "Wilcoxon Signed-Rank"
+			# alternative='two-sided' is default
+			stat_test, p_value = stats.wilcoxon(data_hybrid, data_classic)
+			
+			# Effect Size: Cliff's Delta (Non-parametric)
+			eff_size, eff_interp = self._cliffs_delta(data_hybrid, data_classic)
+
+		ci_low, ci_high = self._bootstrap_ci(differences, alpha=alpha)
+
+		# 4. Interpretation
+		# Mean comparison to see WHO won
+		mean_classic = data_classic.mean()
+		mean_hybrid = data_hybrid.mean()
+		
+		winner = "Inconclusive"
+		if p_value <= alpha:
+			if metric in ['hv']: # Higher is better
+				winner = "Hybrid" if mean_hybrid > mean_classic else "Classic"
+			else: # Lower is better (IGD+, GD+, Spacing)
+				winner = "Hybrid" if mean_hybrid < mean_classic else "Classic"
+		else:
+			winner = "No Signif. Diff"
+
+		return {
+			"Metric": metric,
+			"N": n,
+			"Normality (p)": round(p_shapiro, 4),
+			"Test Used": test_name,
+			"Test Stat": round(stat_test, 2),
+			"P-Value": p_value, # Keep precision
+			"Signif?": "YES" if p_value <= alpha else "NO",
+			"Winner": winner,
+			"Effect Size": round(eff_size, 3),
+			"Effect Magnitude": eff_interp,
+			"Mean Diff CI": (round(ci_low, 6), round(ci_high, 6))
+		}
+
 	def perform_paired_analysis(self, alpha=0.05):
 		"""
 		Performs robust paired statistical analysis.
@@ -110,70 +195,43 @@ class ThesisStatisticalAnalyzer:
 			if col_classic not in self.df.columns or col_hybrid not in self.df.columns:
 				continue
 
-			# Drop NaNs for robust handling
-			clean_df = self.df[[col_classic, col_hybrid]].dropna()
-			
-			data_classic = clean_df[col_classic]
-			data_hybrid = clean_df[col_hybrid]
-			
-			n = len(clean_df)
-			if n < 8:
-				print(f"Warning: Skipping {metric} due to insufficient data (n={n})")
-				continue
+			row = self._analyze_pair(self.df[col_classic], self.df[col_hybrid], metric, alpha)
+			if row is not None:
+				results.append(row)
 
-			# 1. Calculate Differences
-			differences = data_hybrid - data_classic
+		return pd.DataFrame(results).set_index("Metric")
 
-			# 2. Normality Test (Shapiro-Wilk) on DIFFERENCES
-			# Note: For paired tests, we check normality of the *difference*, not the groups.
-			stat_shapiro, p_shapiro = stats.shapiro(differences)
-			is_normal = p_shapiro > alpha
+	def perform_batch_analysis(self, metrics_df, alpha=0.05):
+		"""
+		Runs the paired pipeline for every (scenario, metric) pair in one call.
+		metrics_df is the long table written by main.py (final_metrics.csv): one row per
+		run with 'run_key' (e.g. small_1_r0), 'Algorithm' and the metric columns.
+		Runs are paired by (scenario, run number).
+		"""
+		metrics = ['igd_plus', 'gd_plus', 'hv', 'spacing']
+		df = metrics_df.copy()
+		split = df['run_key'].str.rsplit('_r', n=1, expand=True)
+		df['Scenario'] = split[0]
+		df['Run'] = split[1].astype(int)
 
-			# 3. Choose Test & Effect Size
-			if is_normal:
-				test_name = "Paired T-Test"
-				stat_test, p_value = stats.ttest_rel(data_hybrid, data_classic)
-				
-				# Effect Size: Cohen's d
-				eff_size = self._cohens_d(data_hybrid, data_classic)
-				eff_interp = "Small" if abs(eff_size) < 0.5 else "Medium" if abs(eff_size) < 0.8 else "Large"
-				
-			else:
-				test_name = "Wilcoxon Signed-Rank"
-				# alternative='two-sided' is default
-				stat_test, p_value = stats.wilcoxon(data_hybrid, data_classic)
-				
-				# Effect Size: Cliff's Delta (Non-parametric)
-				eff_size, eff_interp = self._cliffs_delta(data_hybrid, data_classic)
+		value_cols = [m for m in metrics if m in df.columns]
+		wide = df.pivot_table(index=['Scenario', 'Run'], columns='Algorithm', values=value_cols)
 
-			# 4. Interpretation
-			# Mean comparison to see WHO won
-			mean_classic = data_classic.mean()
-			mean_hybrid = data_hybrid.mean()
-			
-			winner = "Inconclusive"
-			if p_value <= alpha:
-				if metric in ['hv']: # Higher is better
-					winner = "Hybrid" if mean_hybrid > mean_classic else "Classic"
-				else: # Lower is better (IGD+, GD+, Spacing)
-					winner = "Hybrid" if mean_hybrid < mean_classic else "Classic"
-			else:
-				winner = "No Signif. Diff"
-
-			results.append({
-				"Metric": metric,
-				"N": n,
-				"Normality (p)": round(p_shapiro, 4),
-				"Test Used": test_name,
-				"Test Stat": round(stat_test, 2),
-				"P-Value": p_value, # Keep precision
-				"Signif?": "YES" if p_value <= alpha else "NO",
-				"Winner": winner,
-				"Effect Size": round(eff_size, 3),
-				"Effect Magnitude": eff_interp
-			})
+		results = []
+		print("\n--- Running Batched Statistical Tests ---")
+		for scenario, group in wide.groupby(level='Scenario'):
+			for metric in value_cols:
+				if (metric, 'Classic') not in group.columns or (metric, 'Hybrid') not in group.columns:
+					continue
+				row = self._analyze_pair(group[(metric, 'Classic')].values, group[(metric, 'Hybrid')].values,
+										 metric, alpha, label=f"{scenario}/")
+				if row is not None:
+					row["Scenario"] = scenario
+					results.append(row)
 
-		return pd.DataFrame(results).set_index("Metric")
+		if not results:
+			return pd.DataFrame()
+		return pd.DataFrame(results).set_index(["Scenario", "Metric"])
 
 	def generate_boxplots(self, output_dir="plots"):
 		"""
@@ -0,0 +1,270 @@
+import os
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+
+from archive import ParetoArchive
+from individual_hybrid import IndividualHybrid
+from local_search import LocalSearch
+from nsga2_hybrid import NSGA2Hybrid
+
+def _solve_pod(subproblem, populationSize, maxGeneration, seed, localSearch):
+	"""Worker: NSGA2Hybrid pada satu pod. Return list (power, net, kromosom lokal) front rank 0."""
+	engine = NSGA2Hybrid(subproblem, populationSize, maxGeneration)
+	engine.setSeed(seed)
+	if localSearch:
+		engine.enableLocalSearch()
+	engine.run(verbose=False)
+
+	feasible = [ind for ind in engine.population.fronts[0] if not ind.isConstraintViolated]
+	# Pod tanpa solusi feasible: bawa yang pelanggarannya terkecil, diperbaiki di level global
+	candidates = feasible or [min(engine.population, key=lambda x: x.totalViolation)]
+
+	front = []
+	seen = set()
+	for ind in candidates:
+		key = ind.canonicalKey()
+		if key in seen:
+			continue
+		seen.add(key)
+		front.append((ind.objectives['power_consumption'], ind.objectives['net_communication'],
+					  [int(server_idx) for server_idx in ind.chromosome_list]))
+	return front
+
+class PodDecomposition:
+	"""
+	Solver terdekomposisi per pod untuk data center fat-tree besar.
+
+	1. Partisi: pod dibaca dari level biaya C (server satu pod <=> biaya di bawah level
+	   antar-pod), cluster VM = komponen terhubung trafik di atas trafficThreshold
+	   (noise antar-cluster generator <= 1e-3 per pasangan, jadi diabaikan). Jumlah pod yang
+	   dipakai ditentukan first-fit decreasing (CPU) sampai podFill dari kapasitas CPU & memori
+	   pod, minimal minPods (default: jumlah worker) agar pod benar-benar diselesaikan paralel,
+	   lalu cluster disebar seimbang ke pod tersebut; cluster yang tidak muat dipecah per VM.
+	   Jika hanya ada satu pod/cluster, mode ini jatuh ke satu run NSGA2Hybrid serial pada
+	   pod tersebut (dicatat di log).
+	2. Setiap pod diselesaikan paralel (proses) dengan NSGA2Hybrid. Trafik VM ke pod lain
+	   selalu lintas server, jadi ditambahkan ke e_vector subproblem: constraint net tepat,
+	   objektif net hanya bergeser konstan selama g seragam di dalam pod.
+	3. Merge: front global = jumlah Minkowski front pod (power aditif, net aditif + konstanta),
+	   difilter non-dominated & dibatasi maxFrontSize lewat ParetoArchive.
+	4. Koordinasi: setiap kombinasi dievaluasi penuh pada Problem global, di-repair jika
+	   perlu, lalu VM dengan trafik antar-pod terbesar dicoba dipindah ke server peer-nya
+	   (LocalSearch.colocate, hanya move Pareto-improving).
+
+	Hasil: self.archive (ParetoArchive global, feasible), bisa langsung ke ExperimentAnalyzer.addResult.
+	"""
+	def __init__(self, problem, populationSize=100, maxGeneration=100, workers=None, podFill=0.8,
+				 trafficThreshold=1e-3, maxFrontSize=100, localSearch=False, minPods=None):
+		self.problem = problem
+		self.populationSize = populationSize
+		self.maxGeneration = maxGeneration
+		self.workers = workers
+		self.podFill = podFill
+		self.trafficThreshold = trafficThreshold
+		self.maxFrontSize = maxFrontSize
+		self.localSearch = localSearch
+		self.minPods = minPods if minPods is not None else (workers or os.cpu_count() or 1)
+		self.seed = 0
+
+		self.parts = []
+		self.archive = None
+		self.timings = {}
+
+	def setSeed(self, seed):
+		self.seed = seed
+
+	def log(self, message, verbose):
+		if verbose:
+			print(message, flush=True)
+
+	# ==== 1. Partisi ====
+	def podsFromCosts(self):
+		"""List array indeks server per pod, dari level biaya tertinggi (antar-pod) di C_matrix."""
+		C = np.asarray(self.problem.C_matrix)
+		if C.max() == C.min():
+			return [np.arange(self.problem.N_P)]
+		# Baris "biaya < level antar-pod" identik untuk semua server dalam satu pod
+		_, labels = np.unique(C < C.max(), axis=0, return_inverse=True)
+		labels = labels.ravel()
+		pods = [np.flatnonzero(labels == label) for label in np.unique(labels)]
+		return sorted(pods, key=lambda servers: servers[0])
+
+	def trafficClusters(self):
+		"""Komponen terhubung graf VM dengan trafik > trafficThreshold."""
+		T = np.asarray(self.problem.T_matrix)
+		# T sudah simetris; maximum (bukan T + T.T) agar noise tidak terhitung dua kali
+		strong = np.maximum(T, T.T) > self.trafficThreshold
+		labels = np.full(self.problem.N_V, -1)
+		clusters = []
+		for start in range(self.problem.N_V):
+			if labels[start] >= 0:
+				continue
+			labels[start] = len(clusters)
+			members = [start]
+			stack = [start]
+			while stack:
+				vm_idx = stack.pop()
+				peers = np.flatnonzero(strong[vm_idx] & (labels < 0))
+				labels[peers] = len(clusters)
+				members.extend(peers.tolist())
+				stack.extend(peers.tolist())
+			clusters.append(np.sort(np.array(members)))
+		return clusters
+
+	def partition(self):
+		"""
+		Return list (indeks VM, indeks server) per pod yang mendapat VM.
+		First-fit decreasing menentukan pod mana yang dipakai (sesedikit mungkin, hemat idle
+		power), ditambah pod berkapasitas terbesar sampai minPods; cluster lalu disebar
+		seimbang (worst-fit) ke pod tersebut agar subproblem paralel berukuran serupa.
+		"""
+		pods = self.podsFromCosts()
+		clusters = self.trafficClusters()
+		clusters.sort(key=lambda vms: -np.sum(self.problem.v_cpu[vms]))
+
+		first_fit = self._pack(clusters, pods, range(len(pods)), balanced=False)
+		used = [k for k, vms in enumerate(first_fit) if vms]
+		target = min(self.minPods, len(pods), len(clusters))
+		if len(used) < target:
+			spare = sorted((k for k in range(len(pods)) if k not in used),
+						   key=lambda k: -np.sum(self.problem.p_cpu[pods[k]]))
+			used += spare[:target - len(used)]
+		assigned = self._pack(clusters, pods, used, balanced=True)
+
+		self.parts = [(np.sort(np.array(vms)), servers) for vms, servers in zip(assigned, pods) if vms]
+		return self.parts
+
+	def _pack(self, clusters, pods, allowed, balanced):
+		p = self.problem
+		allowed = list(allowed)
+		cap_cpu = np.array([self.podFill * np.sum(p.p_cpu[pods[k]]) for k in allowed])
+		cap_mem = np.array([self.podFill * np.sum(p.p_mem[pods[k]]) for k in allowed])
+		used_cpu = np.zeros(len(allowed))
+		used_mem = np.zeros(len(allowed))
+		assigned = [[] for _ in pods]
+
+		def choose(cpu, mem):
+			fits = np.flatnonzero((used_cpu + cpu <= cap_cpu) & (used_mem + mem <= cap_mem))
+			if len(fits) == 0:
+				return None
+			if balanced:
+				# Worst-fit: pod dengan sisa kapasitas CPU relatif terbesar
+				return int(fits[np.argmax((cap_cpu[fits] - used_cpu[fits]) / cap_cpu[fits])])
+			return int(fits[0])
+
+		def place(slot, vms):
+			used_cpu[slot] += np.sum(p.v_cpu[vms])
+			used_mem[slot] += np.sum(p.v_mem[vms])
+			assigned[allowed[slot]].extend(vms.tolist())
+
+		for vms in clusters:
+			slot = choose(np.sum(p.v_cpu[vms]), np.sum(p.v_mem[vms]))
+			if slot is not None:
+				place(slot, vms)
+				continue
+			# Cluster terlalu besar untuk sisa pod mana pun: pecah per VM
+			for vm_idx in vms[np.argsort(-p.v_cpu[vms])]:
+				slot = choose(p.v_cpu[vm_idx], p.v_mem[vm_idx])
+				if slot is None:
+					slot = int(np.argmax(cap_cpu - used_cpu))
+				place(slot, np.array([vm_idx]))
+		return assigned
+
+	def _subProblem(self, vms, servers):
+		sub = self.problem.subProblem(vms, servers)
+		# Trafik ke VM di pod lain selalu lintas server: dibebankan sebagai trafik eksternal
+		T = np.asarray(self.problem.T_matrix)
+		sub.e_vector = sub.e_vector + T[vms].sum(axis=1) - sub.T_matrix.sum(axis=1)
+		return sub
+
+	# ==== 2. Solve paralel ====
+	def solve(self, verbose=True):
+		start = time.time()
+		self.partition()
+		self.timings['partition'] = time.time() - start
+		sizes = ", ".join(f"{len(vms)}/{len(servers)}" for vms, servers in self.parts)
+		self.log(f"[Decomposition] {len(self.parts)} pods (VMs/servers): {sizes}", verbose)
+		if len(self.parts) == 1:
+			self.log("[Decomposition] Single pod: falling back to one serial NSGA2Hybrid run on that pod", verbose)
+
+		start = time.time()
+		subproblems = [self._subProblem(vms, servers) for vms, servers in self.parts]
+		if len(self.parts) == 1:
+			# Tanpa paralelisme tidak perlu proses pool (spawn + pickle problem)
+			subfronts = [_solve_pod(subproblems[0], self.populationSize, self.maxGeneration, self.seed, self.localSearch)]
+		else:
+			subfronts = [None] * len(self.parts)
+			# Pod terbesar dulu agar beban worker seimbang
+			order = sorted(range(len(self.parts)), key=lambda k: -len(self.parts[k][0]))
+			with ProcessPoolExecutor(max_workers=self.workers) as pool:
+				futures = {k: pool.submit(_solve_pod, subproblems[k], self.populationSize,
+										  self.maxGeneration, self.seed + k, self.localSearch)
+						   for k in order}
+				for k, future in futures.items():
+					subfronts[k] = future.result()
+		self.timings['solve'] = time.time() - start
+		self.log(f"[Decomposition] Pod fronts: {[len(front) for front in subfronts]} ({self.timings['solve']:.1f}s)", verbose)
+
+		start = time.time()
+		combos = self._merge(subfronts)
+		self.timings['merge'] = time.time() - start
+
+		start = time.time()
+		self.archive = ParetoArchive(self.maxFrontSize)
+		coordinator = LocalSearch(self.problem)
+		engine = NSGA2Hybrid(self.problem)
+		pairs = self._crossPodPairs()
+		moves = 0
+		for combo in combos:
+			ind = self._assemble(subfronts, combo)
+			if ind.isConstraintViolated:
+				engine.repair(ind)
+			moves += coordinator.colocate(ind, pairs)
+			self.archive.update([ind])
+		self.timings['coordination'] = time.time() - start
+		self.log(f"[Decomposition] Global front: {len(self.archive)} points from {len(combos)} combinations, "
+				 f"{moves} cross-pod moves ({self.timings['coordination']:.1f}s)", verbose)
+		return self.archive
+
+	# ==== 3. Merge & 4. Koordinasi ====
+	def _merge(self, subfronts):
+		"""
+		Jumlah Minkowski front pod secara bertahap. Return list tuple indeks solusi per pod.
+		Archive antara dibatasi maxFrontSize x ukuran front pod (bukan maxFrontSize), agar
+		kombinasi yang baru non-dominated di tahap akhir tidak terbuang; hanya hasil akhir yang
+		dipangkas ke maxFrontSize.
+		"""
+		merged = ParetoArchive()
+		merged.add(0.0, 0.0, ())
+		for front in subfronts:
+			cap = self.maxFrontSize * max(len(front), 1) if self.maxFrontSize is not None else None
+			combined = ParetoArchive(cap)
+			for power, net, combo in merged:
+				for idx, (pod_power, pod_net, _) in enumerate(front):
+					combined.add(power + pod_power, net + pod_net, combo + (idx,))
+			merged = combined
+		merged.shrink(self.maxFrontSize)
+		return [combo for _, _, combo in merged]
+
+	def _assemble(self, subfronts, combo):
+		server_map = {}
+		for (vms, servers), front, idx in zip(self.parts, subfronts, combo):
+			for vm_idx, local_server in zip(vms.tolist(), front[idx][2]):
+				server_map.setdefault(int(servers[local_server]), []).append(vm_idx)
+		ind = IndividualHybrid(self.problem, server_map)
+		ind.evaluateFull()
+		return ind
+
+	def _crossPodPairs(self):
+		"""(vm, peer antar-pod dengan trafik terbesar), terurut trafik menurun."""
+		T = np.asarray(self.problem.T_matrix)
+		pod_of = np.full(self.problem.N_V, -1)
+		for k, (vms, _) in enumerate(self.parts):
+			pod_of[vms] = k
+		cross = np.where(pod_of[:, np.newaxis] != pod_of[np.newaxis, :], T + T.T, 0.0)
+		peers = np.argmax(cross, axis=1)
+		traffic = cross[np.arange(self.problem.N_V), peers]
+		vms = np.flatnonzero(traffic > self.trafficThreshold)
+		vms = vms[np.argsort(-traffic[vms])]
+		return [(int(vm_idx), int(peers[vm_idx])) for vm_idx in vms]
@@ -0,0 +1,246 @@
+import time
+import numpy as np
+
+from lp_writer import server_equivalence_classes
+
+class ExactParetoSolver:
+	"""
+	Solver Pareto eksak (tanpa Gurobi/PaMILO) untuk instance kecil (~20 VM).
+
+	Epsilon-constraint sweep: setiap langkah mencari minimum leksikografis (power, net)
+	dengan syarat net < net titik sebelumnya, sehingga semua titik non-dominated
+	(termasuk yang unsupported) ditemukan, satu solusi per vektor objektif.
+
+	Setiap langkah adalah branch-and-bound DFS atas penempatan VM, dengan:
+	  - lower bound power: slope minimum per VM + biaya idle minimum (bin-packing
+	    fraksional) untuk kapasitas CPU / memori yang masih kurang
+	  - lower bound net: biaya eksternal + trafik ke VM yang sudah ditempatkan,
+	    diminimumkan per VM yang belum ditempatkan atas server yang masih muat
+	  - pruning kapasitas net dari trafik yang sudah pasti lintas server
+	  - symmetry breaking: di antara server kosong yang identik hanya satu yang dicoba
+	Objektif & constraint dihitung persis seperti Individual.evaluateFull.
+	"""
+	def __init__(self, problem, time_limit=None, tol=1e-9):
+		self.problem = problem
+		self.time_limit = time_limit
+		self.tol = tol
+
+		p = problem
+		self.T = np.asarray(p.T_matrix, dtype=float)
+		# Bobot objektif per pasangan: 0.5 * sum(T * C) atas matriks penuh
+		self.T_pair = 0.5 * (self.T + self.T.T)
+		self.C = np.asarray(p.C_matrix, dtype=float)
+		cap = np.where(p.p_cpu > 0, p.p_cpu, 1.0)
+		self.slope = (p.PC_max - p.PC_idle) / cap
+		# Biaya idle per unit kapasitas CPU (bound fraksional)
+		self.idle_per_cpu = p.PC_idle / cap
+
+		self.server_class = np.arange(p.N_P)
+		for members in server_equivalence_classes(p):
+			self.server_class[members] = members[0]
+
+		# VM besar & banyak trafik dulu (first-fit decreasing)
+		weight = p.v_cpu / max(p.p_cpu.max(), 1) + p.v_mem / max(p.p_mem.max(), 1)
+		self.order = np.lexsort((-self.T.sum(axis=1), -weight))
+
+		self.solutions = []
+		self.optimal = True
+		self.nodes = 0
+
+	# ==== Evaluasi penuh (oracle) ====
+	def evaluate(self, assignment):
+		"""Return (power, net, feasible) untuk assignment[vm] = server."""
+		p = self.problem
+		a = np.asarray(assignment)
+		cpu = np.bincount(a, weights=p.v_cpu, minlength=p.N_P)
+		mem = np.bincount(a, weights=p.v_mem, minlength=p.N_P)
+		diff = a[:, np.newaxis] != a[np.newaxis, :]
+		net = np.bincount(a, weights=p.e_vector + np.sum(self.T * diff, axis=1), minlength=p.N_P)
+
+		active = cpu > 0
+		power = float(np.sum(self.slope[active] * cpu[active] + p.PC_idle[active]))
+		net_cost = float(0.5 * np.sum(self.T * self.C[a[:, np.newaxis], a[np.newaxis, :]]) + np.sum(p.e_vector * p.g_vector[a]))
+		feasible = bool(np.all(cpu <= p.p_cpu) and np.all(mem <= p.p_mem) and np.all(net <= p.p_net))
+		return power, net_cost, feasible
+
+	# ==== Epsilon-constraint sweep ====
+	def solve(self, verbose=False):
+		"""Return front eksak (N, 2) [power, net] terurut power naik; assignment di self.solutions."""
+		self.solutions = []
+		self.optimal = True
+		self.nodes = 0
+		self._deadline = time.time() + self.time_limit if self.time_limit else None
+
+		net_bound = np.inf
+		front = []
+		while True:
+			result = self._solveLexicographic(net_bound)
+			if result is None:
+				break
+			power, net, assignment = result
+			front.append((power, net))
+			self.solutions.append(assignment)
+			if verbose:
+				print(f"[Exact] Point {len(front)}: power={power:.4f}, net={net:.4f} ({self.nodes} nodes)")
+			if not self.optimal:
+				break
+			net_bound = net - self.tol * max(1.0, abs(net))
+
+		if verbose and not self.optimal:
+			print("[Exact] Time limit reached, front may be incomplete.")
+		return np.array(front).reshape(-1, 2)
+
+	def _better(self, power, net):
+		# Perbandingan leksikografis (power, net) terhadap incumbent, dengan toleransi
+		if self.incumbent[2] is None:
+			return True
+		inc_power, inc_net = self.incumbent[0], self.incumbent[1]
+		if power < inc_power - self.tol * max(1.0, abs(inc_power)):
+			return True
+		return power <= inc_power + self.tol * max(1.0, abs(inc_power)) and net < inc_net - self.tol * max(1.0, abs(inc_net))
+
+	def _canImprove(self, power_lb, net_lb):
+		if net_lb >= self.net_bound:
+			return False
+		if self.incumbent[2] is None:
+			return True
+		inc_power, inc_net = self.incumbent[0], self.incumbent[1]
+		if power_lb > inc_power + self.tol * max(1.0, abs(inc_power)):
+			return False
+		if power_lb >= inc_power - self.tol * max(1.0, abs(inc_power)) and net_lb >= inc_net - self.tol * max(1.0, abs(inc_net)):
+			return False
+		return True
+
+	def _solveLexicographic(self, net_bound):
+		p = self.problem
+		self.net_bound = net_bound
+		self.incumbent = (np.inf, np.inf, None)
+
+		self.assign = np.full(p.N_V, -1)
+		self.cpu = np.zeros(p.N_P)
+		self.mem = np.zeros(p.N_P)
+		self.count = np.zeros(p.N_P, dtype=int)
+		self.load = np.zeros(p.N_P)
+		# attach[k, l] = sum_{i sudah ditempatkan} T_pair[i,k] * C[a_i, l]
+		self.attach = np.zeros((p.N_V, p.N_P))
+		self.unassigned = np.ones(p.N_V, dtype=bool)
+
+		try:
+			self._branch(0, 0.0, 0.0)
+		except TimeoutError:
+			self.optimal = False
+
+		if self.incumbent[2] is None:
+			return None
+		return self.incumbent
+
+	def _lowerBounds(self, power, net):
+		p = self.problem
+		rest = np.flatnonzero(self.unassigned)
+		if len(rest) == 0:
+			return power, net
+
+		free_cpu = p.p_cpu - self.cpu
+		free_mem = p.p_mem - self.mem
+		fits = (p.v_cpu[rest, np.newaxis] <= free_cpu[np.newaxis, :]) & (p.v_mem[rest, np.newaxis] <= free_mem[np.newaxis, :])
+		if not np.all(np.any(fits, axis=1)):
+			return np.inf, np.inf
+
+		# Net: setiap VM sisa minimal membayar biaya eksternal + trafik ke VM yang sudah ditempatkan
+		net_cost = p.e_vector[rest, np.newaxis] * p.g_vector[np.newaxis, :] + self.attach[rest]
+		net_lb = net + np.sum(np.min(np.where(fits, net_cost, np.inf), axis=1))
+
+		# Power: bagian dinamis dengan slope termurah yang masih muat
+		dyn = p.v_cpu[rest, np.newaxis] * self.slope[np.newaxis, :]
+		power_lb = power + np.sum(np.min(np.where(fits, dyn, np.inf), axis=1))
+
+		# Power: idle server baru yang minimal dibutuhkan (bin-packing fraksional)
+		closed = self.count == 0
+		idle_lb = 0.0
+		for demand, free, capacity in ((np.sum(p.v_cpu[rest]), free_cpu, p.p_cpu),
+									   (np.sum(p.v_mem[rest]), free_mem, p.p_mem)):
+			residual = demand - np.sum(free[~closed])
+			if residual > 0:
+				safe_capacity = np.where(capacity > 0, capacity, 1.0)
+				cost = self._fractionalCover(p.PC_idle[closed] / safe_capacity[closed], capacity[closed], residual)
+				idle_lb = max(idle_lb, cost)
+
+		# Power: relaksasi fraksional gabungan, harga per unit CPU = slope (server aktif)
+		# atau slope + PC_idle / p_cpu (server baru, idle dibayar proporsional pemakaian)
+		price = self.slope + np.where(closed, self.idle_per_cpu, 0.0)
+		combined = self._fractionalCover(price, np.maximum(free_cpu, 0.0), np.sum(p.v_cpu[rest]))
+		return max(power_lb + idle_lb, power + combined), net_lb
+
+	@staticmethod
+	def _fractionalCover(prices, capacities, demand):
+		"""Biaya minimum memenuhi demand dari kapasitas berharga per unit (greedy = optimal)."""
+		if demand <= 0:
+			return 0.0
+		order = np.argsort(prices)
+		caps = capacities[order]
+		filled = np.cumsum(caps)
+		if len(filled) == 0 or filled[-1] < demand:
+			return np.inf
+		k = int(np.searchsorted(filled, demand))
+		before = filled[k - 1] if k > 0 else 0.0
+		return float(np.dot(prices[order[:k]], caps[:k]) + prices[order[k]] * (demand - before))
+
+	def _branch(self, depth, power, net):
+		p = self.problem
+		self.nodes += 1
+		if self._deadline is not None and (self.nodes & 1023) == 0 and time.time() > self._deadline:
+			raise TimeoutError
+
+		if depth == p.N_V:
+			# Nilai akhir dihitung ulang penuh agar tidak membawa galat akumulasi delta
+			power, net, feasible = self.evaluate(self.assign)
+			if feasible and net < self.net_bound and self._better(power, net):
+				self.incumbent = (power, net, self.assign.copy())
+			return
+
+		power_lb, net_lb = self._lowerBounds(power, net)
+		if not self._canImprove(power_lb, net_lb):
+			return
+
+		i = self.order[depth]
+		placed = np.flatnonzero(~self.unassigned)
+		candidates = []
+		tried_empty_classes = set()
+		for j in range(p.N_P):
+			if self.cpu[j] + p.v_cpu[i] > p.p_cpu[j] or self.mem[j] + p.v_mem[i] > p.p_mem[j]:
+				continue
+			if self.count[j] == 0:
+				# Server kosong yang identik saling dapat ditukar: cukup coba satu
+				if self.server_class[j] in tried_empty_classes:
+					continue
+				tried_empty_classes.add(self.server_class[j])
+				d_power = p.PC_idle[j] + self.slope[j] * p.v_cpu[i]
+			else:
+				d_power = self.slope[j] * p.v_cpu[i]
+			d_net = p.e_vector[i] * p.g_vector[j] + self.attach[i, j]
+			candidates.append((d_power, d_net, j))
+		candidates.sort()
+
+		self.unassigned[i] = False
+		for d_power, d_net, j in candidates:
+			# Beban net yang sudah pasti: trafik i ke VM yang sudah ditempatkan di server lain
+			others = placed[self.assign[placed] != j]
+			load_before = self.load.copy()
+			self.load[j] += p.e_vector[i] + np.sum(self.T[i, others])
+			np.add.at(self.load, self.assign[others], self.T[others, i])
+			if np.all(self.load <= p.p_net):
+				self.assign[i] = j
+				self.cpu[j] += p.v_cpu[i]
+				self.mem[j] += p.v_mem[i]
+				self.count[j] += 1
+				self.attach += self.T_pair[:, i, np.newaxis] * self.C[j][np.newaxis, :]
+
+				self._branch(depth + 1, power + d_power, net + d_net)
+
+				self.attach -= self.T_pair[:, i, np.newaxis] * self.C[j][np.newaxis, :]
+				self.count[j] -= 1
+				self.mem[j] -= p.v_mem[i]
+				self.cpu[j] -= p.v_cpu[i]
+				self.assign[i] = -1
+			self.load = load_before
+		self.unassigned[i] = True
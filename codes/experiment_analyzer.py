@@ -1,48 +1,87 @@
 import json
+import hashlib
 import numpy as np
 import pandas as pd
 import os
 import glob
 import re
+from concurrent.futures import ProcessPoolExecutor
 
 from performance_metrics import PerformanceMetrics 
 from population import Population
+from archive import ParetoArchive
+from reference_front import ReferenceFrontBuilder
+from convergence_trace import ConvergenceTrace
+from exact_solver import ExactParetoSolver
+
+def _compute_run_metrics(norm_front, norm_ref, hv_ref_point):
+	"""Satu job metrik (dipanggil di worker process)."""
+	return {
+		'spacing': float(PerformanceMetrics.calculate_spacing(norm_front)),
+		'hv': float(PerformanceMetrics.calculate_hypervolume(norm_front, hv_ref_point)),
+		'igd_plus': float(PerformanceMetrics.calculate_igd_plus(norm_front, norm_ref)),
+		'gd_plus': float(PerformanceMetrics.calculate_gd_plus(norm_front, norm_ref))
+	}
 
 class ExperimentAnalyzer:
-	def __init__(self):
+	def __init__(self, store=None):
 		# Format: self.results[algo][run_key] = np.array([[obj1, obj2], ...])
 		self.results = {
 			'Classic': {},
 			'Hybrid': {}
 		}
-		self.pamilo_solutions = [] 
-		self.reference_front = None
-		self.min_objectives = None
-		self.max_objectives = None
+		# Format: self.pamilo_solutions[scenario] = [[obj1, obj2], ...]
+		self.pamilo_solutions = {}
+		# Format: self.exact_solutions[scenario] = np.array([[obj1, obj2], ...]) dari ExactParetoSolver
+		self.exact_solutions = {}
+		# Reference front & bounds normalisasi per skenario, di-update setiap ada front baru
+		self.reference = ReferenceFrontBuilder()
+		# Cache metrik: self.metric_cache[reference_fingerprint][front_hash] = {metric: value}
+		self.metric_cache = {}
+		# Cache reference front ternormalisasi per fingerprint
+		self.norm_ref_cache = {}
+		# ResultStore (opsional): semua front disimpan di satu store append-only
+		self.store = store
+
+	@staticmethod
+	def _scenarioOf(run_key):
+		# small_1_r0 -> small_1
+		return run_key.rsplit('_r', 1)[0]
 
 	def addResult(self, algo_name, run_key, population: Population, save_path=None):
 		"""
-		Menambahkan hasil dari populasi NSGA-II ke memori dan (opsional) menyimpannya ke CSV di Drive.
+		Menambahkan hasil dari populasi NSGA-II ke memori dan (opsional) menyimpannya ke
+		ResultStore analyzer dan/atau ke CSV di Drive.
+		population boleh berupa ParetoArchive (NSGA2.archive) untuk menyimpan isi archive.
 		"""
-		front_data = []
-		
-		# Handle jika population adalah object wrapper atau list
-		inds = population.individuals if hasattr(population, 'individuals') else population
-		
-		for individual in inds:
-			# Ambil hanya solusi Rank 0 (Non-Dominated)
-			if individual.frontRank == 0:
-				obj_1 = individual.objectives['power_consumption']
-				obj_2 = individual.objectives['net_communication']
-				front_data.append([obj_1, obj_2])
-		
-		# Konversi ke Numpy Array
-		front_arr = np.array(front_data) if front_data else np.empty((0, 2))
+		if isinstance(population, ParetoArchive):
+			# Archive sudah non-dominated dan feasible
+			front_arr = population.toArray()
+		else:
+			front_data = []
+			
+			# Handle jika population adalah object wrapper atau list
+			inds = population.individuals if hasattr(population, 'individuals') else population
+			
+			for individual in inds:
+				# Ambil hanya solusi Rank 0 (Non-Dominated)
+				if individual.frontRank == 0:
+					obj_1 = individual.objectives['power_consumption']
+					obj_2 = individual.objectives['net_communication']
+					front_data.append([obj_1, obj_2])
+			
+			# Konversi ke Numpy Array
+			front_arr = np.array(front_data) if front_data else np.empty((0, 2))
 		
-		# 1. Simpan ke Memory (RAM)
+		# 1. Simpan ke Memory (RAM) & update reference front skenario ini
 		self.results[algo_name][run_key] = front_arr
+		self.reference.add(self._scenarioOf(run_key), front_arr)
 
 		# 2. Simpan ke File (Drive) - Agar aman jika crash
+		if self.store is not None:
+			scenario, run_id = run_key.rsplit('_r', 1)
+			self.store.append(scenario, algo_name, int(run_id), front_arr)
+
 		if save_path:
 			os.makedirs(os.path.dirname(save_path), exist_ok=True)
 			df = pd.DataFrame(front_arr, columns=['Power', 'Net'])
@@ -85,6 +124,7 @@ class ExperimentAnalyzer:
 						df = pd.read_csv(fpath)
 						if not df.empty:
 							self.results[algo][run_key] = df[['Power', 'Net']].values
+							self.reference.add(scenario_name, self.results[algo][run_key])
 							loaded_count += 1
 			except Exception as e:
 				print(f"   [Warn] Failed to load {fname}: {e}")
@@ -92,64 +132,128 @@ class ExperimentAnalyzer:
 		if loaded_count > 0:
 			print(f"[Analyzer] Successfully reloaded {loaded_count} past runs from Drive.")
 
-	def loadPamiloReference(self, filepath):
+	def loadResultsFromStore(self, scenario=None):
+		"""Memuat front dari ResultStore (opsional hanya satu skenario) ke Memory."""
+		if self.store is None:
+			raise ValueError("No result store configured: pass one to ExperimentAnalyzer(store) or use loadResultsFromDirectory")
+		loaded_count = 0
+		for (scen_name, algo, run_id), front in self.store.load(scenario).items():
+			if algo not in self.results or len(front) == 0:
+				continue
+			run_key = f"{scen_name}_r{run_id}"
+			self.results[algo][run_key] = front
+			self.reference.add(scen_name, front)
+			loaded_count += 1
+		
+		if loaded_count > 0:
+			print(f"[Analyzer] Loaded {loaded_count} runs from result store.")
+
+	def loadPamiloReference(self, filepath, scenario=None):
+		"""Memuat front PaMILO. Skenario diambil dari nama file (<scenario>_sol.json) jika tidak diberikan."""
+		if scenario is None:
+			scenario = os.path.basename(filepath).replace("_sol.json", "")
 		try:
 			with open(filepath, 'r') as f:
 				data = json.load(f)
+			solutions = self.pamilo_solutions.setdefault(scenario, [])
 			if "solutions" in data:
 				for sol in data["solutions"]:
 					vals = sol.get("values", [])
 					if len(vals) >= 2:
-						self.pamilo_solutions.append([vals[0], vals[1]])
+						solutions.append([vals[0], vals[1]])
+			self.reference.add(scenario, solutions)
 			print(f"[Analyzer] Loaded PaMILO reference: {filepath}")
 		except Exception as e:
 			print(f"[Analyzer] Error loading PaMILO: {e}")
 
+	def addExactReference(self, problem, scenario, time_limit=None):
+		"""
+		Hitung front eksak dengan ExactParetoSolver (tanpa Gurobi/PaMILO, instance ~20 VM)
+		dan gabungkan ke reference front skenario. Return (front, optimal).
+		"""
+		solver = ExactParetoSolver(problem, time_limit=time_limit)
+		front = solver.solve()
+		self.exact_solutions[scenario] = front
+		self.reference.add(scenario, front)
+		status = "optimal" if solver.optimal else "time limit, partial"
+		print(f"[Analyzer] Exact reference for {scenario}: {len(front)} points ({status}, {solver.nodes} nodes)")
+		return front, solver.optimal
+
 	def buildGlobalReferenceFront(self):
-		all_solutions = []
+		"""Bangun ulang reference front semua skenario dari seluruh hasil di memori."""
+		self.reference = ReferenceFrontBuilder()
 		
 		# Gabung dari Memory (NSGA)
 		for algo in self.results:
-			for run_key in self.results[algo]:
-				if len(self.results[algo][run_key]) > 0:
-					all_solutions.extend(self.results[algo][run_key])
+			for run_key, front in self.results[algo].items():
+				self.reference.add(self._scenarioOf(run_key), front)
 		
 		# Gabung PaMILO
-		if self.pamilo_solutions:
-			all_solutions.extend(self.pamilo_solutions)
-			
-		all_solutions = np.array(all_solutions)
-		if len(all_solutions) == 0: return
+		for scenario, solutions in self.pamilo_solutions.items():
+			self.reference.add(scenario, solutions)
 
-		self.min_objectives = np.min(all_solutions, axis=0)
-		self.max_objectives = np.max(all_solutions, axis=0)
-		
-		# Filter Non-Dominated (Pareto)
-		is_dominated = np.zeros(len(all_solutions), dtype=bool)
-		for i in range(len(all_solutions)):
-			for j in range(len(all_solutions)):
-				if i == j: continue
-				if all(all_solutions[j] <= all_solutions[i]) and any(all_solutions[j] < all_solutions[i]):
-					is_dominated[i] = True
-					break
-		
-		self.reference_front = all_solutions[~is_dominated]
-		# Sort agar rapi
-		self.reference_front = self.reference_front[np.argsort(self.reference_front[:, 0])]
-
-	def normalize(self, front):
-		if self.min_objectives is None: self.buildGlobalReferenceFront()
-		range_vals = self.max_objectives - self.min_objectives
-		range_vals[range_vals == 0] = 1.0
-		return (front - self.min_objectives) / range_vals
-
-	def computeMetrics(self):
-		if self.reference_front is None: self.buildGlobalReferenceFront()
-		
-		norm_ref = self.normalize(self.reference_front)
+		# Gabung front eksak
+		for scenario, front in self.exact_solutions.items():
+			self.reference.add(scenario, front)
+
+	def normalize(self, front, scenario):
+		if scenario not in self.reference: self.buildGlobalReferenceFront()
+		return self.reference.normalize(scenario, front)
+
+	def loadConvergenceCurve(self, trace_path, scenario, hv_ref_point=(1.1, 1.1)):
+		"""
+		Kurva anytime dari rekaman NSGA2.enableTrace: HV (ternormalisasi dengan bounds
+		skenario yang sama dengan computeMetrics) terhadap jumlah evaluasi.
+		"""
+		if scenario not in self.reference: self.buildGlobalReferenceFront()
+		rows = []
+		for generation, evaluations, front in ConvergenceTrace.load(trace_path):
+			hv = 0.0
+			if len(front) > 0:
+				hv = PerformanceMetrics.calculate_hypervolume(self.normalize(front, scenario), np.asarray(hv_ref_point))
+			rows.append({'generation': generation, 'evaluations': evaluations, 'front_size': len(front), 'hv': hv})
+		return pd.DataFrame(rows)
+
+	@staticmethod
+	def _frontHash(front):
+		arr = np.ascontiguousarray(front, dtype=float)
+		return hashlib.sha1(str(arr.shape).encode() + arr.tobytes()).hexdigest()
+
+	def _loadMetricCache(self, cache_dir, fingerprint):
+		if fingerprint in self.metric_cache:
+			return self.metric_cache[fingerprint]
+		entries = {}
+		if cache_dir:
+			path = os.path.join(cache_dir, f"metrics_{fingerprint}.json")
+			if os.path.exists(path):
+				try:
+					with open(path, 'r') as f:
+						entries = json.load(f)
+				except Exception as e:
+					print(f"   [Warn] Ignoring corrupt metric cache {path}: {e}")
+		self.metric_cache[fingerprint] = entries
+		return entries
+
+	def _saveMetricCache(self, cache_dir, fingerprint):
+		os.makedirs(cache_dir, exist_ok=True)
+		path = os.path.join(cache_dir, f"metrics_{fingerprint}.json")
+		# Tulis ke file sementara lalu rename agar atomik
+		tmp_path = path + ".tmp"
+		with open(tmp_path, 'w') as f:
+			json.dump(self.metric_cache[fingerprint], f)
+		os.replace(tmp_path, path)
+
+	def computeMetrics(self, workers=None, cache_dir=None):
+		"""
+		Menghitung metrik setiap run terhadap reference front skenarionya.
+		Hasil di-cache per (hash isi front, fingerprint reference front), di memori dan
+		(opsional) di cache_dir, sehingga hanya run baru / reference yang berubah yang dihitung.
+		workers > 1: run yang belum ada di cache dihitung paralel (satu job per run).
+		"""
 		hv_ref_point = np.array([1.1, 1.1])
 		
 		final_stats = {'Classic': [], 'Hybrid': []}
+		pending = []
 		
 		for algo in ['Classic', 'Hybrid']:
 			# Sort keys agar urutan run rapi (0, 1, 2...)
@@ -159,15 +263,41 @@ class ExperimentAnalyzer:
 				raw_front = self.results[algo][run_key]
 				if len(raw_front) == 0: continue
 				
-				norm_front = self.normalize(raw_front)
-				
-				metrics = {
-					'run_key': run_key,
-					'spacing': PerformanceMetrics.calculate_spacing(norm_front),
-					'hv': PerformanceMetrics.calculate_hypervolume(norm_front, hv_ref_point),
-					'igd_plus': PerformanceMetrics.calculate_igd_plus(norm_front, norm_ref),
-					'gd_plus': PerformanceMetrics.calculate_gd_plus(norm_front, norm_ref)
-				}
+				scenario = self._scenarioOf(run_key)
+				if scenario not in self.reference: self.buildGlobalReferenceFront()
+				fingerprint = self.reference.fingerprint(scenario)
+				front_hash = self._frontHash(raw_front)
+
+				metrics = {'run_key': run_key}
 				final_stats[algo].append(metrics)
+
+				cached = self._loadMetricCache(cache_dir, fingerprint).get(front_hash)
+				if cached is not None:
+					metrics.update(cached)
+					continue
+
+				if fingerprint not in self.norm_ref_cache:
+					self.norm_ref_cache[fingerprint] = self.normalize(self.reference.getFront(scenario), scenario)
+				norm_front = self.normalize(raw_front, scenario)
+				pending.append((metrics, fingerprint, front_hash, norm_front))
+
+		if pending:
+			jobs = [(norm_front, self.norm_ref_cache[fingerprint], hv_ref_point)
+					for _, fingerprint, _, norm_front in pending]
+			if workers and workers > 1 and len(jobs) > 1:
+				with ProcessPoolExecutor(workers) as pool:
+					computed = list(pool.map(_compute_run_metrics, *zip(*jobs)))
+			else:
+				computed = [_compute_run_metrics(*job) for job in jobs]
+
+			for (metrics, fingerprint, front_hash, _), values in zip(pending, computed):
+				metrics.update(values)
+				self.metric_cache[fingerprint][front_hash] = values
+
+			if cache_dir:
+				for fingerprint in {fingerprint for _, fingerprint, _, _ in pending}:
+					self._saveMetricCache(cache_dir, fingerprint)
+			print(f"[Analyzer] Computed metrics for {len(pending)} runs "
+				  f"({sum(len(v) for v in final_stats.values()) - len(pending)} from cache).")
 				
-		return final_stats
\ No newline at end of file
+		return final_stats
@@ -0,0 +1,202 @@
+import bisect
+import numpy as np
+
+class Hypervolume:
+	"""
+	Exact hypervolume (minimization) for normalized fronts.
+	2 objectives: vectorized sweep; >= 3 objectives: WFG (While et al., 2012).
+	"""
+
+	@staticmethod
+	def _filter_ref(front, ref_point):
+		front = np.asarray(front, dtype=float)
+		if len(front) == 0:
+			return front.reshape(0, len(ref_point))
+		# Solusi yang melebihi reference point tidak berkontribusi
+		return front[np.all(front <= ref_point, axis=1)]
+
+	@staticmethod
+	def calculate(front, ref_point):
+		ref_point = np.asarray(ref_point, dtype=float)
+		points = Hypervolume._filter_ref(front, ref_point)
+		if len(points) == 0:
+			return 0.0
+		if points.shape[1] == 2:
+			return Hypervolume._sweep_2d(points, ref_point)
+		return Hypervolume._wfg(Hypervolume._non_dominated(points), ref_point)
+
+	@staticmethod
+	def calculate_2d(front, ref_point):
+		ref_point = np.asarray(ref_point, dtype=float)
+		points = Hypervolume._filter_ref(front, ref_point)
+		if len(points) == 0:
+			return 0.0
+		return Hypervolume._sweep_2d(points, ref_point)
+
+	@staticmethod
+	def _sweep_2d(points, ref_point):
+		# Urutkan berdasarkan objektif pertama; tinggi tiap strip = y terkecil sejauh ini
+		# (titik yang didominasi otomatis tidak menambah luas)
+		order = np.lexsort((points[:, 1], points[:, 0]))
+		xs = points[order, 0]
+		ys = np.minimum.accumulate(points[order, 1])
+
+		widths = np.append(xs[1:], ref_point[0]) - xs
+		heights = ref_point[1] - ys
+		return float(np.sum(widths * heights))
+
+	@staticmethod
+	def contributions(front, ref_point):
+		"""
+		Kontribusi eksklusif setiap titik: HV(front) - HV(front tanpa titik tsb).
+		Titik di luar ref point, titik yang didominasi dan duplikat berkontribusi 0.
+		"""
+		front = np.asarray(front, dtype=float)
+		ref_point = np.asarray(ref_point, dtype=float)
+		contrib = np.zeros(len(front))
+		if len(front) == 0:
+			return contrib
+
+		inside = np.flatnonzero(np.all(front <= ref_point, axis=1))
+		if len(inside) == 0:
+			return contrib
+		if front.shape[1] != 2:
+			total = Hypervolume.calculate(front, ref_point)
+			for idx in inside:
+				contrib[idx] = total - Hypervolume.calculate(np.delete(front, idx, axis=0), ref_point)
+			return contrib
+
+		points = front[inside]
+		order = np.lexsort((points[:, 1], points[:, 0]))
+		sorted_points = points[order]
+
+		# Titik staircase (non-dominated, y turun tegas) yang punya kontribusi
+		prev_min = np.empty(len(sorted_points))
+		prev_min[0] = np.inf
+		prev_min[1:] = np.minimum.accumulate(sorted_points[:-1, 1])
+		is_nd = sorted_points[:, 1] < prev_min
+
+		stair = sorted_points[is_nd]
+		next_x = np.append(stair[1:, 0], ref_point[0])
+		prev_y = np.insert(stair[:-1, 1], 0, ref_point[1])
+		stair_contrib = (next_x - stair[:, 0]) * (prev_y - stair[:, 1])
+
+		# Kotak eksklusif titik i hanya bisa ditutup oleh titik yang didominasi i (termasuk duplikat)
+		rest = sorted_points[~is_nd]
+		if len(rest) > 0:
+			for i in range(len(stair)):
+				covered = rest[np.all(rest >= stair[i], axis=1)]
+				if len(covered) > 0:
+					stair_contrib[i] -= Hypervolume.calculate_2d(covered, (next_x[i], prev_y[i]))
+
+		sorted_contrib = np.zeros(len(sorted_points))
+		sorted_contrib[is_nd] = stair_contrib
+		contrib[inside[order]] = sorted_contrib
+		return contrib
+
+	@staticmethod
+	def _non_dominated(points):
+		dominated = np.zeros(len(points), dtype=bool)
+		for i in range(len(points)):
+			if dominated[i]:
+				continue
+			weakly_better = np.all(points <= points[i], axis=1) & np.any(points < points[i], axis=1)
+			dominated[i] = np.any(weakly_better)
+		# Duplikat cukup disimpan sekali
+		return np.unique(points[~dominated], axis=0)
+
+	@staticmethod
+	def _wfg(points, ref_point):
+		"""WFG: jumlah kontribusi eksklusif, titik diurutkan agar limit set kecil."""
+		if len(points) == 0:
+			return 0.0
+		if points.shape[1] == 2:
+			return Hypervolume._sweep_2d(points, ref_point)
+
+		points = points[np.argsort(points[:, -1])[::-1]]
+		volume = 0.0
+		for k in range(len(points)):
+			point = points[k]
+			inclusive = float(np.prod(ref_point - point))
+			# Limit set: titik setelah k "dipersempit" ke kotak milik point
+			limited = np.maximum(points[k + 1:], point)
+			if len(limited) > 0:
+				limited = Hypervolume._non_dominated(limited)
+				inclusive -= Hypervolume._wfg(limited, ref_point)
+			volume += inclusive
+		return volume
+
+class IncrementalHypervolume2D:
+	"""
+	Hypervolume sebuah front 2 objektif yang di-update saat insert/remove.
+	Front disimpan sebagai staircase terurut (x naik, y turun) sehingga satu update
+	hanya mengubah strip di sekitar titik tsb: O(log n) + jumlah titik yang tergusur.
+	Titik yang didominasi (atau duplikat) ditolak oleh insert.
+	"""
+	def __init__(self, ref_point, front=None):
+		self.ref_point = np.asarray(ref_point, dtype=float)
+		self.xs = []
+		self.ys = []
+		self.volume = 0.0
+		for point in (front if front is not None else []):
+			self.insert(point)
+
+	def __len__(self):
+		return len(self.xs)
+
+	def _strip(self, idx):
+		# Luas strip milik titik idx: (x berikutnya - x) * (ref_y - y)
+		next_x = self.xs[idx + 1] if idx + 1 < len(self.xs) else self.ref_point[0]
+		return (next_x - self.xs[idx]) * (self.ref_point[1] - self.ys[idx])
+
+	def isDominated(self, point):
+		idx = bisect.bisect_right(self.xs, point[0])
+		return idx > 0 and self.ys[idx - 1] <= point[1]
+
+	def contribution(self, point):
+		"""Kontribusi eksklusif titik yang sudah ada di front."""
+		idx = bisect.bisect_left(self.xs, point[0])
+		next_x = self.xs[idx + 1] if idx + 1 < len(self.xs) else self.ref_point[0]
+		prev_y = self.ys[idx - 1] if idx > 0 else self.ref_point[1]
+		return (next_x - self.xs[idx]) * (prev_y - self.ys[idx])
+
+	def insert(self, point):
+		"""Tambah titik non-dominated. Return True jika front berubah."""
+		x, y = float(point[0]), float(point[1])
+		if x > self.ref_point[0] or y > self.ref_point[1] or self.isDominated((x, y)):
+			return False
+
+		start = bisect.bisect_left(self.xs, x)
+		# Titik yang didominasi berurutan mulai dari start selama y >= y baru
+		end = start
+		while end < len(self.xs) and self.ys[end] >= y:
+			end += 1
+
+		first = max(start - 1, 0)
+		before = sum(self._strip(i) for i in range(first, end))
+		self.xs[start:end] = [x]
+		self.ys[start:end] = [y]
+		after = sum(self._strip(i) for i in range(first, start + 1))
+
+		self.volume += after - before
+		return True
+
+	def remove(self, point):
+		"""Hapus titik dari front. Return True jika titik ditemukan."""
+		idx = bisect.bisect_left(self.xs, point[0])
+		if idx >= len(self.xs) or self.xs[idx] != point[0] or self.ys[idx] != point[1]:
+			return False
+
+		first = max(idx - 1, 0)
+		before = sum(self._strip(i) for i in range(first, idx + 1))
+		del self.xs[idx]
+		del self.ys[idx]
+		after = sum(self._strip(i) for i in range(first, idx)) if idx > 0 else 0.0
+
+		self.volume += after - before
+		return True
+
+	def toArray(self):
+		if not self.xs:
+			return np.empty((0, 2))
+		return np.column_stack((self.xs, self.ys))
@@ -8,14 +8,15 @@ class Individual(ABC):
 		# NSGA attributes
 		self.frontRank: int = -1
 		self.crowdingDistance: float = float('nan')
-		self.dominationCount: int = -1
-		self.dominatedSolutions: List[Individual] = []
 
 		# Optimization attributes
 		self.objectives = {
 			'power_consumption': 0,
 			'net_communication': 0,
 		}
+		# Objektif ketiga (opsional) untuk mode online: jumlah VM yang pindah dari penempatan sebelumnya
+		if getattr(problem, 'previous_placement', None) is not None:
+			self.objectives['migrations'] = 0
 		self.constraintViolations = {
 			'cpu': np.zeros(problem.N_P),
 			'mem': np.zeros(problem.N_P),
@@ -23,6 +24,9 @@ class Individual(ABC):
 		}
 		self.totalViolation: float = 0.0
 		self.isConstraintViolated: bool = False
+		# Total per jenis constraint & server yang melanggar, dijaga inkremental oleh delta update
+		self.violationTotals = {'cpu': 0.0, 'mem': 0.0, 'net': 0.0}
+		self.violatingServers = set()
 
 		# Solution representation
 		self.chromosome_list: List[int] = []
@@ -60,16 +64,43 @@ class Individual(ABC):
 
 		self.calculateObjective_Power()
 		self.calculateObjective_Net()
+		if 'migrations' in self.objectives:
+			self.calculateObjective_Migration()
 
+		self._rebuildViolationIndex()
 		self.updateConstraintStatus()
 
 	def updateConstraintStatus(self):
-		"""Mengupdate status boolean isConstraintViolated."""
-		self.totalViolation = 0
-		for _, violation in self.constraintViolations.items():
-			self.totalViolation += np.sum(violation)
-		
-		self.isConstraintViolated = self.totalViolation > 0
+		"""
+		Mengupdate totalViolation & isConstraintViolated dari total inkremental (O(1)).
+		Feasibility ditentukan dari himpunan server yang melanggar (eksak), bukan dari
+		total float yang bisa menyisakan galat pembulatan.
+		"""
+		if self.violatingServers:
+			self.totalViolation = sum(self.violationTotals.values())
+			self.isConstraintViolated = True
+		else:
+			for key in self.violationTotals:
+				self.violationTotals[key] = 0.0
+			self.totalViolation = 0.0
+			self.isConstraintViolated = False
+
+	def _rebuildViolationIndex(self):
+		"""Hitung ulang total & server yang melanggar dari array violation (setelah evaluasi penuh)."""
+		for key, violation in self.constraintViolations.items():
+			self.violationTotals[key] = float(np.sum(violation))
+		violating = (self.constraintViolations['cpu'] > 0) | (self.constraintViolations['mem'] > 0) | (self.constraintViolations['net'] > 0)
+		self.violatingServers = set(np.flatnonzero(violating).tolist())
+
+	def _setViolation(self, key, server_idx, value):
+		"""Set violation satu server & jaga total serta himpunan server yang melanggar."""
+		violations = self.constraintViolations[key]
+		self.violationTotals[key] += value - violations[server_idx]
+		violations[server_idx] = value
+		if value > 0:
+			self.violatingServers.add(int(server_idx))
+		elif server_idx in self.violatingServers and not any(self.constraintViolations[k][server_idx] > 0 for k in self.constraintViolations):
+			self.violatingServers.discard(server_idx)
 
 	def calculateConstraint_CPU_Mem(self):
 		"""
@@ -147,6 +178,20 @@ class Individual(ABC):
 
 		self.objectives["net_communication"] = t_sum_1 + t_sum_2
 
+	def calculateObjective_Migration(self):
+		"""Jumlah VM lama yang servernya berbeda dari problem.previous_placement (VM baru = -1 tidak dihitung)."""
+		previous = np.asarray(self.problem.previous_placement)
+		chrom_arr = np.asarray(self.chromosome_list)
+		self.objectives["migrations"] = int(np.count_nonzero((previous >= 0) & (chrom_arr != previous)))
+
+	def deltaUpdate_Migration(self, vm_idx, src_server_idx, dst_server_idx):
+		if 'migrations' not in self.objectives:
+			return
+		previous = self.problem.previous_placement[vm_idx]
+		if previous < 0:
+			return
+		self.objectives["migrations"] += int(src_server_idx == previous) - int(dst_server_idx == previous)
+
 	def _get_power_for_server(self, server_idx):
 		"""Helper menghitung power satu server."""
 		cpu_usage = self.total_cpu_per_server[server_idx]
@@ -180,10 +225,9 @@ class Individual(ABC):
 		self.total_mem_per_server[dst_server_idx] += v_mem_i
 
 		# Update Constraint Violation (Hanya untuk 2 server terkait)
-		self.constraintViolations["cpu"][src_server_idx] = np.maximum(0, self.total_cpu_per_server[src_server_idx] - self.problem.p_cpu[src_server_idx])
-		self.constraintViolations["cpu"][dst_server_idx] = np.maximum(0, self.total_cpu_per_server[dst_server_idx] - self.problem.p_cpu[dst_server_idx])
-		self.constraintViolations["mem"][src_server_idx] = np.maximum(0, self.total_mem_per_server[src_server_idx] - self.problem.p_mem[src_server_idx])
-		self.constraintViolations["mem"][dst_server_idx] = np.maximum(0, self.total_mem_per_server[dst_server_idx] - self.problem.p_mem[dst_server_idx])
+		for server_idx in (src_server_idx, dst_server_idx):
+			self._setViolation("cpu", server_idx, max(0.0, self.total_cpu_per_server[server_idx] - self.problem.p_cpu[server_idx]))
+			self._setViolation("mem", server_idx, max(0.0, self.total_mem_per_server[server_idx] - self.problem.p_mem[server_idx]))
 		
 		# Hitung Power Baru
 		pc_src_after = self._get_power_for_server(src_server_idx)
@@ -193,6 +237,45 @@ class Individual(ABC):
 		power_delta = (pc_src_after + pc_dst_after) - (pc_src_before + pc_dst_before)
 		self.objectives["power_consumption"] += power_delta
 
+	def deltaUpdate_Net(self, vm_idx, src_server_idx, dst_server_idx):
+		"""
+		Update inkremental beban net, constraint net, dan objektif net untuk satu VM yang
+		pindah dari src ke dst, O(N_V). Dipanggil sebelum kromosom diubah (VM masih di src).
+		Hanya beban server src & dst yang berubah: trafik VM ke peer di src menjadi lintas
+		server, trafik ke peer di dst menjadi lokal.
+		"""
+		problem = self.problem
+		chrom_arr = np.asarray(self.chromosome_list)
+		row = problem.T_matrix[vm_idx]
+		column = problem.T_matrix[:, vm_idx]
+
+		on_src = chrom_arr == src_server_idx
+		on_src[vm_idx] = False
+		on_dst = chrom_arr == dst_server_idx
+
+		# Beban per VM: peer di src bertambah, peer di dst berkurang
+		v_net_old = self.v_net_per_vm[vm_idx]
+		v_net_new = problem.e_vector[vm_idx] + np.sum(row) - row[vm_idx] - np.sum(row[on_dst])
+		self.v_net_per_vm[on_src] += column[on_src]
+		self.v_net_per_vm[on_dst] -= column[on_dst]
+		self.v_net_per_vm[vm_idx] = v_net_new
+
+		self.total_net_per_server[src_server_idx] += np.sum(column[on_src]) - v_net_old
+		self.total_net_per_server[dst_server_idx] += v_net_new - np.sum(column[on_dst])
+		for server_idx in (src_server_idx, dst_server_idx):
+			self._setViolation("net", server_idx, max(0.0, self.total_net_per_server[server_idx] - problem.p_net[server_idx]))
+
+		# Objektif: 0.5 * sum(T * C) -> hanya pasangan yang melibatkan VM ini yang berubah
+		cost_diff = problem.C_matrix[dst_server_idx, chrom_arr] - problem.C_matrix[src_server_idx, chrom_arr]
+		cost_diff[vm_idx] = 0.0
+		t_delta = 0.5 * np.dot(row + column, cost_diff)
+		e_delta = problem.e_vector[vm_idx] * (problem.g_vector[dst_server_idx] - problem.g_vector[src_server_idx])
+		self.objectives["net_communication"] += t_delta + e_delta
+
+	def canonicalKey(self):
+		"""Key hashable untuk deteksi duplikat: dua individu dengan key sama = penempatan identik."""
+		return tuple(self.chromosome_list)
+
 	@abstractmethod
 	def getChromosome(self):
 		pass
@@ -23,6 +23,8 @@ class IndividualClassic(Individual):
 			return
 
 		self.deltaUpdate_CPU_Mem_Power(vm_idx, old_server_idx, new_server_idx)
+		self.deltaUpdate_Net(vm_idx, old_server_idx, new_server_idx)
+		self.deltaUpdate_Migration(vm_idx, old_server_idx, new_server_idx)
 
 		self.chromosome_list[vm_idx] = new_server_idx
 		self.server_map[old_server_idx].remove(vm_idx)
@@ -30,7 +32,4 @@ class IndividualClassic(Individual):
 			self.server_map[new_server_idx] = []
 		self.server_map[new_server_idx].append(vm_idx)
 
-		self.calculateConstraint_Net()
-		self.calculateObjective_Net()
-
 		self.updateConstraintStatus()						
\ No newline at end of file
@@ -10,6 +10,10 @@ class IndividualHybrid(Individual):
 	def getChromosome(self):
 		return self.server_map
 
+	def canonicalKey(self):
+		# Urutan VM di dalam list server_map tidak bermakna: key dibentuk dari grouping (server -> himpunan VM)
+		return frozenset((server_idx, frozenset(vm_list)) for server_idx, vm_list in self.server_map.items() if vm_list)
+
 	def syncRepresentations(self):
 		self.chromosome_list = [0] * self.problem.N_V
 		for server_idx, vm_list in self.server_map.items():
@@ -23,6 +27,8 @@ class IndividualHybrid(Individual):
 			return
 
 		self.deltaUpdate_CPU_Mem_Power(vm_idx, old_server_idx, new_server_idx)
+		self.deltaUpdate_Net(vm_idx, old_server_idx, new_server_idx)
+		self.deltaUpdate_Migration(vm_idx, old_server_idx, new_server_idx)
 		
 		self.server_map[old_server_idx].remove(vm_idx)
 		if new_server_idx not in self.server_map:
@@ -33,7 +39,4 @@ class IndividualHybrid(Individual):
 
 		self.vm_to_server_map[vm_idx] = new_server_idx
 		
-		self.calculateConstraint_Net()
-		self.calculateObjective_Net()
-		
 		self.updateConstraintStatus()
\ No newline at end of file
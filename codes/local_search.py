@@ -0,0 +1,213 @@
+import random
+import numpy as np
+
+class LocalSearch:
+	"""
+	Local search memetic dengan evaluasi delta untuk offspring NSGA-II.
+
+	Dua jenis move:
+	  - konsolidasi: kosongkan server aktif dengan utilisasi terendah, semua VM-nya
+	    dipindah ke server aktif lain (compound move, dievaluasi sebagai satu langkah)
+	  - co-location: pindahkan VM ke server peer trafik terbesarnya yang berada di server lain
+
+	Kandidat move dievaluasi di state scratch (assignment + beban cpu/mem/net per server)
+	dalam O(N_V) per VM tanpa evaluasi penuh. Move hanya diterima jika individu tetap
+	feasible dan Pareto-improving (tidak ada objektif yang memburuk, minimal satu membaik);
+	move yang diterima baru diterapkan ke individu lewat evaluateDelta.
+	Jika objektif migrasi aktif (mode online), jumlah migrasi juga tidak boleh bertambah.
+	Individu yang infeasible dilewati (itu tugas repair).
+	"""
+	def __init__(self, problem, maxMoves=10, maxTrials=50, tol=1e-9):
+		self.problem = problem
+		self.maxMoves = maxMoves
+		self.maxTrials = maxTrials
+		self.tol = tol
+
+		p = problem
+		self.T = np.asarray(p.T_matrix, dtype=float)
+		# Bobot objektif net per pasangan VM: 0.5 * sum(T * C) atas matriks penuh
+		self.T_pair = 0.5 * (self.T + self.T.T)
+		self.C = np.asarray(p.C_matrix, dtype=float)
+		self.slope = (p.PC_max - p.PC_idle) / np.where(p.p_cpu > 0, p.p_cpu, 1.0)
+
+	# ==== State scratch ====
+	def _load(self, individual):
+		self.assign = np.array(individual.chromosome_list)
+		self.cpu = np.array(individual.total_cpu_per_server, dtype=float)
+		self.mem = np.array(individual.total_mem_per_server, dtype=float)
+		self.net = np.array(individual.total_net_per_server, dtype=float)
+
+	def _power(self, server_idx, cpu):
+		if cpu <= 0 or self.problem.p_cpu[server_idx] == 0:
+			return 0.0
+		return self.slope[server_idx] * cpu + self.problem.PC_idle[server_idx]
+
+	def _move(self, vm_idx, dst):
+		"""Pindahkan VM di state scratch. Return (delta power, delta net)."""
+		p = self.problem
+		src = self.assign[vm_idx]
+		v_cpu = p.v_cpu[vm_idx]
+
+		d_power = (self._power(src, self.cpu[src] - v_cpu) + self._power(dst, self.cpu[dst] + v_cpu)
+				   - self._power(src, self.cpu[src]) - self._power(dst, self.cpu[dst]))
+
+		cost_diff = self.C[dst, self.assign] - self.C[src, self.assign]
+		cost_diff[vm_idx] = 0.0
+		d_net = float(np.dot(self.T_pair[vm_idx], cost_diff)) + p.e_vector[vm_idx] * (p.g_vector[dst] - p.g_vector[src])
+
+		# Beban net: trafik VM ke peer di src menjadi lintas server, ke peer di dst menjadi lokal
+		row = self.T[vm_idx]
+		column = self.T[:, vm_idx]
+		on_src = self.assign == src
+		on_src[vm_idx] = False
+		on_dst = self.assign == dst
+		v_net_old = p.e_vector[vm_idx] + np.sum(row[~on_src]) - row[vm_idx]
+		v_net_new = p.e_vector[vm_idx] + np.sum(row[~on_dst]) - row[vm_idx]
+		self.net[src] += np.sum(column[on_src]) - v_net_old
+		self.net[dst] += v_net_new - np.sum(column[on_dst])
+
+		self.cpu[src] -= v_cpu
+		self.cpu[dst] += v_cpu
+		self.mem[src] -= p.v_mem[vm_idx]
+		self.mem[dst] += p.v_mem[vm_idx]
+		self.assign[vm_idx] = dst
+		return d_power, d_net
+
+	def _fits(self, vm_idx, dst):
+		p = self.problem
+		return (self.cpu[dst] + p.v_cpu[vm_idx] <= p.p_cpu[dst] and
+				self.mem[dst] + p.v_mem[vm_idx] <= p.p_mem[dst])
+
+	def _feasible(self, servers):
+		p = self.problem
+		servers = list(servers)
+		return bool(np.all(self.net[servers] <= p.p_net[servers]))
+
+	def _improves(self, d_power, d_net, d_migration, individual):
+		# Toleransi relatif agar galat floating point tidak dihitung sebagai perbaikan
+		tol_power = self.tol * max(1.0, abs(individual.objectives['power_consumption']))
+		tol_net = self.tol * max(1.0, abs(individual.objectives['net_communication']))
+		if d_power > tol_power or d_net > tol_net or d_migration > 0:
+			return False
+		return d_power < -tol_power or d_net < -tol_net or d_migration < 0
+
+	def _migrationDelta(self, vm_idx, src, dst):
+		previous = getattr(self.problem, 'previous_placement', None)
+		if previous is None or previous[vm_idx] < 0:
+			return 0
+		return int(src == previous[vm_idx]) - int(dst == previous[vm_idx])
+
+	def _tryMoves(self, individual, moves):
+		"""Evaluasi compound move [(vm, dst)] di scratch; terapkan ke individu jika diterima."""
+		saved = (self.assign.copy(), self.cpu.copy(), self.mem.copy(), self.net.copy())
+		d_power, d_net, d_migration = 0.0, 0.0, 0
+		touched = set()
+		applied = []
+		for vm_idx, dst in moves:
+			if not self._fits(vm_idx, dst):
+				break
+			touched.update((self.assign[vm_idx], dst))
+			applied.append((vm_idx, self.assign[vm_idx]))
+			d_migration += self._migrationDelta(vm_idx, self.assign[vm_idx], dst)
+			dp, dn = self._move(vm_idx, dst)
+			d_power += dp
+			d_net += dn
+
+		if len(applied) == len(moves) and self._feasible(touched) and self._improves(d_power, d_net, d_migration, individual):
+			for vm_idx, dst in moves:
+				individual.evaluateDelta(vm_idx, dst)
+			if not individual.isConstraintViolated:
+				return True
+			# Jaga-jaga jika batas kapasitas tepat tersentuh (galat akumulasi delta)
+			for vm_idx, src in reversed(applied):
+				individual.evaluateDelta(vm_idx, src)
+
+		self.assign, self.cpu, self.mem, self.net = saved
+		return False
+
+	# ==== Move ====
+	def _consolidationMove(self):
+		"""Kosongkan server aktif dengan utilisasi CPU terendah ke server aktif lain (best-fit net)."""
+		p = self.problem
+		active = np.flatnonzero(np.bincount(self.assign, minlength=p.N_P) > 0)
+		if len(active) < 2:
+			return None
+		util = self.cpu[active] / np.where(p.p_cpu[active] > 0, p.p_cpu[active], 1.0)
+		# Sedikit acak agar server yang gagal dikosongkan tidak dicoba terus
+		candidates = active[np.argsort(util + np.random.random(len(active)) * 0.05)]
+		src = candidates[0]
+		targets = [s for s in active if s != src]
+
+		vms = np.flatnonzero(self.assign == src)
+		vms = vms[np.argsort(-p.v_cpu[vms])]
+
+		# Rencana dibuat di scratch agar VM berikutnya melihat beban VM sebelumnya
+		saved = (self.assign.copy(), self.cpu.copy(), self.mem.copy(), self.net.copy())
+		moves = []
+		for vm_idx in vms:
+			fitting = [s for s in targets if self._fits(vm_idx, s)]
+			if not fitting:
+				moves = None
+				break
+			cost = self.T_pair[vm_idx] @ self.C[np.ix_(self.assign, fitting)]
+			cost += p.e_vector[vm_idx] * p.g_vector[fitting]
+			dst = fitting[int(np.argmin(cost))]
+			moves.append((vm_idx, dst))
+			self._move(vm_idx, dst)
+		self.assign, self.cpu, self.mem, self.net = saved
+		return moves
+
+	def _colocationMove(self):
+		"""Pindahkan satu VM ke server peer dengan trafik lintas-server terbesar."""
+		p = self.problem
+		cross = self.T_pair * (self.assign[:, np.newaxis] != self.assign[np.newaxis, :])
+		weights = cross.sum(axis=1)
+		if not np.any(weights > 0):
+			return None
+		# Roulette atas trafik lintas server, VM dengan trafik besar lebih sering dipilih
+		vm_idx = int(np.random.choice(p.N_V, p=weights / weights.sum()))
+		peer = int(np.argmax(cross[vm_idx]))
+		return [(vm_idx, int(self.assign[peer]))]
+
+	def improve(self, individual):
+		"""Local search pada satu individu (in-place). Return jumlah move yang diterima."""
+		if individual.isConstraintViolated:
+			return 0
+		self._load(individual)
+
+		accepted = 0
+		for _ in range(self.maxTrials):
+			if accepted >= self.maxMoves:
+				break
+			if random.random() < 0.5:
+				moves = self._consolidationMove()
+			else:
+				moves = self._colocationMove()
+			if moves and self._tryMoves(individual, moves):
+				accepted += 1
+		return accepted
+
+	def colocate(self, individual, pairs):
+		"""
+		Coba pindahkan setiap vm ke server peer-nya saat ini, untuk daftar (vm, peer).
+		Aturan penerimaan sama dengan improve. Return jumlah move yang diterima.
+		"""
+		if individual.isConstraintViolated:
+			return 0
+		self._load(individual)
+
+		accepted = 0
+		for vm_idx, peer_idx in pairs:
+			dst = int(self.assign[peer_idx])
+			if dst != self.assign[vm_idx] and self._tryMoves(individual, [(vm_idx, dst)]):
+				accepted += 1
+		return accepted
+
+	def improvePopulation(self, individuals, fraction=1.0):
+		"""Terapkan local search ke subset acak (fraction) dari individu. Return (jumlah individu, move)."""
+		count = int(round(fraction * len(individuals)))
+		selected = random.sample(individuals, min(count, len(individuals)))
+		moves = 0
+		for individual in selected:
+			moves += self.improve(individual)
+		return len(selected), moves
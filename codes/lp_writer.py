@@ -0,0 +1,491 @@
+import os
+import itertools
+import tempfile
+import numpy as np
+
+# Jumlah term per baris sebelum dilanjutkan ke baris berikutnya (batas panjang baris LP)
+TERMS_PER_LINE = 8
+# Jumlah koefisien (baris, kolom, nilai) yang ditampung sebelum ditulis ke file sementara MPS
+MPS_CHUNK = 1 << 20
+
+def _fmt(value):
+	"""Angka terpendek yang round-trip (4.0 -> '4', 0.1 -> '0.1')."""
+	text = repr(float(value))
+	return text[:-2] if text.endswith('.0') else text
+
+def _linear(terms):
+	"""
+	terms: iterable (coef, var_name). Menghasilkan potongan teks ekspresi LP secara streaming,
+	misal '2 x[0,1] - y[1]', dipecah setiap TERMS_PER_LINE term.
+	"""
+	for n, (coef, name) in enumerate(terms):
+		sign = '-' if coef < 0 else '+'
+		mag = abs(coef)
+		term = name if mag == 1 else f"{_fmt(mag)} {name}"
+		if n == 0:
+			yield f"- {term}" if sign == '-' else term
+		elif n % TERMS_PER_LINE == 0:
+			yield f"\n   {sign} {term}"
+		else:
+			yield f" {sign} {term}"
+
+def _expr(terms):
+	return ''.join(_linear(terms))
+
+def _names(names):
+	"""Daftar nama variabel (section Binaries), TERMS_PER_LINE nama per baris."""
+	names = list(names)
+	return ''.join(' ' + ' '.join(names[n:n + TERMS_PER_LINE]) + "\n" for n in range(0, len(names), TERMS_PER_LINE))
+
+def _x(i, j): return f"x[{i},{j}]"
+def _y(j): return f"y[{j}]"
+def _w(i, j, k, l): return f"w[{i},{j},{k},{l}]"
+
+def _traffic_pairs(T_matrix):
+	# Upper triangle & Non-zero traffic, urutan sama dengan w_indices di lp_generator
+	rows, cols = np.nonzero(np.triu(T_matrix, k=1) > 0)
+	return list(zip(rows.tolist(), cols.tolist()))
+
+def _cost_levels(C_matrix):
+	"""
+	Dekomposisi C_matrix hierarkis (fat-tree: server 0, rack 1, pod 3, inter-pod 5) menjadi
+	level [(bobot, label grup per server), ...] sehingga
+		C[j,l] = sum(bobot_t * [label_t[j] != label_t[l]])
+	Level 0 = server itu sendiri; level t = server dengan C <= c_t (rack, pod, ...).
+	ValueError jika C_matrix tidak hierarkis (ultrametrik).
+	"""
+	C_matrix = np.asarray(C_matrix, dtype=float)
+	N_P = len(C_matrix)
+	costs = np.unique(C_matrix[~np.eye(N_P, dtype=bool)])
+	costs = costs[costs > 0]
+
+	levels = []
+	prev_cost = 0.0
+	labels = np.arange(N_P)
+	for cost in costs:
+		levels.append((cost - prev_cost, labels))
+		prev_cost = cost
+		# Grup level berikutnya: server yang saling terhubung dengan biaya <= cost
+		_, labels = np.unique(C_matrix <= cost, axis=0, return_inverse=True)
+		labels = labels.ravel()
+
+	rebuilt = np.zeros_like(C_matrix)
+	for weight, group in levels:
+		rebuilt += weight * (group[:, np.newaxis] != group[np.newaxis, :])
+	if not np.allclose(rebuilt, C_matrix):
+		raise ValueError("Compact formulation requires a hierarchical (fat-tree) C_matrix")
+	return levels
+
+def _interchangeable(C_matrix, specs, u, v):
+	"""True jika menukar server u & v tidak mengubah spesifikasi maupun C_matrix (baris & kolom)."""
+	if not np.array_equal(specs[u], specs[v]):
+		return False
+	others = np.ones(len(C_matrix), dtype=bool)
+	others[[u, v]] = False
+	return (np.array_equal(C_matrix[u, others], C_matrix[v, others]) and
+			np.array_equal(C_matrix[others, u], C_matrix[others, v]) and
+			C_matrix[u, u] == C_matrix[v, v] and C_matrix[u, v] == C_matrix[v, u])
+
+def server_equivalence_classes(problem):
+	"""
+	Kelas server yang saling dapat ditukar: spesifikasi sama (p_cpu, p_mem, p_net,
+	PC_idle, PC_max, g_vector) dan C_matrix invarian terhadap pertukaran dua anggota mana pun
+	(misal server bertipe sama di rack yang sama). Return list kelas (indeks terurut),
+	hanya kelas dengan >= 2 server.
+
+	"Pertukaran (u v) adalah automorfisme" merupakan relasi ekuivalensi, sehingga cukup
+	membandingkan setiap server dengan wakil (anggota pertama) kelas; biaya antar anggota
+	otomatis seragam dan setiap permutasi di dalam kelas mempertahankan front Pareto.
+	Berlaku untuk C_matrix apa pun, tidak harus hierarkis.
+	"""
+	C_matrix = np.asarray(problem.C_matrix)
+	specs = np.column_stack((problem.p_cpu, problem.p_mem, problem.p_net,
+							 problem.PC_idle, problem.PC_max, problem.g_vector))
+
+	classes = []
+	for j in range(problem.N_P):
+		for members in classes:
+			if _interchangeable(C_matrix, specs, members[0], j):
+				members.append(j)
+				break
+		else:
+			classes.append([j])
+	return [members for members in classes if len(members) > 1]
+
+def _write_symmetry_breaking(f, problem):
+	# Server sekelas dapat dipermutasi, jadi cukup pertimbangkan solusi yang
+	# mengaktifkan server sekelas secara berurutan: y[j_1] >= y[j_2] >= ...
+	for members in server_equivalence_classes(problem):
+		for prev, j in zip(members, members[1:]):
+			f.write(f" V9_SymBreak[{prev},{j}]: {_y(j)} - {_y(prev)} <= 0\n")
+
+def _objective_constants(problem):
+	# Define constant P_{ij} & B_{ij} (vektorisasi)
+	cap = np.where(problem.p_cpu > 0, problem.p_cpu, 1.0)
+	P_const = problem.v_cpu[:, np.newaxis] * (problem.PC_max - problem.PC_idle)[np.newaxis, :] / cap[np.newaxis, :]
+	B_const = problem.e_vector[:, np.newaxis] * problem.g_vector[np.newaxis, :]
+	return P_const, B_const
+
+def _write_header_and_power(f, problem, P_const):
+	f.write("\\ Model VMP_Linearized\n")
+	f.write("\\ LP format - for model browsing. Use MPS format to capture full model detail.\n")
+
+	# ==== Objectives (urut indeks variabel; koefisien nol dilewati) ====
+	f.write("Minimize multi-objectives\n")
+	f.write(" PowerConsumption: Priority=1 Weight=1 AbsTol=1e-06 RelTol=0\n   ")
+	power_terms = [(P_const[i, j], _x(i, j)) for i in range(problem.N_V) for j in range(problem.N_P) if P_const[i, j] != 0]
+	power_terms += [(problem.PC_idle[j], _y(j)) for j in range(problem.N_P) if problem.PC_idle[j] != 0]
+	f.writelines(_linear(power_terms))
+	f.write("\n")
+
+def _write_placement_constraints(f, problem):
+	N_V, servers = problem.N_V, range(problem.N_P)
+
+	# Define constraint (V1')
+	for i in range(N_V):
+		f.write(f" V1_OneVMOneServer[{i}]: {_expr((1, _x(i, j)) for j in servers)} = 1\n")
+
+	# Define constraint (V2') & (V3')
+	for j in servers:
+		terms = [(problem.v_cpu[i], _x(i, j)) for i in range(N_V)] + [(-problem.p_cpu[j], _y(j))]
+		f.write(f" V2_CpuCapacity[{j}]: {_expr(terms)} <= 0\n")
+	for j in servers:
+		terms = [(problem.v_mem[i], _x(i, j)) for i in range(N_V)] + [(-problem.p_mem[j], _y(j))]
+		f.write(f" V3_MemCapacity[{j}]: {_expr(terms)} <= 0\n")
+
+def _write_active_server(f, problem):
+	# Define constraint (V5')
+	for i in range(problem.N_V):
+		f.write(''.join(f" V5_ActiveServer[{i},{j}]: {_x(i, j)} - {_y(j)} <= 0\n" for j in range(problem.N_P)))
+
+def _write_binaries(f, problem):
+	f.write("Binaries\n")
+	for i in range(problem.N_V):
+		f.write(_names(_x(i, j) for j in range(problem.N_P)))
+	f.write(_names(_y(j) for j in range(problem.N_P)))
+
+def stream_VMP_MOMILP_File(problem, output_filename, formulation='linearized', symmetry_breaking=False):
+	"""
+	Menulis model MOMILP VMP langsung ke file .lp (atau .mps) tanpa gurobipy.
+	Model tidak pernah dibangun di memori: setiap bagian ditulis per blok.
+	Jika output_filename berakhiran .mps, LP ditulis ke file sementara lalu dikonversi
+	dengan convert_LP_to_MPS.
+
+	formulation:
+	  'linearized' : formulasi yang sama dengan lp_generator.create_VMP_MOMILP_File
+	                 (w_{ijkl} untuk setiap pasangan VM & pasangan server)
+	  'compact'    : formulasi agregasi aliran per level topologi, lihat _write_compact
+	symmetry_breaking: tambahkan urutan aktivasi y_j di setiap kelas server identik
+	                   (lihat server_equivalence_classes); front Pareto tidak berubah.
+	"""
+	if formulation not in ('linearized', 'compact'):
+		raise ValueError(f"Unknown formulation: {formulation}")
+
+	os.makedirs(os.path.dirname(output_filename) or '.', exist_ok=True)
+	as_mps = output_filename.lower().endswith('.mps')
+	lp_filename = output_filename + '.tmp.lp' if as_mps else output_filename
+	with open(lp_filename, 'w', buffering=1 << 20) as f:
+		if formulation == 'compact':
+			_write_compact(f, problem, symmetry_breaking)
+		else:
+			_write_linearized(f, problem, symmetry_breaking)
+	if as_mps:
+		try:
+			convert_LP_to_MPS(lp_filename, output_filename)
+		finally:
+			os.remove(lp_filename)
+
+	print(f"\nThe model has been written to: {output_filename}")
+	print("Ready to be used as input for PaMILO.")
+
+def _write_linearized(f, problem, symmetry_breaking=False):
+	N_V = problem.N_V
+	p_net = problem.p_net
+	T_matrix = problem.T_matrix
+	C_matrix = problem.C_matrix
+	e_vector = problem.e_vector
+
+	P_const, B_const = _objective_constants(problem)
+	pairs = _traffic_pairs(T_matrix)
+	servers = range(problem.N_P)
+
+	def net_w_terms():
+		# Satu blok per pasangan VM: T_ik * C_jl untuk semua (j, l), hanya yang non-zero
+		for (i, k) in pairs:
+			coef = T_matrix[i, k] * C_matrix
+			for j, l in zip(*np.nonzero(coef)):
+				yield coef[j, l], _w(i, j, k, l)
+
+	_write_header_and_power(f, problem, P_const)
+	f.write(" CommunicationCost: Priority=0 Weight=1 AbsTol=1e-06 RelTol=0\n   ")
+	net_x_terms = [(B_const[i, j], _x(i, j)) for i in range(N_V) for j in servers if B_const[i, j] != 0]
+	f.writelines(_linear(itertools.chain(net_x_terms, net_w_terms())))
+	f.write("\n")
+
+	f.write("Subject To\n")
+	_write_placement_constraints(f, problem)
+
+	# Define constraint (V4'): trafik eksternal + trafik antar server yang melewati NIC server s
+	# Urutan term sama dengan bucket di lp_generator (e_vector dulu, lalu w_indices)
+	def net_cap_terms(s):
+		for i in range(N_V):
+			if e_vector[i] > 0:
+				yield e_vector[i], _x(i, s)
+		for (i, k) in pairs:
+			traffic_val = T_matrix[i, k]
+			for j in servers:
+				if j == s:
+					for l in servers:
+						if l != s:
+							yield traffic_val, _w(i, s, k, l)
+				else:
+					yield traffic_val, _w(i, j, k, s)
+		yield -p_net[s], _y(s)
+
+	has_external = bool(np.any(e_vector > 0))
+	for s in servers:
+		if has_external or (pairs and len(servers) > 1): # Hanya jika ada trafik
+			f.write(f" V4_NetCap_{s}: ")
+			f.writelines(_linear(net_cap_terms(s)))
+			f.write(" <= 0\n")
+
+	_write_active_server(f, problem)
+	if symmetry_breaking:
+		_write_symmetry_breaking(f, problem)
+
+	# Define constraint (V6'), (V7'), (V8') - satu blok tulis per pasangan VM
+	for name, row in (
+		("V6_wx", lambda i, j, k, l: f"{_w(i, j, k, l)} - {_x(i, j)} <= 0"),
+		("V7_wx", lambda i, j, k, l: f"{_w(i, j, k, l)} - {_x(k, l)} <= 0"),
+		("V8_wx", lambda i, j, k, l: f"{_w(i, j, k, l)} - {_x(i, j)} - {_x(k, l)} >= -1"),
+	):
+		for (i, k) in pairs:
+			f.write(''.join(f" {name}[{i},{j},{k},{l}]: {row(i, j, k, l)}\n" for j in servers for l in servers))
+
+	f.write("Bounds\n")
+	_write_binaries(f, problem)
+	for (i, k) in pairs:
+		for j in servers:
+			f.write(_names(_w(i, j, k, l) for l in servers))
+	f.write("End\n")
+
+def _write_compact(f, problem, symmetry_breaking=False):
+	"""
+	Formulasi agregasi aliran, ukuran O(N_V * N_P) alih-alih O(pairs * N_P^2).
+
+	C_matrix didekomposisi menjadi level topologi (server, rack, pod, ...) dengan bobot
+	(fat-tree: 1, 2, 2), lihat _cost_levels. Untuk setiap VM i dan grup g di level t,
+	variabel kontinu h_t[i,g] >= 0 menyatakan trafik i yang keluar dari grup g:
+		h_t[i,g] >= sum_k T_ik * (X_t[i,g] - X_t[k,g]),   X_t[i,g] = sum_{j in g} x[i,j]
+	Jika i di g nilai minimumnya = trafik i ke peer di luar g, selain itu 0.
+	  - Net objective: B.x + sum_t bobot_t * 0.5 * sum h_t (setiap pasangan terhitung dua kali)
+	  - V4': trafik yang melewati NIC server s = e.x_s + sum_i h_0[i,s]
+	Pada titik Pareto h selalu tight, sehingga front-nya sama dengan formulasi linearized.
+	"""
+	N_V = problem.N_V
+	N_P = problem.N_P
+	e_vector = problem.e_vector
+	servers = range(N_P)
+
+	P_const, B_const = _objective_constants(problem)
+	levels = _cost_levels(problem.C_matrix)
+
+	# Trafik per pasangan (upper triangle, sama dengan w_indices) dibuat simetris
+	T_pair = np.triu(problem.T_matrix, k=1)
+	T_sym = T_pair + T_pair.T
+	talkers = np.flatnonzero(T_sym.sum(axis=1) > 0)
+
+	def h(t, i, g): return f"h{t}[{i},{g}]"
+
+	level_groups = []
+	for weight, labels in levels:
+		groups = [np.flatnonzero(labels == g) for g in range(labels.max() + 1)]
+		level_groups.append((weight, groups))
+
+	_write_header_and_power(f, problem, P_const)
+	f.write(" CommunicationCost: Priority=0 Weight=1 AbsTol=1e-06 RelTol=0\n   ")
+	net_x_terms = [(B_const[i, j], _x(i, j)) for i in range(N_V) for j in servers if B_const[i, j] != 0]
+	net_h_terms = ((0.5 * weight, h(t, i, g))
+				   for t, (weight, groups) in enumerate(level_groups)
+				   for i in talkers for g in range(len(groups)))
+	f.writelines(_linear(itertools.chain(net_x_terms, net_h_terms)))
+	f.write("\n")
+
+	f.write("Subject To\n")
+	_write_placement_constraints(f, problem)
+
+	# Define constraint (V4'): trafik eksternal + trafik keluar server s
+	if np.any(e_vector > 0) or (len(talkers) > 0 and levels):
+		for s in servers:
+			terms = [(e_vector[i], _x(i, s)) for i in range(N_V) if e_vector[i] > 0]
+			if levels:
+				terms += [(1, h(0, i, s)) for i in talkers]
+			terms.append((-problem.p_net[s], _y(s)))
+			f.write(f" V4_NetCap_{s}: ")
+			f.writelines(_linear(terms))
+			f.write(" <= 0\n")
+
+	_write_active_server(f, problem)
+	if symmetry_breaking:
+		_write_symmetry_breaking(f, problem)
+
+	# Define constraint (V6'): egress per VM per grup di setiap level
+	for t, (weight, groups) in enumerate(level_groups):
+		for i in talkers:
+			peers = np.flatnonzero(T_sym[i])
+			out_total = T_sym[i].sum()
+			for g, members in enumerate(groups):
+				terms = [(1, h(t, i, g))]
+				terms += [(-out_total, _x(i, j)) for j in members]
+				terms += [(T_sym[i, k], _x(k, j)) for k in peers for j in members]
+				f.write(f" V6_Egress{t}[{i},{g}]: ")
+				f.writelines(_linear(terms))
+				f.write(" >= 0\n")
+
+	# h >= 0 adalah bound default format LP
+	f.write("Bounds\n")
+	_write_binaries(f, problem)
+	f.write("End\n")
+
+# ==== MPS ====
+def _read_statements(lp_file):
+	"""
+	Pecah file LP (format yang ditulis modul ini) menjadi (section, statement). Statement
+	diawali satu spasi; baris lanjutan diawali tiga spasi dan digabung ke statement sebelumnya.
+	"""
+	section, statement = None, None
+	for line in lp_file:
+		line = line.rstrip('\n')
+		if not line or line.startswith('\\'):
+			continue
+		if not line.startswith(' '):
+			if statement is not None:
+				yield section, statement
+				statement = None
+			section = line
+		elif line.startswith('   ') and statement is not None:
+			statement += ' ' + line.strip()
+		else:
+			if statement is not None:
+				yield section, statement
+			statement = line.strip()
+	if statement is not None:
+		yield section, statement
+
+def _parse_terms(text):
+	"""Kebalikan _linear: '2 x[0,1] - y[1]' -> [(2.0, 'x[0,1]'), (-1.0, 'y[1]')]."""
+	terms = []
+	sign, coef = 1.0, 1.0
+	for token in text.split():
+		if token in ('+', '-'):
+			sign = -1.0 if token == '-' else 1.0
+			continue
+		try:
+			coef = float(token)
+		except ValueError:
+			terms.append((sign * coef, token))
+			sign, coef = 1.0, 1.0
+	return terms
+
+def convert_LP_to_MPS(lp_filename, mps_filename):
+	"""
+	Konversi streaming file LP hasil stream_VMP_MOMILP_File ke MPS (free MPS, nama tanpa spasi).
+	Koefisien dikumpulkan per chunk ke file sementara (baris, kolom, nilai) lalu diurutkan
+	per kolom lewat memmap, jadi memori tidak tumbuh dengan jumlah string/term model.
+
+	Setiap objektif menjadi satu baris N (urutan sama dengan LP); atribut Priority/Weight/
+	AbsTol/RelTol ditulis sebagai komentar karena MPS standar tidak punya tempat untuknya.
+	Variabel di section Binaries ditulis di dalam marker INTORG/INTEND dengan bound BV.
+	"""
+	dtype = np.dtype([('col', np.int64), ('row', np.int64), ('val', np.float64)])
+	row_names, row_senses, rhs = [], [], {}
+	objective_notes = []
+	columns = {}
+	binaries = set()
+	count = 0
+
+	fd, triplet_path = tempfile.mkstemp(suffix='.bin', dir=os.path.dirname(os.path.abspath(mps_filename)))
+	try:
+		with os.fdopen(fd, 'wb') as spill, open(lp_filename) as lp_file:
+			chunk = []
+
+			def add_row(name, sense, terms):
+				row = len(row_names)
+				row_names.append(name)
+				row_senses.append(sense)
+				for coef, var in terms:
+					chunk.append((columns.setdefault(var, len(columns)), row, coef))
+				return row
+
+			for section, statement in _read_statements(lp_file):
+				if section.startswith('Minimize'):
+					name, rest = statement.split(':', 1)
+					# Baris atribut objektif, ekspresinya ada di baris lanjutan
+					attributes = ' '.join(t for t in rest.split() if '=' in t)
+					expression = ' '.join(t for t in rest.split() if '=' not in t)
+					objective_notes.append(f"{name} {attributes}".strip())
+					add_row(name, 'N', _parse_terms(expression))
+				elif section == 'Subject To':
+					name, rest = statement.split(':', 1)
+					tokens = rest.split()
+					sense, value = tokens[-2], float(tokens[-1])
+					row = add_row(name, {'<=': 'L', '>=': 'G', '=': 'E'}[sense], _parse_terms(' '.join(tokens[:-2])))
+					if value != 0:
+						rhs[row] = value
+				elif section == 'Binaries':
+					for var in statement.split():
+						columns.setdefault(var, len(columns))
+						binaries.add(var)
+				elif section not in ('Bounds', 'End'):
+					raise ValueError(f"Unsupported LP section: {section}")
+
+				if len(chunk) >= MPS_CHUNK:
+					np.array(chunk, dtype=dtype).tofile(spill)
+					count += len(chunk)
+					chunk.clear()
+			np.array(chunk, dtype=dtype).tofile(spill)
+			count += len(chunk)
+
+		triplets = np.memmap(triplet_path, dtype=dtype, mode='r', shape=(count,)) if count else np.empty(0, dtype=dtype)
+		# Stabil: di dalam satu kolom urutan baris tetap seperti di LP
+		order = np.argsort(triplets['col'], kind='stable')
+		_write_mps(mps_filename, row_names, row_senses, rhs, objective_notes, columns, binaries, triplets, order)
+		del triplets
+	finally:
+		os.remove(triplet_path)
+
+def _write_mps(mps_filename, row_names, row_senses, rhs, objective_notes, columns, binaries, triplets, order):
+	name_of = list(columns)
+	first_objective = row_names[row_senses.index('N')] if 'N' in row_senses else None
+
+	with open(mps_filename, 'w', buffering=1 << 20) as f:
+		f.write("NAME VMP_Linearized\n")
+		for note in objective_notes:
+			f.write(f"* Objective {note}\n")
+		f.write("OBJSENSE\n    MIN\n")
+		f.write("ROWS\n")
+		f.writelines(f" {sense} {name}\n" for name, sense in zip(row_names, row_senses))
+
+		f.write("COLUMNS\n")
+		# Batas blok setiap kolom di urutan terurut
+		bounds = np.searchsorted(triplets['col'][order], np.arange(len(name_of) + 1))
+		in_integer = False
+		marker = 0
+		for col, var in enumerate(name_of):
+			if (var in binaries) != in_integer:
+				in_integer = not in_integer
+				f.write(f" MARKER{marker} 'MARKER' '{'INTORG' if in_integer else 'INTEND'}'\n")
+				marker += 1
+			block = triplets[order[bounds[col]:bounds[col + 1]]]
+			if len(block) == 0:
+				# Kolom tanpa koefisien (hanya di Binaries) tetap harus dideklarasikan
+				f.write(f" {var} {first_objective} 0\n")
+			f.write(''.join(f" {var} {row_names[row]} {_fmt(value)}\n" for row, value in zip(block['row'].tolist(), block['val'].tolist())))
+		if in_integer:
+			f.write(f" MARKER{marker} 'MARKER' 'INTEND'\n")
+
+		f.write("RHS\n")
+		f.writelines(f" RHS {row_names[row]} {_fmt(value)}\n" for row, value in rhs.items())
+		f.write("BOUNDS\n")
+		f.writelines(f" BV BND {var}\n" for var in name_of if var in binaries)
+		f.write("ENDATA\n")
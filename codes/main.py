@@ -3,11 +3,8 @@ import sys
 import shutil
 import pandas as pd
 import numpy as np
-import time
-import subprocess
 import json
 import glob
-import gurobipy as gp
 
 # --- IMPORT MODUL DARI REPO ---
 if '/content/VMPwithNSGA2/codes' not in sys.path:
@@ -15,10 +12,13 @@ if '/content/VMPwithNSGA2/codes' not in sys.path:
 
 from problem_generator import generateProblem
 from problem import Problem
-from lp_generator import create_VMP_MOMILP_File
+from lp_writer import stream_VMP_MOMILP_File
 from experiment_analyzer import ExperimentAnalyzer
+from result_store import ResultStore
 from nsga2_classic import NSGA2Classic
 from nsga2_hybrid import NSGA2Hybrid
+from pamilo_runner import PaMILOJobQueue
+from model_cache import ModelCache
 
 # --- KONFIGURASI PATH ---
 REPO_ROOT = '/content/VMPwithNSGA2'
@@ -36,36 +36,27 @@ DRIVE_RESULTS_DIR = os.path.join(DRIVE_BASE, 'results')
 # --- SWITCH KONTROL ---
 ENABLE_PAMILO = False
 ENABLE_NSGA   = True
-
-# --- RUNNER HELPER ---
-class PaMILORunnerFixed:
-	def __init__(self, exec_path):
-		self.exec_path = exec_path
-
-	def solve(self, input_lp, output_base_arg, timeout_sec=900):
-		if not os.path.exists(self.exec_path): return False, None
-		os.makedirs(os.path.dirname(output_base_arg), exist_ok=True)
-		
-		cmd = [self.exec_path, input_lp, "-o", output_base_arg, "-t", str(os.cpu_count() or 2)]
-		print(f"   [PaMILO] Executing (Timeout {timeout_sec}s)...")
-		
-		try:
-			start = time.time()
-			subprocess.run(cmd, capture_output=True, text=True, timeout=timeout_sec)
-			elapsed = time.time() - start
-			
-			# Cek output (PaMILO menambah _sol.json)
-			expected_file = output_base_arg + "_sol.json"
-			if os.path.exists(expected_file):
-				print(f"   [PaMILO] Success ({elapsed:.1f}s). Saved to Drive.")
-				return True, expected_file
-			return False, None
-		except subprocess.TimeoutExpired:
-			print(f"   [PaMILO] Timeout reached ({timeout_sec}s).")
-			return False, None
-		except Exception as e:
-			print(f"   [PaMILO] Error: {e}")
-			return False, None
+# Formulasi LP untuk PaMILO: 'linearized' (w_ijkl, hanya layak untuk small) atau 'compact'
+LP_FORMULATION = 'linearized'
+# Tambahkan constraint symmetry-breaking untuk server identik (front tetap sama)
+LP_SYMMETRY_BREAKING = True
+# Antrian PaMILO: beberapa LP diselesaikan paralel, masing-masing dengan -t PAMILO_THREADS_PER_JOB
+PAMILO_THREADS_PER_JOB   = 2
+PAMILO_TIMEOUT_SEC       = 900  # per job (15 menit)
+PAMILO_GLOBAL_TIMEOUT_SEC = None # seluruh antrian, None = tanpa batas
+# Cache LP & solusi PaMILO berdasarkan isi Problem + opsi formulasi (bukan nama file)
+MODEL_CACHE_MAX_BYTES = 5 * 1024**3
+# Simpan archive eksternal (bukan populasi terakhir) sebagai front hasil run
+ENABLE_ARCHIVE = False
+ARCHIVE_SIZE   = 200
+# Rekam titik rank 0 setiap TRACE_EVERY generasi (kurva konvergensi)
+ENABLE_TRACE   = False
+TRACE_EVERY    = 5
+# Memetic: local search delta (konsolidasi & co-location) pada sebagian offspring tiap generasi
+ENABLE_LOCAL_SEARCH   = False
+LOCAL_SEARCH_FRACTION = 0.2
+# Eliminasi kromosom duplikat di populasi gabungan: 'drop' atau 'mutate' (None = nonaktif)
+DEDUP_MODE = None
 
 def setup_dependencies():
 	print("\n--- 🔧 Setup Dependencies ---")
@@ -80,10 +71,13 @@ def setup_dependencies():
 		print("❌ FATAL: File 'gurobi.lic' tidak ditemukan!")
 		return False
 
-	# 2. Library Path
-	import gurobipy
-	lib_path = os.path.join(os.path.dirname(gurobipy.__file__), '.libs')
-	if os.path.exists(lib_path):
+	# 2. Library Path (opsional: pamilo_cli bisa memakai library Gurobi dari gurobipy)
+	try:
+		import gurobipy
+	except ImportError:
+		gurobipy = None
+	lib_path = os.path.join(os.path.dirname(gurobipy.__file__), '.libs') if gurobipy else None
+	if lib_path and os.path.exists(lib_path):
 		os.environ['LD_LIBRARY_PATH'] = f"{lib_path}:{os.environ.get('LD_LIBRARY_PATH','')}"
 		print(f"🔧 Library Path: {lib_path}")
 
@@ -116,14 +110,25 @@ def prepare_directories():
 	os.makedirs(os.path.join(LOCAL_RESULTS_DIR, 'lp_files'), exist_ok=True)
 	os.makedirs(os.path.join(LOCAL_RESULTS_DIR, 'pamilo_sols'), exist_ok=True)
 	os.makedirs(os.path.join(LOCAL_RESULTS_DIR, 'raw_fronts'), exist_ok=True)
+	os.makedirs(os.path.join(LOCAL_RESULTS_DIR, 'store'), exist_ok=True)
 	print("✅ Drive Connected.")
 
 def run_pipeline():
 	prepare_directories()
-	if not setup_dependencies(): return
+	# Lisensi & binary hanya dibutuhkan PaMILO; NSGA-II & LP writer jalan tanpa Gurobi
+	if ENABLE_PAMILO and not setup_dependencies(): return
 	
-	pamilo = PaMILORunnerFixed(BIN_PATH)
-	analyzer = ExperimentAnalyzer()
+	pamilo = PaMILOJobQueue(BIN_PATH, threads_per_job=PAMILO_THREADS_PER_JOB,
+							global_timeout_sec=PAMILO_GLOBAL_TIMEOUT_SEC,
+							log_dir=os.path.join(LOCAL_RESULTS_DIR, 'pamilo_logs'))
+	model_cache = ModelCache(os.path.join(LOCAL_RESULTS_DIR, 'model_cache'), MODEL_CACHE_MAX_BYTES)
+	pamilo_keys = {}
+	# Semua front disimpan di satu store append-only (bukan satu CSV per run)
+	store = ResultStore(os.path.join(LOCAL_RESULTS_DIR, 'store'))
+	imported = store.importCsvTree(os.path.join(LOCAL_RESULTS_DIR, 'raw_fronts'))
+	if imported:
+		print(f"[Store] Imported {imported} legacy CSV runs.")
+	analyzer = ExperimentAnalyzer(store)
 
 	# ==========================================
 	# TAHAP 1: CEK & GENERATE DATASET
@@ -165,63 +170,89 @@ def run_pipeline():
 		problem.loadFromFile(os.path.join(LOCAL_DATASET_DIR, p_file))
 
 		# --- A. PAMILO (Check Drive First) ---
-		if ENABLE_PAMILO and 'small' in scen_name:
-			lp_path = os.path.join(LOCAL_RESULTS_DIR, "lp_files", f"{scen_name}.lp")
+		if ENABLE_PAMILO and (LP_FORMULATION == 'compact' or 'small' in scen_name):
+			lp_name = scen_name if LP_FORMULATION == 'linearized' else f"{scen_name}_{LP_FORMULATION}"
+			if LP_SYMMETRY_BREAKING: lp_name += "_sym"
+			lp_path = os.path.join(LOCAL_RESULTS_DIR, "lp_files", f"{lp_name}.lp")
 			base_out = os.path.join(LOCAL_RESULTS_DIR, "pamilo_sols", scen_name)
 			final_json = base_out + "_sol.json"
 
-			if os.path.exists(final_json):
-				print("   [PaMILO] Found in Drive. Loaded.")
+			cache_key = ModelCache.key(problem, formulation=LP_FORMULATION,
+									   symmetry_breaking=LP_SYMMETRY_BREAKING)
+
+			if model_cache.getResult(cache_key, final_json):
+				print("   [PaMILO] Found in cache. Loaded.")
 				analyzer.loadPamiloReference(final_json)
 			else:
-				if not os.path.exists(lp_path):
-					create_VMP_MOMILP_File(problem, lp_path)
-				
-				# REVISI: Timeout 900 detik (15 Menit)
-				success, path = pamilo.solve(lp_path, base_out, timeout_sec=900)
-				if success: analyzer.loadPamiloReference(path)
+				if model_cache.getModel(cache_key, lp_path):
+					print("   [PaMILO] LP model found in cache.")
+				else:
+					stream_VMP_MOMILP_File(problem, lp_path, formulation=LP_FORMULATION,
+										   symmetry_breaking=LP_SYMMETRY_BREAKING)
+					model_cache.putModel(cache_key, lp_path)
+
+				# Diselesaikan bersama job lain setelah loop skenario
+				pamilo.add(scen_name, lp_path, base_out, timeout_sec=PAMILO_TIMEOUT_SEC)
+				pamilo_keys[scen_name] = cache_key
 
 		# --- B. NSGA-II (Check Drive per Run) ---
 		if ENABLE_NSGA:
 			TOTAL_RUNS = 30
-			raw_dir = os.path.join(LOCAL_RESULTS_DIR, "raw_fronts", scen_name)
-			os.makedirs(raw_dir, exist_ok=True)
-			
 			print(f"   [NSGA] Checking {TOTAL_RUNS} runs...")
 			
 			for r in range(TOTAL_RUNS):
-				csv_c = os.path.join(raw_dir, f"Classic_r{r}.csv")
-				csv_h = os.path.join(raw_dir, f"Hybrid_r{r}.csv")
+				done_c = store.has(scen_name, 'Classic', r)
+				done_h = store.has(scen_name, 'Hybrid', r)
 				
-				if os.path.exists(csv_c) and os.path.exists(csv_h):
+				if done_c and done_h:
 					continue 
 
 				base_seed = int(''.join(filter(str.isdigit, scen_name)) or 0)
 				seed = 1000 + (base_seed * 100) + r
 				print(f"\r	 > Executing Run {r+1}/{TOTAL_RUNS}...", end="")
 
-				if not os.path.exists(csv_c):
+				if not done_c:
 					ac = NSGA2Classic(problem, 100, 100, 0.9, 0.1)
 					ac.setSeed(seed)
+					if ENABLE_ARCHIVE: ac.enableArchive(ARCHIVE_SIZE)
+					if ENABLE_LOCAL_SEARCH: ac.enableLocalSearch(LOCAL_SEARCH_FRACTION)
+					if DEDUP_MODE: ac.enableDeduplication(DEDUP_MODE)
+					if ENABLE_TRACE: ac.enableTrace(os.path.join(LOCAL_RESULTS_DIR, 'traces', scen_name, f"Classic_r{r}.npy"), TRACE_EVERY)
 					ac.run(verbose=True)
-					analyzer.addResult('Classic', f"{scen_name}_r{r}", ac.population, save_path=csv_c)
+					analyzer.addResult('Classic', f"{scen_name}_r{r}", ac.archive if ENABLE_ARCHIVE else ac.population)
 				
-				if not os.path.exists(csv_h):
+				if not done_h:
 					ah = NSGA2Hybrid(problem, 100, 100, 0.9, 0.1)
 					ah.setSeed(seed)
+					if ENABLE_ARCHIVE: ah.enableArchive(ARCHIVE_SIZE)
+					if ENABLE_LOCAL_SEARCH: ah.enableLocalSearch(LOCAL_SEARCH_FRACTION)
+					if DEDUP_MODE: ah.enableDeduplication(DEDUP_MODE)
+					if ENABLE_TRACE: ah.enableTrace(os.path.join(LOCAL_RESULTS_DIR, 'traces', scen_name, f"Hybrid_r{r}.npy"), TRACE_EVERY)
 					ah.run(verbose=True)
-					analyzer.addResult('Hybrid', f"{scen_name}_r{r}", ah.population, save_path=csv_h)
+					analyzer.addResult('Hybrid', f"{scen_name}_r{r}", ah.archive if ENABLE_ARCHIVE else ah.population)
 			print("\n	 > All runs synced to Drive.")
 
+	if ENABLE_PAMILO and pamilo.jobs:
+		print("\n--- 🧮 PaMILO Queue ---")
+		for job in pamilo.run():
+			# Hanya front lengkap yang masuk reference & cache; front parsial (timeout) bisa
+			# didominasi NSGA-II sehingga GD/IGD/HV terhadapnya menyesatkan
+			if job.status == 'success':
+				analyzer.loadPamiloReference(job.solution_path)
+				model_cache.putResult(pamilo_keys[job.name], job.solution_path)
+			elif job.partial:
+				print(f"   [PaMILO] {job.name}: partial front kept at {job.solution_path}, not used as reference")
+
 	# ==========================================
 	# TAHAP 3: METRICS (Load All from Drive)
 	# ==========================================
 	if ENABLE_NSGA:
 		print("\n--- 📊 Final Analysis ---")
-		raw_root = os.path.join(LOCAL_RESULTS_DIR, "raw_fronts")
-		analyzer.loadResultsFromDirectory(raw_root)
+		analyzer.loadResultsFromStore()
 
-		final_stats = analyzer.computeMetrics()
+		# Metrik di-cache di Drive: run lama tidak dihitung ulang selama reference front tetap
+		final_stats = analyzer.computeMetrics(workers=os.cpu_count(),
+											  cache_dir=os.path.join(LOCAL_RESULTS_DIR, 'metric_cache'))
 		
 		# Save Summary CSV
 		flat = []
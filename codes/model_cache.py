@@ -0,0 +1,120 @@
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import numpy as np
+
+class ModelCache:
+	"""
+	Content-addressed cache for generated LP models and PaMILO solutions.
+
+	The key is a hash of every Problem array plus the formulation options, so a
+	regenerated dataset (different seed, same file name) never hits a stale entry and
+	identical problems under different names share one entry.
+
+	Layout under root (both gzip-compressed, written atomically):
+	  models/<key>.lp.gz       : LP file
+	  results/<key>_sol.json.gz: solver output
+
+	Total size is bounded by max_bytes; the least recently used files are evicted
+	first (the mtime is refreshed on every hit).
+	"""
+	# Naikkan jika output lp_writer berubah agar entry lama tidak dipakai lagi
+	FORMAT_VERSION = 1
+	PROBLEM_FIELDS = ('N_V', 'N_P', 'v_cpu', 'v_mem', 'p_cpu', 'p_mem', 'p_net',
+					  'PC_max', 'PC_idle', 'T_matrix', 'C_matrix', 'e_vector', 'g_vector')
+
+	def __init__(self, root, max_bytes=2 * 1024**3):
+		self.root = root
+		self.max_bytes = max_bytes
+		self.model_dir = os.path.join(root, 'models')
+		self.result_dir = os.path.join(root, 'results')
+		os.makedirs(self.model_dir, exist_ok=True)
+		os.makedirs(self.result_dir, exist_ok=True)
+
+	@classmethod
+	def key(cls, problem, **options):
+		"""Hex digest of the Problem arrays (as float64) and the formulation options."""
+		digest = hashlib.sha256()
+		for field in cls.PROBLEM_FIELDS:
+			arr = np.ascontiguousarray(np.asarray(getattr(problem, field), dtype=np.float64))
+			digest.update(field.encode())
+			digest.update(str(arr.shape).encode())
+			digest.update(arr.tobytes())
+		options = dict(options, format_version=cls.FORMAT_VERSION)
+		digest.update(json.dumps(options, sort_keys=True).encode())
+		return digest.hexdigest()
+
+	def _modelPath(self, key):
+		return os.path.join(self.model_dir, f"{key}.lp.gz")
+
+	def _resultPath(self, key):
+		return os.path.join(self.result_dir, f"{key}_sol.json.gz")
+
+	@staticmethod
+	def _extract(cached_path, dest_path):
+		os.makedirs(os.path.dirname(dest_path) or '.', exist_ok=True)
+		tmp_path = dest_path + ".tmp"
+		with gzip.open(cached_path, 'rb') as src, open(tmp_path, 'wb') as dst:
+			shutil.copyfileobj(src, dst, 1 << 20)
+		os.replace(tmp_path, dest_path)
+		# Sentuh entry agar dianggap baru dipakai (LRU)
+		os.utime(cached_path)
+
+	def _store(self, src_path, cached_path):
+		tmp_path = cached_path + ".tmp"
+		with open(src_path, 'rb') as src, gzip.open(tmp_path, 'wb', compresslevel=6) as dst:
+			shutil.copyfileobj(src, dst, 1 << 20)
+		os.replace(tmp_path, cached_path)
+		self._evict(keep=cached_path)
+
+	def getModel(self, key, dest_path):
+		"""Write the cached LP to dest_path. Returns False on a miss."""
+		cached = self._modelPath(key)
+		if not os.path.exists(cached):
+			return False
+		self._extract(cached, dest_path)
+		return True
+
+	def putModel(self, key, lp_path):
+		self._store(lp_path, self._modelPath(key))
+
+	def getResult(self, key, dest_path):
+		"""Write the cached solver output to dest_path. Returns False on a miss."""
+		cached = self._resultPath(key)
+		if not os.path.exists(cached):
+			return False
+		self._extract(cached, dest_path)
+		return True
+
+	def putResult(self, key, sol_path):
+		"""Cache a complete solver output (partial fronts from timeouts should not be cached)."""
+		self._store(sol_path, self._resultPath(key))
+
+	def hasResult(self, key):
+		return os.path.exists(self._resultPath(key))
+
+	def _entries(self):
+		entries = []
+		for folder in (self.model_dir, self.result_dir):
+			for name in os.listdir(folder):
+				if name.endswith('.gz'):
+					path = os.path.join(folder, name)
+					stat = os.stat(path)
+					entries.append((stat.st_mtime, stat.st_size, path))
+		return entries
+
+	def size(self):
+		return sum(size for _, size, _ in self._entries())
+
+	def _evict(self, keep=None):
+		entries = sorted(self._entries())
+		total = sum(size for _, size, _ in entries)
+		for _, size, path in entries:
+			if total <= self.max_bytes:
+				break
+			if path == keep:
+				continue
+			os.remove(path)
+			total -= size
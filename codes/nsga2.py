@@ -1,16 +1,22 @@
 from abc import ABC, abstractmethod
 import copy
-import gc
 import numpy as np
 import random
 import sys
+import time
 
 # Asumsi import kelas lain
 # from individual import Individual
 from population import Population
+from archive import ParetoArchive
+from convergence_trace import ConvergenceTrace
+from local_search import LocalSearch
 # from problem import Problem
 
 class NSGA2(ABC):
+	# Sorting mendukung objektif migrasi (mode online); engine 2 objektif meng-override ke False
+	supportsMigrationObjective = True
+
 	def __init__(self, problem, populationSize=100, maxGeneration=100, 
 				 crossoverProbability=0.9, mutationProbability=0.1):
 		self.problem = problem
@@ -20,30 +26,159 @@ class NSGA2(ABC):
 		self.mutationProbability = mutationProbability
 		
 		self.population = None
+		self.archive = None
+		# Jumlah individu yang sudah dievaluasi (populasi awal + semua offspring)
+		self.evaluations = 0
+		# Rekaman konvergensi (opsional), lihat enableTrace
+		self.tracePath = None
+		self.traceEvery = 1
+		self.trace = None
+		# Local search memetic (opsional), lihat enableLocalSearch
+		self.localSearch = None
+		self.localSearchFraction = 0.0
+		# Eliminasi duplikat saat environmental selection (opsional), lihat enableDeduplication
+		self.deduplication = None
+		self.dedupMaxAttempts = 3
+		# Warm start (mode online): kromosom awal, -1 = VM belum ditempatkan
+		self.initialPlacements = None
+		# Budget waktu run (detik), None = hanya dibatasi maxGeneration
+		self.timeLimit = None
+		self.generationsDone = 0
 
 	def setSeed(self, seed):
 		"""Mengatur seed random untuk reproduktibilitas."""
 		random.seed(seed)
 		np.random.seed(seed)
 
+	def enableArchive(self, maxSize=None, pruning='crowding', epsilon=None):
+		"""Menyimpan semua solusi non-dominated yang pernah dievaluasi ke archive eksternal."""
+		self.archive = ParetoArchive(maxSize, pruning, epsilon)
+		return self.archive
+
+	def enableTrace(self, path, every=1):
+		"""Merekam titik rank 0 (feasible) + jumlah evaluasi setiap `every` generasi ke file .npy."""
+		self.tracePath = path
+		self.traceEvery = max(1, every)
+
+	def enableLocalSearch(self, fraction=0.2, maxMoves=10, maxTrials=50):
+		"""
+		Memetic: setiap generasi, `fraction` dari offspring diperbaiki dengan local search
+		berbasis evaluasi delta (konsolidasi & co-location, hanya move Pareto-improving).
+		"""
+		self.localSearch = LocalSearch(self.problem, maxMoves, maxTrials)
+		self.localSearchFraction = fraction
+		return self.localSearch
+
+	def setTimeLimit(self, seconds):
+		"""Hentikan run setelah generasi yang melewati budget waktu (populasi tetap valid)."""
+		self.timeLimit = seconds
+
+	def setInitialPlacements(self, placements):
+		"""
+		Warm start: populasi awal dibentuk dari placements (list kromosom, mis. front run
+		sebelumnya). VM bernilai -1 (baru) ditempatkan dengan heuristik reinsertion; slot
+		yang tersisa diisi mutasi dari seed tersebut.
+		"""
+		self.initialPlacements = [list(chromosome) for chromosome in placements] if placements else None
+
+	def enableDeduplication(self, mode='drop', maxAttempts=3):
+		"""
+		Buang ('drop') atau mutasi ulang ('mutate') individu dengan kromosom identik di
+		populasi gabungan parent + offspring sebelum sorting.
+		"""
+		if mode not in ('drop', 'mutate'):
+			raise ValueError(f"Unknown deduplication mode: {mode}")
+		self.deduplication = mode
+		self.dedupMaxAttempts = maxAttempts
+
+	def removeDuplicates(self, population):
+		"""
+		Deduplikasi berbasis canonicalKey (hash). Kemunculan pertama dipertahankan (parent
+		sebelum offspring). Mode 'mutate' memutasi duplikat sampai unik (maksimal
+		dedupMaxAttempts kali), sisanya tetap dibuang. Return (jumlah dibuang, list individu
+		yang dimutasi ulang).
+		"""
+		seen = set()
+		unique = []
+		dropped, mutated = 0, []
+		for ind in population.individuals:
+			key = ind.canonicalKey()
+			if key in seen and self.deduplication == 'mutate':
+				for _ in range(self.dedupMaxAttempts):
+					self.mutate(ind)
+					key = ind.canonicalKey()
+					if key not in seen:
+						mutated.append(ind)
+						break
+			if key in seen:
+				dropped += 1
+				continue
+			seen.add(key)
+			unique.append(ind)
+		population.individuals = unique
+		return dropped, mutated
+
+	def _openTrace(self):
+		if self.tracePath is None:
+			self.trace = None
+			return
+		# Generasi 0, setiap `every` generasi, dan generasi terakhir
+		max_records = self.maxGeneration // self.traceEvery + 2
+		self.trace = ConvergenceTrace(self.tracePath, max_records, self.populationSize)
+
+	def _recordTrace(self, generation, front, final=False):
+		# final: generasi terakhir run yang dihentikan timeLimit, direkam walau bukan kelipatan traceEvery
+		due = generation % self.traceEvery == 0 or generation == self.maxGeneration
+		if self.trace is not None and (due or final):
+			self.trace.record(generation, self.evaluations, front)
+
+	def _closeTrace(self):
+		if self.trace is not None:
+			self.trace.close()
+			self.trace = None
+
 	def log(self, message, verbose):
 		"""Helper untuk print jika verbose aktif."""
 		if verbose:
 			print(message, flush=True)
 
+	def checkObjectives(self):
+		"""
+		ValueError jika objektif migrasi aktif (problem.previous_placement) pada komponen yang
+		hanya membandingkan power & net, karena objektif ketiga akan diabaikan diam-diam.
+		"""
+		if getattr(self.problem, 'previous_placement', None) is None:
+			return
+		if not self.supportsMigrationObjective:
+			raise ValueError(f"{type(self).__name__} ranks power and net only; the migration objective is not supported")
+		if self.archive is not None:
+			raise ValueError("The external archive is 2-objective; the migration objective is not supported")
+
 	def run(self, verbose=True):			
+		self.checkObjectives()
 		self.log(f"\n[NSGA-II] Initializing Population ({self.populationSize} individuals)...", verbose)
 		
 		# Inisialisasi Populasi Awal
+		self.evaluations = 0
+		self.generationsDone = 0
+		start_time = time.time()
+		self._openTrace()
 		self.generatePopulation()
+		self.evaluations += len(self.population)
+		if self.archive is not None:
+			self.archive.update(self.population)
 		
 		self.log("[NSGA-II] Initial Rank & Crowding Distance Calculation...", verbose)
 		self.fastNonDominatedSort(self.population)
 		for front in self.population.fronts:
 			self.calculateCrowdingDistance(front)
+		self._recordTrace(0, self.population.fronts[0])
 			
 		self.log("[NSGA-II] Creating First Generation Offspring...", verbose)
 		offspring = self.createOffspring(self.population, verbose)
+		self.evaluations += len(offspring)
+		if self.archive is not None:
+			self.archive.update(offspring)
 
 		for gen in range(self.maxGeneration):
 			if verbose:
@@ -54,6 +189,14 @@ class NSGA2(ABC):
 			current_size = len(self.population.individuals)
 			self.log(f"  > Merging Population (Size: {current_size} + {len(offspring)})", verbose)
 			self.population.extend(offspring)
+
+			if self.deduplication is not None:
+				dropped, mutated = self.removeDuplicates(self.population)
+				# Individu yang dimutasi ulang adalah solusi baru: dihitung & masuk archive
+				self.evaluations += len(mutated)
+				if self.archive is not None and mutated:
+					self.archive.update(mutated)
+				self.log(f"  > Deduplication: {dropped} dropped, {len(mutated)} re-mutated", verbose)
 			
 			# 2. Environmental Selection (Sorting)
 			self.log("  > Environmental Selection: Fast Non-Dominated Sort", verbose)
@@ -61,74 +204,113 @@ class NSGA2(ABC):
 			
 			# 3. Truncation (Memilih N terbaik)
 			self.log("  > Environmental Selection: Truncating to Population Size", verbose)
-			new_pop_list = []
-			front_idx = 0
-			
-			# Ambil front demi front sampai batas
-			while len(new_pop_list) + len(self.population.fronts[front_idx]) <= self.populationSize:
-				self.calculateCrowdingDistance(self.population.fronts[front_idx]) 
-				new_pop_list.extend(self.population.fronts[front_idx])
-				front_idx += 1
-				if front_idx >= len(self.population.fronts): break
-
-			# Potong front terakhir jika perlu
-			if len(new_pop_list) < self.populationSize:
-				last_front = self.population.fronts[front_idx]
-				self.calculateCrowdingDistance(last_front)
-				# Sort descending by Crowding Distance
-				last_front.sort(key=lambda x: x.crowdingDistance, reverse=True)
-				
-				fill_count = self.populationSize - len(new_pop_list)
-				new_pop_list.extend(last_front[:fill_count])
-				self.log(f"	- Filled remaining {fill_count} slots from Front {front_idx}", verbose)
-
-			# Update Populasi (Bungkus list ke Object Population)
-			self.population = Population(new_pop_list)
+			# Rank & crowding survivor dibawa dari sort gabungan (Mating Prep tanpa sort ulang)
+			self.population = self.environmentalSelection(self.population, verbose)
+			self._recordTrace(gen + 1, self.population.fronts[0])
 			
-			# 4. Mating Preparation
-			self.log("  > Mating Prep: Sorting & CD Calculation for Parents", verbose)
-			self.fastNonDominatedSort(self.population)
-			for front in self.population.fronts:
-				self.calculateCrowdingDistance(front)
-			
-			# 5. Reproduction
+			# 4. Reproduction
 			self.log("  > Reproduction: Tournament -> Crossover -> Mutation", verbose)
 			offspring = self.createOffspring(self.population, verbose)
+			self.evaluations += len(offspring)
+			if self.archive is not None:
+				accepted = self.archive.update(offspring)
+				self.log(f"  > Archive: {accepted} accepted (Size: {len(self.archive)})", verbose)
+			self.generationsDone = gen + 1
 
-			gc.collect()
+			if self.timeLimit is not None and time.time() - start_time >= self.timeLimit:
+				if (gen + 1) % self.traceEvery != 0:
+					self._recordTrace(gen + 1, self.population.fronts[0], final=True)
+				self.log(f"\n[NSGA-II] Time limit reached after {gen + 1} generations.", verbose)
+				break
 
+		self._closeTrace()
 		self.log("\n[NSGA-II] Optimization Finished.", verbose)
 
+	def environmentalSelection(self, population, verbose=False):
+		"""
+		Memilih populationSize individu terbaik dari populasi yang sudah di-sort.
+		Rank tidak berubah untuk survivor (semua front di atasnya ikut lolos), jadi
+		fronts & crowding distance dibawa ke populasi baru; hanya front terakhir
+		yang terpotong dihitung ulang crowding-nya.
+		"""
+		new_pop_list = []
+		new_fronts = []
+		front_idx = 0
+		
+		# Ambil front demi front sampai batas
+		while front_idx < len(population.fronts) and \
+				len(new_pop_list) + len(population.fronts[front_idx]) <= self.populationSize:
+			front = population.fronts[front_idx]
+			if front:
+				self.calculateCrowdingDistance(front)
+				new_pop_list.extend(front)
+				new_fronts.append(front)
+			front_idx += 1
+
+		# Potong front terakhir jika perlu
+		if len(new_pop_list) < self.populationSize and front_idx < len(population.fronts):
+			last_front = population.fronts[front_idx]
+			self.calculateCrowdingDistance(last_front)
+			# Sort descending by Crowding Distance
+			last_front.sort(key=lambda x: x.crowdingDistance, reverse=True)
+			
+			fill_count = self.populationSize - len(new_pop_list)
+			survivors = last_front[:fill_count]
+			# Crowding dihitung ulang hanya di antara survivor front ini
+			self.calculateCrowdingDistance(survivors)
+			new_pop_list.extend(survivors)
+			new_fronts.append(survivors)
+			self.log(f"	- Filled remaining {fill_count} slots from Front {front_idx}", verbose)
+
+		# Update Populasi (Bungkus list ke Object Population)
+		new_population = Population(new_pop_list)
+		new_population.fronts = new_fronts
+		return new_population
+
 	def fastNonDominatedSort(self, population):
+		"""
+		Fast Non-Dominated Sort (Deb et al.) dengan constrained dominance.
+		Bookkeeping dominasi disimpan di array NumPy sementara (bukan list referensi
+		per individu), sehingga tidak ada reference cycle dan memori langsung dibebaskan.
+		"""
 		# Reset fronts
 		population.fronts = [[]]
 		
 		# Iterasi via properti individuals jika population adalah object wrapper
 		ind_list = population.individuals if hasattr(population, 'individuals') else population
+		if len(ind_list) == 0:
+			return
+
+		keys = list(ind_list[0].objectives.keys())
+		objs = np.array([[ind.objectives[key] for key in keys] for ind in ind_list], dtype=float)
+		feasible = np.array([not ind.isConstraintViolated for ind in ind_list])
+		violation = np.array([ind.totalViolation for ind in ind_list], dtype=float)
+
+		# dominates[i, j] = True jika individu i mendominasi individu j (sama dengan Individual.dominates)
+		pareto = (np.all(objs[:, np.newaxis, :] <= objs[np.newaxis, :, :], axis=2) &
+				  np.any(objs[:, np.newaxis, :] < objs[np.newaxis, :, :], axis=2))
+		dominates = np.where(feasible[:, np.newaxis],
+							 ~feasible[np.newaxis, :] | pareto,
+							 ~feasible[np.newaxis, :] & (violation[:, np.newaxis] < violation[np.newaxis, :]))
+		del pareto
+
+		domination_count = dominates.sum(axis=0)
+		current = np.flatnonzero(domination_count == 0)
 		
-		for individual in ind_list:
-			individual.dominationCount = 0
-			individual.dominatedSolutions = []
-			for other in ind_list:
-				if individual.dominates(other):
-					individual.dominatedSolutions.append(other)
-				elif other.dominates(individual):
-					individual.dominationCount += 1
-			if individual.dominationCount == 0:
-				individual.frontRank = 0
-				population.fronts[0].append(individual)
-		
-		i = 0
-		while len(population.fronts[i]) > 0:
-			temp = []
-			for individual in population.fronts[i]:
-				for other in individual.dominatedSolutions:
-					other.dominationCount -= 1
-					if other.dominationCount == 0:
-						other.frontRank = i + 1
-						temp.append(other)
-			i += 1
-			population.fronts.append(temp)
+		rank = 0
+		while len(current) > 0:
+			front = [ind_list[idx] for idx in current]
+			for ind in front:
+				ind.frontRank = rank
+			population.fronts[rank] = front
+
+			# Kurangi domination count dari semua individu yang didominasi front ini
+			domination_count = domination_count - dominates[current].sum(axis=0)
+			domination_count[current] = -1
+			current = np.flatnonzero(domination_count == 0)
+			
+			rank += 1
+			population.fronts.append([])
 
 	def calculateCrowdingDistance(self, front: list):
 		if len(front) > 0:
@@ -152,50 +334,101 @@ class NSGA2(ABC):
 		offspringList = []
 		
 		# Statistik untuk log
-		stats = {'crossover': 0, 'mutation': 0, 'clones': 0}
-
-		while len(offspringList) < self.populationSize:
-			# 1. Selection
-			parent1 = self.tournament(population)
-			parent2 = parent1
-			while parent1 == parent2:
-				parent2 = self.tournament(population)
-			
-			# 2. Crossover
-			if random.random() <= self.crossoverProbability:
-				offspring1, offspring2 = self.crossover(parent1, parent2)
-				# WAJIB: Hitung nilai objektif & constraint untuk anak baru
-				# Karena proses crossover merusak struktur kromosom, nilai lama tidak valid
-				offspring1.evaluateFull()
-				offspring2.evaluateFull()
-				stats['crossover'] += 1
-			else:
-				# Clone parent jika tidak crossover
-				offspring1 = copy.deepcopy(parent1)
-				offspring2 = copy.deepcopy(parent2)
-				stats['clones'] += 1
-
-			# 3. Mutation
-			if random.random() <= self.mutationProbability:
-				self.mutate(offspring1)
-				stats['mutation'] += 1
-			
-			if random.random() <= self.mutationProbability:
-				self.mutate(offspring2)
-				stats['mutation'] += 1
+		stats = {'crossover': 0, 'mutation': 0, 'clones': 0, 'ls_individuals': 0, 'ls_moves': 0}
+
+		# 1. Selection: semua pasangan parent generasi ini diundi sekaligus
+		candidates = population.individuals if hasattr(population, 'individuals') else population
+		num_pairs = (self.populationSize + 1) // 2
+		parents1, parents2 = self.selectParents(population, num_pairs)
+
+		for idx1, idx2 in zip(parents1.tolist(), parents2.tolist()):
+			# 2. Crossover & 3. Mutation
+			offspring1, offspring2 = self._reproducePair(candidates[idx1], candidates[idx2], stats)
 
 			offspringList.append(offspring1)
 			if len(offspringList) < self.populationSize:
 				offspringList.append(offspring2)
 
+		# 4. Local search (memetic) pada sebagian offspring
+		if self.localSearch is not None:
+			stats['ls_individuals'], stats['ls_moves'] = self.localSearch.improvePopulation(offspringList, self.localSearchFraction)
+
 		# Print Statistik Reproduksi
 		if verbose:
 			print(f"	[Stats] Crossover Pairs: {stats['crossover']} | "
 				  f"Mutations: {stats['mutation']} | "
 				  f"Clones Pairs: {stats['clones']}", flush=True)
+			if self.localSearch is not None:
+				print(f"	[Stats] Local Search: {stats['ls_moves']} moves on {stats['ls_individuals']} individuals", flush=True)
 			
 		return offspringList
 
+	def selectParents(self, population, count):
+		"""
+		Binary tournament batch: 2 * count tournament diundi sekaligus dengan NumPy atas
+		array (frontRank, crowdingDistance). Return dua array indeks parent (panjang count)
+		dengan parents1[k] != parents2[k]. Aturan pemenang sama dengan tournament().
+		"""
+		candidates = population.individuals if hasattr(population, 'individuals') else population
+		size = len(candidates)
+		rank = np.array([ind.frontRank for ind in candidates])
+		crowding = np.array([ind.crowdingDistance for ind in candidates], dtype=float)
+
+		winners = self._tournamentBatch(rank, crowding, 2 * count)
+		parents1, parents2 = winners[:count], winners[count:]
+
+		# Pasangan kembar: ulangi tournament parent kedua hanya untuk posisi tersebut
+		if size > 1:
+			same = np.flatnonzero(parents1 == parents2)
+			while len(same) > 0:
+				parents2[same] = self._tournamentBatch(rank, crowding, len(same))
+				same = same[parents1[same] == parents2[same]]
+		return parents1, parents2
+
+	@staticmethod
+	def _tournamentBatch(rank, crowding, count):
+		size = len(rank)
+		first = np.random.randint(0, size, count)
+		# Peserta kedua selalu berbeda dari yang pertama (seperti random.sample(candidates, 2))
+		second = (first + np.random.randint(1, size, count)) % size if size > 1 else first.copy()
+
+		# Crowded comparison: rank lebih kecil menang, jika sama crowding lebih besar menang
+		first_wins = (rank[first] < rank[second]) | ((rank[first] == rank[second]) & (crowding[first] > crowding[second]))
+		return np.where(first_wins, first, second)
+
+	def _selectParents(self, population):
+		"""Dua kali tournament sampai mendapatkan dua parent yang berbeda."""
+		parent1 = self.tournament(population)
+		parent2 = parent1
+		while parent1 == parent2:
+			parent2 = self.tournament(population)
+		return parent1, parent2
+
+	def _reproducePair(self, parent1, parent2, stats):
+		"""Crossover + mutasi untuk satu pasang parent. Mengembalikan dua anak yang sudah dievaluasi."""
+		if random.random() <= self.crossoverProbability:
+			offspring1, offspring2 = self.crossover(parent1, parent2)
+			# WAJIB: Hitung nilai objektif & constraint untuk anak baru
+			# Karena proses crossover merusak struktur kromosom, nilai lama tidak valid
+			offspring1.evaluateFull()
+			offspring2.evaluateFull()
+			stats['crossover'] += 1
+		else:
+			# Clone parent jika tidak crossover
+			offspring1 = copy.deepcopy(parent1)
+			offspring2 = copy.deepcopy(parent2)
+			stats['clones'] += 1
+
+		if random.random() <= self.mutationProbability:
+			self.mutate(offspring1)
+			stats['mutation'] += 1
+		
+		if random.random() <= self.mutationProbability:
+			self.mutate(offspring2)
+			stats['mutation'] += 1
+
+		return offspring1, offspring2
+
 	def tournament(self, population) -> object:
 		# Handle wrapper
 		candidates = population.individuals if hasattr(population, 'individuals') else population
@@ -217,6 +450,10 @@ class NSGA2(ABC):
 	def generatePopulation(self):
 		# Gunakan list kosong [] agar kompatibel dengan __init__ Population
 		self.population = Population([]) 
+
+		if self.initialPlacements:
+			self._generateSeededPopulation()
+			return
 		
 		for _ in range(self.populationSize):
 			chromosome_list = self._generate_chromosome_random_first_fit()
@@ -224,6 +461,103 @@ class NSGA2(ABC):
 			ind.evaluateFull()
 			self.population.append(ind)
 
+	def _generateSeededPopulation(self):
+		seeds = []
+		for chromosome in self.initialPlacements[:self.populationSize]:
+			ind = self._create_individual_from_list(self._completePlacement(chromosome))
+			ind.evaluateFull()
+			# Resize / VM baru bisa membuat seed overload
+			if ind.isConstraintViolated:
+				self.repair(ind)
+			seeds.append(ind)
+			self.population.append(ind)
+
+		while len(self.population) < self.populationSize:
+			seed = random.choice(seeds)
+			ind = self._create_individual_from_list(list(seed.chromosome_list))
+			ind.evaluateFull()
+			self.mutate(ind)
+			self.population.append(ind)
+
+	def _completePlacement(self, chromosome):
+		"""Tempatkan VM yang belum punya server (-1) dengan heuristik reinsertion."""
+		server_map = {}
+		unplaced_vms = []
+		for vm_idx, server_idx in enumerate(chromosome):
+			if server_idx < 0:
+				unplaced_vms.append(vm_idx)
+			else:
+				server_map.setdefault(server_idx, []).append(vm_idx)
+
+		if unplaced_vms:
+			random.shuffle(unplaced_vms)
+			self._reinsert_vms(server_map, unplaced_vms)
+
+		placement = list(chromosome)
+		for server_idx, vm_list in server_map.items():
+			for vm_idx in vm_list:
+				placement[vm_idx] = server_idx
+		return placement
+
+	def _reinsert_vms(self, server_map, unplaced_vms):		
+		current_cpu = {s: 0 for s in range(self.problem.N_P)}
+		current_mem = {s: 0 for s in range(self.problem.N_P)}
+		
+		# Calculate resource usage for every server
+		for server_idx, vm_list in server_map.items():
+			for vm_idx in vm_list:
+				current_cpu[server_idx] += self.problem.v_cpu[vm_idx]
+				current_mem[server_idx] += self.problem.v_mem[vm_idx]
+				
+		# Reinsert unplaced VMs
+		for vm_idx in unplaced_vms:
+			req_cpu = self.problem.v_cpu[vm_idx]
+			req_mem = self.problem.v_mem[vm_idx]
+			is_placed = False
+			
+			# Pick one random active server
+			active_servers = list(server_map.keys())
+			random.shuffle(active_servers) # Shuffle
+			
+			for server_idx in active_servers:
+				# If the VM fits into this server, placed the VM there 
+				if (current_cpu[server_idx] + req_cpu <= self.problem.p_cpu[server_idx] and 
+					current_mem[server_idx] + req_mem <= self.problem.p_mem[server_idx]):
+					
+					server_map[server_idx].append(vm_idx)
+					current_cpu[server_idx] += req_cpu
+					current_mem[server_idx] += req_mem
+					is_placed = True
+					# Proceed to the next VM
+					break
+				# Otherwise, try another active server
+			
+			# If it doesn't fit into any active server, activate first idle server 
+			if not is_placed:
+				for server_idx in range(self.problem.N_P):
+					# Skip active server (already checked)
+					if server_idx in server_map and server_map[server_idx]:
+						continue
+					if (req_cpu <= self.problem.p_cpu[server_idx] and 
+					    req_mem <= self.problem.p_mem[server_idx]):
+						
+						if server_idx not in server_map:
+							server_map[server_idx] = []
+						server_map[server_idx].append(vm_idx)
+						
+						current_cpu[server_idx] += req_cpu
+						current_mem[server_idx] += req_mem
+						is_placed = True
+						# Proceed to the next VM
+						break
+
+			# Fallback (Random)
+			if not is_placed:
+				random_server = random.randint(0, self.problem.N_P - 1)
+				if random_server not in server_map: 
+					server_map[random_server] = []
+				server_map[random_server].append(vm_idx)
+
 	def _generate_chromosome_random_first_fit(self) -> list:
 		chromosome = [-1] * self.problem.N_V
 		remaining_cpu = np.copy(self.problem.p_cpu)
@@ -251,9 +585,108 @@ class NSGA2(ABC):
 		return chromosome
 	
 	def repair(self, individual):
-		# Implementasi default (kosong)
-		# Subclass atau mixin bisa meng-override ini
-		pass 
+		"""
+		Repair berbasis indeks server overload (cpu, mem, atau net melebihi kapasitas).
+		Dari server dengan pelanggaran terbesar, VM termurah (trafik paling kecil ke VM lain
+		di server yang sama) dipindah ke target yang muat, dievaluasi dengan delta.
+		Berhenti begitu totalViolation = 0. Server yang tidak bisa diperbaiki dikeluarkan
+		dari indeks agar repair selalu berhenti. Return jumlah VM yang dipindah.
+		"""
+		overloaded = self._overloadedServers(individual)
+		moved = 0
+		max_moves = self.problem.N_V
+
+		while individual.isConstraintViolated and overloaded and moved < max_moves:
+			server_idx = max(overloaded, key=lambda s: overloaded[s])
+			target = self._evictOne(individual, server_idx)
+			if target is None:
+				del overloaded[server_idx]
+				continue
+			moved += 1
+
+			# Hanya server asal & tujuan yang bebannya berubah
+			for s in (server_idx, target):
+				if s in individual.violatingServers:
+					overloaded[s] = self._serverViolation(individual, s)
+				else:
+					overloaded.pop(s, None)
+		return moved
+
+	def _serverViolation(self, individual, server_idx):
+		# Dinormalisasi per kapasitas agar cpu, mem, dan net sebanding
+		p = self.problem
+		total = 0.0
+		for key, capacity in (('cpu', p.p_cpu), ('mem', p.p_mem), ('net', p.p_net)):
+			violation = individual.constraintViolations[key][server_idx]
+			if violation > 0:
+				total += violation / capacity[server_idx] if capacity[server_idx] > 0 else violation
+		return total
+
+	def _overloadedServers(self, individual):
+		# Himpunan server yang melanggar dijaga inkremental oleh Individual, tanpa scan array
+		return {s: self._serverViolation(individual, s) for s in individual.violatingServers}
+
+	def _evictOne(self, individual, server_idx):
+		"""Pindahkan VM termurah dari server_idx ke target yang muat. Return target atau None."""
+		p = self.problem
+		assign = np.asarray(individual.chromosome_list)
+		vms = np.flatnonzero(assign == server_idx)
+		if len(vms) == 0:
+			return None
+
+		# Biaya evict: trafik ke VM lain di server yang sama (menjadi lintas server)
+		local_traffic = p.T_matrix[np.ix_(vms, vms)].sum(axis=1) + p.T_matrix[np.ix_(vms, vms)].sum(axis=0)
+		for vm_idx in vms[np.lexsort((p.v_cpu[vms], local_traffic))]:
+			target = self._repairTarget(individual, assign, vm_idx, server_idx)
+			if target is not None:
+				individual.evaluateDelta(int(vm_idx), target)
+				return target
+		return None
+
+	def _repairTarget(self, individual, assign, vm_idx, src):
+		"""
+		Server tujuan yang tetap feasible (cpu, mem, net) setelah VM dipindah, dihitung delta
+		untuk semua server sekaligus. Server aktif diutamakan; di antaranya biaya net terkecil.
+		"""
+		p = self.problem
+		row = p.T_matrix[vm_idx]
+		column = p.T_matrix[:, vm_idx]
+
+		fits = ((individual.total_cpu_per_server + p.v_cpu[vm_idx] <= p.p_cpu) &
+				(individual.total_mem_per_server + p.v_mem[vm_idx] <= p.p_mem))
+		fits[src] = False
+
+		# Beban net target: VM membawa trafik ke semua peer di luar target, peer di target jadi lokal
+		peer_row = np.bincount(assign, weights=row, minlength=p.N_P)
+		peer_column = np.bincount(assign, weights=column, minlength=p.N_P)
+		v_net_new = p.e_vector[vm_idx] + np.sum(row) - row[vm_idx] - peer_row
+		net_after = individual.total_net_per_server + v_net_new - peer_column
+		fits &= net_after <= p.p_net
+
+		# Server asal: trafik VM ke peer yang tertinggal di src menjadi lintas server,
+		# move hanya berguna jika pelanggaran (ternormalisasi) src tetap turun
+		on_src = assign == src
+		on_src[vm_idx] = False
+		v_net_old = p.e_vector[vm_idx] + np.sum(row[~on_src]) - row[vm_idx]
+		src_net = individual.total_net_per_server[src] - v_net_old + np.sum(column[on_src])
+		src_after = 0.0
+		for load, capacity in ((individual.total_cpu_per_server[src] - p.v_cpu[vm_idx], p.p_cpu[src]),
+							   (individual.total_mem_per_server[src] - p.v_mem[vm_idx], p.p_mem[src]),
+							   (src_net, p.p_net[src])):
+			if load > capacity:
+				src_after += (load - capacity) / capacity if capacity > 0 else load - capacity
+		if src_after >= self._serverViolation(individual, src):
+			return None
+
+		candidates = np.flatnonzero(fits)
+		if len(candidates) == 0:
+			return None
+
+		weights = 0.5 * (row + column)
+		weights[vm_idx] = 0.0
+		net_cost = weights @ p.C_matrix[np.ix_(assign, candidates)] + p.e_vector[vm_idx] * p.g_vector[candidates]
+		inactive = individual.total_cpu_per_server[candidates] <= 0
+		return int(candidates[np.lexsort((net_cost, inactive))[0]])
 
 	@abstractmethod
 	def _create_individual_from_list(self, chromosome_list: list):
@@ -120,63 +120,4 @@ class NSGA2Hybrid(NSGA2):
 				server_map[server_idx] = []
 			server_map[server_idx].append(vm_idx)	
 
-		return IndividualHybrid(self.problem, server_map)
-
-	def _reinsert_vms(self, server_map, unplaced_vms):		
-		current_cpu = {s: 0 for s in range(self.problem.N_P)}
-		current_mem = {s: 0 for s in range(self.problem.N_P)}
-		
-		# Calculate resource usage for every server
-		for server_idx, vm_list in server_map.items():
-			for vm_idx in vm_list:
-				current_cpu[server_idx] += self.problem.v_cpu[vm_idx]
-				current_mem[server_idx] += self.problem.v_mem[vm_idx]
-				
-		# Reinsert unplaced VMs
-		for vm_idx in unplaced_vms:
-			req_cpu = self.problem.v_cpu[vm_idx]
-			req_mem = self.problem.v_mem[vm_idx]
-			is_placed = False
-			
-			# Pick one random active server
-			active_servers = list(server_map.keys())
-			random.shuffle(active_servers) # Shuffle
-			
-			for server_idx in active_servers:
-				# If the VM fits into this server, placed the VM there 
-				if (current_cpu[server_idx] + req_cpu <= self.problem.p_cpu[server_idx] and 
-					current_mem[server_idx] + req_mem <= self.problem.p_mem[server_idx]):
-					
-					server_map[server_idx].append(vm_idx)
-					current_cpu[server_idx] += req_cpu
-					current_mem[server_idx] += req_mem
-					is_placed = True
-					# Proceed to the next VM
-					break
-				# Otherwise, try another active server
-			
-			# If it doesn't fit into any active server, activate first idle server 
-			if not is_placed:
-				for server_idx in range(self.problem.N_P):
-					# Skip active server (already checked)
-					if server_idx in server_map and server_map[server_idx]:
-						continue
-					if (req_cpu <= self.problem.p_cpu[server_idx] and 
-					    req_mem <= self.problem.p_mem[server_idx]):
-						
-						if server_idx not in server_map:
-							server_map[server_idx] = []
-						server_map[server_idx].append(vm_idx)
-						
-						current_cpu[server_idx] += req_cpu
-						current_mem[server_idx] += req_mem
-						is_placed = True
-						# Proceed to the next VM
-						break
-
-			# Fallback (Random)
-			if not is_placed:
-				random_server = random.randint(0, self.problem.N_P - 1)
-				if random_server not in server_map: 
-					server_map[random_server] = []
-				server_map[random_server].append(vm_idx)	
\ No newline at end of file
+		return IndividualHybrid(self.problem, server_map)
\ No newline at end of file
@@ -0,0 +1,382 @@
+import bisect
+import copy
+import pickle
+import random
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from nsga2 import NSGA2
+from nsga2_classic import NSGA2Classic
+from nsga2_hybrid import NSGA2Hybrid
+
+class _Front:
+	"""
+	One front of the incremental sort.
+	Feasible fronts are 2D staircases sorted by (power, net), so net is non-increasing
+	and dominance queries are two binary searches. Infeasible fronts group individuals
+	with equal totalViolation (constrained dominance makes them a total order).
+	"""
+	def __init__(self, members=None, feasible=True):
+		self.feasible = feasible
+		self.members = []
+		self.powers = []
+		self.nets = []
+		self.negNets = []
+		self.dirty = True
+		for ind in members or []:
+			self._place(len(self.members), ind)
+
+	def __len__(self):
+		return len(self.members)
+
+	def _place(self, idx, ind):
+		self.members.insert(idx, ind)
+		if self.feasible:
+			power = ind.objectives['power_consumption']
+			net = ind.objectives['net_communication']
+			self.powers.insert(idx, power)
+			self.nets.insert(idx, net)
+			self.negNets.insert(idx, -net)
+
+	def dominates(self, power, net):
+		"""True if some member Pareto-dominates (power, net)."""
+		# Last member with strictly lower power: dominates if its net is not worse
+		idx = bisect.bisect_left(self.powers, power)
+		if idx > 0 and self.nets[idx - 1] <= net:
+			return True
+		# Last member with equal-or-lower power: dominates if its net is strictly better
+		idx = bisect.bisect_right(self.powers, power)
+		return idx > 0 and self.nets[idx - 1] < net
+
+	def insertAndEvict(self, ind):
+		"""Insert a non-dominated individual, returning the members it dominates (sorted)."""
+		power = ind.objectives['power_consumption']
+		net = ind.objectives['net_communication']
+
+		start = bisect.bisect_left(self.powers, power)
+		# Identical points are mutually non-dominated and stay in the front
+		while start < len(self.powers) and self.powers[start] == power and self.nets[start] == net:
+			start += 1
+		# Remaining members from start onwards with net >= new net are dominated (contiguous block)
+		end = bisect.bisect_right(self.negNets, -net, lo=start)
+
+		evicted = self.members[start:end]
+		self.members[start:end] = [ind]
+		self.powers[start:end] = [power]
+		self.nets[start:end] = [net]
+		self.negNets[start:end] = [-net]
+		self.dirty = True
+		return evicted
+
+	def remove(self, ind):
+		if self.feasible:
+			idx = bisect.bisect_left(self.powers, ind.objectives['power_consumption'])
+			while self.members[idx] is not ind:
+				idx += 1
+			del self.powers[idx]
+			del self.nets[idx]
+			del self.negNets[idx]
+		else:
+			idx = next(i for i, member in enumerate(self.members) if member is ind)
+		del self.members[idx]
+		self.dirty = True
+
+	def refreshCrowding(self, engine):
+		if not self.dirty:
+			return
+		count = len(self.members)
+		if not self.feasible or count < 3:
+			engine.calculateCrowdingDistance(list(self.members))
+		else:
+			# Sorted by power => sorted (reversed) by net, neighbours are idx-1 / idx+1 for both
+			powers = np.asarray(self.powers)
+			nets = np.asarray(self.nets)
+			scale_power = (powers[-1] - powers[0]) or 1.0
+			scale_net = (nets[0] - nets[-1]) or 1.0
+			crowding = (powers[2:] - powers[:-2]) / scale_power + (nets[:-2] - nets[2:]) / scale_net
+
+			self.members[0].crowdingDistance = float('inf')
+			self.members[-1].crowdingDistance = float('inf')
+			for ind, value in zip(self.members[1:-1], crowding.tolist()):
+				ind.crowdingDistance = value
+		self.dirty = False
+
+class IncrementalFronts:
+	"""
+	Front ranks maintained under single insertions and worst-removals, with the same
+	constrained dominance as Individual.dominates: all feasible fronts come first,
+	then one front per distinct totalViolation value (ascending).
+
+	Inserting a feasible individual binary-searches its rank over the fronts and
+	pushes the members it dominates down one front (cascading only as far as needed).
+	"""
+	def __init__(self, engine):
+		self.engine = engine
+		self.feasible = []
+		self.infeasible = []
+		self.violations = []
+
+	def __len__(self):
+		return len(self.feasible) + len(self.infeasible)
+
+	def firstFront(self):
+		fronts = self.feasible + self.infeasible
+		return fronts[0].members if fronts else []
+
+	def asLists(self):
+		return [list(front.members) for front in self.feasible + self.infeasible]
+
+	def insert(self, ind):
+		if ind.isConstraintViolated:
+			self._insertInfeasible(ind)
+			return
+
+		power = ind.objectives['power_consumption']
+		net = ind.objectives['net_communication']
+
+		# Dominance by front k implies dominance by every front < k: binary search the rank
+		lo, hi = 0, len(self.feasible)
+		while lo < hi:
+			mid = (lo + hi) // 2
+			if self.feasible[mid].dominates(power, net):
+				lo = mid + 1
+			else:
+				hi = mid
+
+		moved = [ind]
+		rank = lo
+		while moved:
+			if rank == len(self.feasible):
+				self.feasible.append(_Front(moved))
+				for member in moved:
+					member.frontRank = rank
+				self._renumberInfeasible()
+				return
+
+			front = self.feasible[rank]
+			evicted = []
+			for member in moved:
+				evicted.extend(front.insertAndEvict(member))
+				member.frontRank = rank
+
+			evicted.sort(key=lambda x: (x.objectives['power_consumption'], x.objectives['net_communication']))
+			moved = evicted
+			rank += 1
+
+	def _insertInfeasible(self, ind):
+		violation = ind.totalViolation
+		idx = bisect.bisect_left(self.violations, violation)
+		if idx < len(self.violations) and self.violations[idx] == violation:
+			front = self.infeasible[idx]
+			front.members.append(ind)
+			front.dirty = True
+			ind.frontRank = len(self.feasible) + idx
+			return
+
+		self.violations.insert(idx, violation)
+		self.infeasible.insert(idx, _Front([ind], feasible=False))
+		self._renumberInfeasible(idx)
+
+	def _renumberInfeasible(self, start=0):
+		offset = len(self.feasible)
+		for idx in range(start, len(self.infeasible)):
+			for member in self.infeasible[idx].members:
+				member.frontRank = offset + idx
+
+	def popWorst(self):
+		"""Remove and return the least crowded member of the last front."""
+		if self.infeasible:
+			front = self.infeasible[-1]
+		else:
+			front = self.feasible[-1]
+
+		front.refreshCrowding(self.engine)
+		worst = min(front.members, key=lambda x: x.crowdingDistance)
+		front.remove(worst)
+
+		if not front.members:
+			if self.infeasible:
+				self.infeasible.pop()
+				self.violations.pop()
+			else:
+				self.feasible.pop()
+		return worst
+
+	def refreshCrowding(self):
+		for front in self.feasible + self.infeasible:
+			front.refreshCrowding(self.engine)
+
+# ==== Worker process state (async mode) ====
+_worker_engine = None
+
+def _init_worker(engine_class, problem, crossoverProbability, mutationProbability):
+	global _worker_engine
+	_worker_engine = engine_class(problem, 0, 0, crossoverProbability, mutationProbability)
+
+def _reproduce_job(parents_payload, seed):
+	random.seed(seed)
+	np.random.seed(seed % (2 ** 32))
+
+	# Parent dikirim lengkap dengan hasil evaluasinya (objektif, load, violation): tanpa evaluateFull ulang
+	parents = pickle.loads(parents_payload)
+	for parent in parents:
+		parent.problem = _worker_engine.problem
+
+	stats = {'crossover': 0, 'mutation': 0, 'clones': 0}
+	offspring = _worker_engine._reproducePair(parents[0], parents[1], stats)
+
+	# Problem is already known by the main process, do not ship it back
+	for child in offspring:
+		child.problem = None
+	return offspring
+
+class NSGA2SteadyState(NSGA2):
+	"""
+	Steady-state NSGA-II: offspring are inserted one at a time into incrementally
+	maintained fronts, and the least crowded member of the last front is dropped.
+	Uses the same evaluation budget as the generational run (maxGeneration * populationSize);
+	generationsDone counts generation-equivalents (populationSize offspring each), and
+	timeLimit stops both the sequential and the async loop.
+
+	With workers > 0 the pairs are bred and evaluated in a process pool and inserted
+	as soon as each job finishes, so the workers never wait for a full sort.
+	Combine with a variant, e.g. NSGA2SteadyStateHybrid below.
+	"""
+	# IncrementalFronts hanya membandingkan power & net
+	supportsMigrationObjective = False
+
+	def __init__(self, problem, populationSize=100, maxGeneration=100, crossoverProbability=0.9, mutationProbability=0.1, workers=None):
+		super().__init__(problem, populationSize, maxGeneration, crossoverProbability, mutationProbability)
+		self.workers = workers
+		self.fronts = None
+		self._slots = {}
+
+	def run(self, verbose=True):
+		self.checkObjectives()
+		self.log(f"\n[NSGA-II SS] Initializing Population ({self.populationSize} individuals)...", verbose)
+		self.evaluations = 0
+		self.generationsDone = 0
+		deadline = time.time() + self.timeLimit if self.timeLimit is not None else None
+		self._openTrace()
+		self.generatePopulation()
+		self.evaluations += len(self.population)
+		if self.archive is not None:
+			self.archive.update(self.population)
+
+		self.log("[NSGA-II SS] Initial Incremental Ranking...", verbose)
+		self.fronts = IncrementalFronts(self)
+		self._slots = {}
+		for idx, ind in enumerate(self.population.individuals):
+			self.fronts.insert(ind)
+			self._slots[id(ind)] = idx
+		self._recordTrace(0, self.fronts.firstFront())
+
+		total_offspring = self.maxGeneration * self.populationSize
+		if self.workers:
+			self._runAsync(total_offspring, deadline, verbose)
+		else:
+			self._runSequential(total_offspring, deadline, verbose)
+
+		self.fronts.refreshCrowding()
+		self.population.fronts = self.fronts.asLists()
+		self._closeTrace()
+		self.log("\n[NSGA-II SS] Optimization Finished.", verbose)
+
+	def _timeUp(self, deadline, verbose):
+		if deadline is None or time.time() < deadline:
+			return False
+		if self.generationsDone % self.traceEvery != 0:
+			self._recordTrace(self.generationsDone, self.fronts.firstFront(), final=True)
+		self.log(f"\n[NSGA-II SS] Time limit reached after {self.generationsDone} generation-equivalents.", verbose)
+		return True
+
+	def _runSequential(self, total_offspring, deadline, verbose):
+		stats = {'crossover': 0, 'mutation': 0, 'clones': 0}
+		produced = 0
+		while produced < total_offspring and not self._timeUp(deadline, verbose):
+			self.fronts.refreshCrowding()
+			parent1, parent2 = self._selectParents(self.population)
+			offspring = self._reproducePair(parent1, parent2, stats)
+			added = self._admit(offspring, total_offspring - produced)
+			produced += added
+			self._logProgress(produced, added, verbose)
+
+	def _runAsync(self, total_offspring, deadline, verbose):
+		initargs = (type(self), self.problem, self.crossoverProbability, self.mutationProbability)
+		with ProcessPoolExecutor(self.workers, initializer=_init_worker, initargs=initargs) as pool:
+			pending = set()
+			submitted = 0
+			produced = 0
+			while produced < total_offspring:
+				if self._timeUp(deadline, verbose):
+					# Job yang belum mulai dibatalkan; yang sedang berjalan hanya satu pasang per worker
+					for future in pending:
+						future.cancel()
+					break
+
+				# Keep every worker busy with one job queued behind it
+				while len(pending) < 2 * self.workers and submitted < total_offspring:
+					pending.add(self._submitJob(pool))
+					submitted += 2
+
+				timeout = None if deadline is None else max(0.0, deadline - time.time())
+				done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+				for future in done:
+					offspring = future.result()
+					for child in offspring:
+						child.problem = self.problem
+					added = self._admit(offspring, total_offspring - produced)
+					produced += added
+					self._logProgress(produced, added, verbose)
+
+	def _submitJob(self, pool):
+		self.fronts.refreshCrowding()
+		parents = self._selectParents(self.population)
+		# Snapshot saat submit (di-pickle di sini, bukan di thread pengirim pool), tanpa problem
+		detached = []
+		for parent in parents:
+			parent = copy.copy(parent)
+			parent.problem = None
+			detached.append(parent)
+		payload = pickle.dumps(detached, pickle.HIGHEST_PROTOCOL)
+		return pool.submit(_reproduce_job, payload, random.randrange(2 ** 32))
+
+	def _admit(self, offspring, budget):
+		"""Insert offspring (up to budget), then drop the worst back down to populationSize."""
+		offspring = list(offspring)[:budget]
+		self.evaluations += len(offspring)
+		individuals = self.population.individuals
+		for child in offspring:
+			self.fronts.insert(child)
+			self._slots[id(child)] = len(individuals)
+			individuals.append(child)
+
+		if self.archive is not None:
+			self.archive.update(offspring)
+
+		while len(individuals) > self.populationSize:
+			worst = self.fronts.popWorst()
+			# Swap-remove to keep deletion O(1)
+			idx = self._slots.pop(id(worst))
+			last = individuals.pop()
+			if last is not worst:
+				individuals[idx] = last
+				self._slots[id(last)] = idx
+		return len(offspring)
+
+	def _logProgress(self, produced, added, verbose):
+		# Log & trace once per populationSize offspring (one generation-equivalent)
+		if produced // self.populationSize == (produced - added) // self.populationSize:
+			return
+		self.generationsDone = produced // self.populationSize
+		self._recordTrace(produced // self.populationSize, self.fronts.firstFront())
+		if verbose:
+			print(f"\n=== GENERATION-EQUIVALENT {produced // self.populationSize}/{self.maxGeneration} "
+				  f"(Fronts: {len(self.fronts)}) ===", flush=True)
+
+class NSGA2SteadyStateClassic(NSGA2SteadyState, NSGA2Classic):
+	pass
+
+class NSGA2SteadyStateHybrid(NSGA2SteadyState, NSGA2Hybrid):
+	pass
@@ -0,0 +1,116 @@
+import math
+import time
+import numpy as np
+
+from nsga2_hybrid import NSGA2Hybrid
+
+class OnlinePlacement:
+	"""
+	Mode online: satu Problem hidup yang menerima event VM (add / remove / resize) dan
+	re-optimasi warm start dari front sebelumnya, bukan batch dari populasi acak.
+
+	- applyEvents: Problem diubah in-place, kromosom front & penempatan yang sedang
+	  berjalan (deployed) dipetakan ke penomoran VM yang baru (VM baru = -1)
+	- reoptimize: populasi awal = front lama (+ deployed), VM baru ditempatkan dengan
+	  heuristik reinsertion hybrid. Jumlah generasi sebanding dengan jumlah event sejak
+	  re-optimasi terakhir (minGeneration .. maxGeneration), sehingga latensi mengikuti
+	  besar perubahan.
+	- migrationObjective: objektif ketiga = jumlah VM yang pindah dari deployed (hanya
+	  engine generational; engine steady-state meranking power & net saja)
+	"""
+	def __init__(self, problem, engineClass=NSGA2Hybrid, populationSize=50, maxGeneration=100,
+				 minGeneration=5, generationsPerChange=2.0, migrationObjective=False, localSearch=False):
+		if migrationObjective and not engineClass.supportsMigrationObjective:
+			raise ValueError(f"{engineClass.__name__} does not support the migration objective")
+		self.problem = problem
+		self.engineClass = engineClass
+		self.populationSize = populationSize
+		self.maxGeneration = maxGeneration
+		self.minGeneration = minGeneration
+		self.generationsPerChange = generationsPerChange
+		self.migrationObjective = migrationObjective
+		self.localSearch = localSearch
+
+		# Kromosom feasible rank 0 dari run terakhir + nilai objektifnya
+		self.front = []
+		self.objectives = []
+		# Penempatan yang sedang berjalan (acuan objektif migrasi), lihat commit
+		self.deployed = None
+		self.pendingChanges = 0
+
+		self.lastGenerations = 0
+		self.lastElapsed = 0.0
+
+	def initialize(self, placement=None, seed=None, timeLimit=None, verbose=False):
+		"""Run awal penuh (maxGeneration). placement: penempatan yang sedang berjalan (opsional)."""
+		if placement is not None:
+			self.deployed = list(placement)
+		seeds = [self.deployed] if self.deployed is not None else None
+		return self._run(self.maxGeneration, seeds, seed, timeLimit, verbose)
+
+	def commit(self, placement):
+		"""Tandai placement sebagai penempatan yang sedang berjalan."""
+		self.deployed = list(placement)
+
+	def applyEvents(self, events):
+		"""Terapkan event ke Problem (lihat Problem.applyEvents). Return (vm_map, new_vms)."""
+		vm_map, new_vms = self.problem.applyEvents(events)
+		self.front = [self._remap(chromosome, vm_map, len(new_vms)) for chromosome in self.front]
+		if self.deployed is not None:
+			self.deployed = self._remap(self.deployed, vm_map, len(new_vms))
+		self.pendingChanges += len(events)
+		return vm_map, new_vms
+
+	@staticmethod
+	def _remap(chromosome, vm_map, added):
+		# vm_map naik monoton untuk VM yang tersisa, urutan kromosom tetap terjaga
+		kept = [server_idx for server_idx, new_idx in zip(chromosome, vm_map) if new_idx >= 0]
+		return kept + [-1] * added
+
+	def reoptimize(self, seed=None, timeLimit=None, verbose=False):
+		"""Re-optimasi warm start. Return (front kromosom, list objektif)."""
+		generations = math.ceil(self.generationsPerChange * self.pendingChanges)
+		generations = min(self.maxGeneration, max(self.minGeneration, generations))
+
+		seeds = list(self.front)
+		# Deployed = titik tanpa migrasi, selalu ikut sebagai seed
+		if self.deployed is not None and self.deployed not in seeds:
+			seeds.insert(0, self.deployed)
+		return self._run(generations, seeds or None, seed, timeLimit, verbose)
+
+	def _run(self, generations, seeds, seed, timeLimit, verbose):
+		start = time.time()
+		if self.migrationObjective and self.deployed is not None:
+			self.problem.previous_placement = np.array(self.deployed)
+		try:
+			engine = self.engineClass(self.problem, self.populationSize, generations)
+			if seed is not None:
+				engine.setSeed(seed)
+			if seeds:
+				engine.setInitialPlacements(seeds)
+			if self.localSearch:
+				engine.enableLocalSearch()
+			if timeLimit is not None:
+				engine.setTimeLimit(timeLimit)
+			engine.run(verbose=verbose)
+		finally:
+			# Individu di luar mode online tidak boleh ikut membawa objektif migrasi
+			self.problem.previous_placement = None
+
+		self.front = []
+		self.objectives = []
+		seen = set()
+		for ind in engine.population.fronts[0]:
+			key = ind.canonicalKey()
+			if ind.isConstraintViolated or key in seen:
+				continue
+			seen.add(key)
+			self.front.append(list(ind.chromosome_list))
+			self.objectives.append(dict(ind.objectives))
+
+		self.pendingChanges = 0
+		self.lastGenerations = engine.generationsDone
+		self.lastElapsed = time.time() - start
+		if verbose:
+			print(f"[Online] {len(self.front)} front points after {self.lastGenerations} generations ({self.lastElapsed:.2f}s)")
+		return self.front, self.objectives
@@ -1,19 +1,234 @@
 import subprocess
 import os
 import time
-import multiprocessing
+import json
+
+class PaMILOJob:
+	"""
+	Satu pemanggilan pamilo_cli. PaMILO menulis solusi ke <output_base>_sol.json.
+
+	status: 'pending' -> 'running' -> 'success' | 'failed' | 'timeout' | 'skipped'
+	Saat timeout, solution_path tetap diisi jika PaMILO sempat menulis _sol.json yang valid
+	(front parsial), dengan partial = True.
+	"""
+	def __init__(self, name, input_lp_path, output_base, timeout_sec=900, threads=None):
+		self.name = name
+		self.input_lp_path = input_lp_path
+		self.output_base = output_base
+		self.timeout_sec = timeout_sec
+		self.threads = threads
+
+		self.status = 'pending'
+		self.returncode = None
+		self.elapsed = 0.0
+		self.log_path = None
+		self.solution_path = None
+		self.partial = False
+
+		self.process = None
+		self.log_file = None
+		self.start_time = None
+		self.deadline = None
+		self.terminate_time = None
+
+	def expectedSolutionPaths(self):
+		# PaMILO menambahkan _sol.json ke argumen -o; output_base yang sudah berakhiran .json juga diterima
+		paths = [self.output_base + "_sol.json"]
+		if self.output_base.endswith(".json"):
+			paths.append(self.output_base)
+		return paths
+
+	def collectSolution(self):
+		"""
+		Cari file solusi yang bisa di-parse dan ditulis oleh run ini
+		(file sisa run sebelumnya & file yang terpotong saat kill diabaikan).
+		"""
+		for path in self.expectedSolutionPaths():
+			if not os.path.exists(path):
+				continue
+			if self.start_time is not None and os.path.getmtime(path) < self.start_time - 1.0:
+				continue
+			try:
+				with open(path, 'r') as f:
+					json.load(f)
+			except ValueError:
+				continue
+			self.solution_path = path
+			return path
+		return None
+
+class PaMILOJobQueue:
+	"""
+	Menjalankan beberapa pamilo_cli sekaligus. total_threads (default: semua core) dibagi
+	ke job yang berjalan, masing-masing threads_per_job thread (-t), sehingga jumlah job
+	paralel = total_threads // threads_per_job.
+
+	stdout & stderr setiap job ditulis langsung (tanpa buffer Python) ke <log_dir>/<name>.log.
+	Budget waktu: timeout_sec per job dan global_timeout_sec untuk seluruh antrian; job
+	yang belum sempat mulai saat budget global habis berstatus 'skipped'.
+	"""
+	TERMINATE_GRACE_SEC = 10
+
+	def __init__(self, exec_path, total_threads=None, threads_per_job=None,
+				 global_timeout_sec=None, log_dir=None, poll_interval=1.0, progress_interval=30.0):
+		self.exec_path = exec_path
+		self.total_threads = total_threads or os.cpu_count() or 2
+		self.threads_per_job = min(threads_per_job or self.total_threads, self.total_threads)
+		self.global_timeout_sec = global_timeout_sec
+		self.log_dir = log_dir
+		self.poll_interval = poll_interval
+		self.progress_interval = progress_interval
+		self.jobs = []
+
+	@property
+	def max_parallel(self):
+		return max(1, self.total_threads // self.threads_per_job)
+
+	def add(self, name, input_lp_path, output_base, timeout_sec=900, threads=None):
+		job = PaMILOJob(name, input_lp_path, output_base, timeout_sec, threads or self.threads_per_job)
+		self.jobs.append(job)
+		return job
+
+	def _start(self, job, global_deadline):
+		os.makedirs(os.path.dirname(job.output_base) or '.', exist_ok=True)
+		log_dir = self.log_dir or os.path.dirname(job.output_base) or '.'
+		os.makedirs(log_dir, exist_ok=True)
+		job.log_path = os.path.join(log_dir, f"{job.name}.log")
+
+		cmd = [self.exec_path, job.input_lp_path, "-o", job.output_base, "-t", str(job.threads)]
+		job.log_file = open(job.log_path, 'w')
+		job.log_file.write(f"$ {' '.join(cmd)}\n")
+		job.log_file.flush()
+
+		job.start_time = time.time()
+		job.deadline = job.start_time + job.timeout_sec if job.timeout_sec else None
+		if global_deadline is not None:
+			job.deadline = global_deadline if job.deadline is None else min(job.deadline, global_deadline)
+
+		try:
+			job.process = subprocess.Popen(cmd, stdout=job.log_file, stderr=subprocess.STDOUT,
+										   stdin=subprocess.DEVNULL)
+			job.status = 'running'
+			print(f"   [PaMILO] Started {job.name} (-t {job.threads}), log: {job.log_path}")
+		except Exception as e:
+			job.log_file.write(f"[PaMILO] Execution error: {e}\n")
+			self._finish(job, 'failed')
+
+	def _finish(self, job, status):
+		job.elapsed = time.time() - job.start_time
+		if job.log_file is not None:
+			job.log_file.close()
+			job.log_file = None
+		job.process = None
+
+		solution = job.collectSolution()
+		if status == 'success' and solution is None:
+			print(f"   [PaMILO] {job.name}: success reported, but output file missing.")
+			status = 'failed'
+		job.partial = status == 'timeout' and solution is not None
+		job.status = status
+
+		message = f"   [PaMILO] {job.name}: {status} ({job.elapsed:.1f}s)"
+		if job.partial:
+			message += f", partial front collected from {solution}"
+		elif status == 'failed':
+			message += f", return code {job.returncode}, see {job.log_path}"
+		print(message)
+
+	def _terminate(self, job, now):
+		# SIGTERM dulu agar PaMILO sempat menulis front sementara; SIGKILL menyusul di _poll
+		# setelah TERMINATE_GRACE_SEC, tanpa menahan job lain di loop
+		job.process.terminate()
+		job.terminate_time = now
+
+	def _poll(self, job, now):
+		"""Cek satu job yang berjalan. Return True jika job sudah selesai (status final terisi)."""
+		returncode = job.process.poll()
+		if returncode is None and job.terminate_time is not None \
+				and now - job.terminate_time >= self.TERMINATE_GRACE_SEC:
+			job.process.kill()
+			returncode = job.process.wait()
+		if returncode is not None:
+			job.returncode = returncode
+			if job.terminate_time is not None:
+				self._finish(job, 'timeout')
+			else:
+				self._finish(job, 'success' if returncode == 0 else 'failed')
+			return True
+		if job.terminate_time is None and job.deadline is not None and now >= job.deadline:
+			self._terminate(job, now)
+		return False
+
+	@staticmethod
+	def _lastLogLine(job):
+		try:
+			with open(job.log_path, 'rb') as f:
+				f.seek(0, os.SEEK_END)
+				f.seek(max(0, f.tell() - 512))
+				lines = f.read().decode(errors='replace').strip().splitlines()
+			return lines[-1][:80] if lines else ''
+		except OSError:
+			return ''
+
+	def _printProgress(self, running, now):
+		done = sum(job.status not in ('pending', 'running') for job in self.jobs)
+		print(f"   [PaMILO] {done}/{len(self.jobs)} done, {len(running)} running:")
+		for job in running:
+			print(f"	 - {job.name} {now - job.start_time:.0f}s | {self._lastLogLine(job)}")
+
+	def run(self):
+		"""Jalankan semua job yang masih pending. Return list job (dengan status akhirnya)."""
+		pending = [job for job in self.jobs if job.status == 'pending']
+		if not os.path.exists(self.exec_path):
+			print(f"[PaMILO] Error: Executable not found at {self.exec_path}")
+			for job in pending:
+				job.status = 'failed'
+			return self.jobs
+
+		print(f"[PaMILO] {len(pending)} job(s), {self.max_parallel} parallel x {self.threads_per_job} threads")
+		queue_start = time.time()
+		global_deadline = queue_start + self.global_timeout_sec if self.global_timeout_sec else None
+		running = []
+		last_progress = queue_start
+
+		while pending or running:
+			now = time.time()
+
+			# 1. Panen job yang selesai / melewati deadline
+			for job in list(running):
+				if self._poll(job, now):
+					running.remove(job)
+
+			# 2. Budget global habis: job yang belum mulai dilewati
+			if global_deadline is not None and now >= global_deadline:
+				for job in pending:
+					job.status = 'skipped'
+					print(f"   [PaMILO] {job.name}: skipped (global budget exhausted)")
+				pending = []
+
+			# 3. Isi slot kosong
+			used_threads = sum(job.threads for job in running)
+			while pending and (not running or used_threads + pending[0].threads <= self.total_threads):
+				job = pending.pop(0)
+				self._start(job, global_deadline)
+				if job.status == 'running':
+					running.append(job)
+					used_threads += job.threads
+
+			if running and self.progress_interval and now - last_progress >= self.progress_interval:
+				self._printProgress(running, now)
+				last_progress = now
+
+			if running:
+				time.sleep(self.poll_interval)
+
+		return self.jobs
 
 class PaMILORunner:
 	def __init__(self, pamilo_executable_path):
 		self.exec_path = pamilo_executable_path
 
 	def solve(self, input_lp_path, output_json_path, timeout_sec=3600):
-		if not os.path.exists(self.exec_path):
-			print(f"[PaMILO] Error: Executable not found at {self.exec_path}")
-			return False
-
-		os.makedirs(os.path.dirname(output_json_path), exist_ok=True)
-		
 		num_threads = os.cpu_count()
 
 		if num_threads is None or num_threads < 1:
@@ -21,41 +236,13 @@ class PaMILORunner:
 
 		print(f"[PaMILO] Detected {num_threads} CPU cores. Setting -t {num_threads}")
 
-		cmd = [
-			self.exec_path, 
-			input_lp_path,
-			"-o", output_json_path,	 # Flag output
-			"-t", str(num_threads)	  # Flag thread limit
-		]
-
-		print(f"[PaMILO] Running command: {' '.join(cmd)}")
-		start_time = time.time()
+		# Satu job di antrian: output di-stream ke log, _sol.json parsial tetap dikumpulkan saat timeout
+		queue = PaMILOJobQueue(self.exec_path, total_threads=num_threads)
+		name = os.path.splitext(os.path.basename(input_lp_path))[0]
+		job = queue.add(name, input_lp_path, output_json_path, timeout_sec=timeout_sec)
+		queue.run()
 
-		try:
-			result = subprocess.run(
-				cmd,
-				capture_output=True,
-				text=True,
-				timeout=timeout_sec
-				)
-
-			elapsed = time.time() - start_time
-
-			if result.returncode == 0:
-				print(f"[PaMILO] Success! Time: {elapsed:.2f}s")
-				if os.path.exists(output_json_path):
-					print(f"[PaMILO] Output saved to: {output_json_path}")
-					return True
-				else:
-					print("[PaMILO] Success reported, but output file missing.")
-					return False
-			else:
-				print(f"[PaMILO] Failed with return code {result.returncode}")
-				print("STDERR:", result.stderr)
-				return False
-		except subprocess.TimeoutExpired:
-			print(f"[PaMILO] Timeout reached after {timeout_sec} seconds (Python kill).")
-			return False
-		except Exception as e:
-			print(f"[PaMILO] Execution error: {e}")
-			return False					
\ No newline at end of file
+		if job.status == 'success':
+			print(f"[PaMILO] Output saved to: {job.solution_path}")
+			return True
+		return False
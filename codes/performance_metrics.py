@@ -1,7 +1,14 @@
 import numpy as np
+from scipy.spatial import cKDTree
+
+from hypervolume import Hypervolume
 
 class PerformanceMetrics:
-	
+	# Batas elemen (baris x kolom x objektif) per chunk pada pencarian tetangga terdekat (~32 MB float64)
+	CHUNK_ELEMENTS = 2 ** 22
+	# Jumlah pasangan titik minimum sebelum memakai jalur KD-tree (khusus 2 objektif)
+	KDTREE_MIN_PAIRS = 2 ** 20
+
 	@staticmethod
 	def calculate_spacing(front):
 		
@@ -12,60 +19,86 @@ class PerformanceMetrics:
 		# (Untuk >2D, butuh nearest neighbor search, tapi VMP biasanya 2D)
 		sorted_front = front[np.argsort(front[:, 0])]
 		
-		# Hitung jarak Euclidean antar solusi bertetangga
-		distances = []
-		for i in range(len(sorted_front) - 1):
-			d = np.linalg.norm(sorted_front[i] - sorted_front[i+1])
-			distances.append(d)
+		# Hitung jarak Euclidean antar solusi bertetangga (vektorisasi)
+		distances = np.sqrt(np.sum(np.square(np.diff(sorted_front, axis=0)), axis=1))
 			
 		d_mean = np.mean(distances)
-		sum_sq_diff = sum((d - d_mean) ** 2 for d in distances)
+		sum_sq_diff = np.sum(np.square(distances - d_mean))
 		
 		return np.sqrt(sum_sq_diff / (len(front) - 1))
 
 	@staticmethod
 	def calculate_hypervolume(front, ref_point):
 		"""
-		Menghitung Hypervolume untuk 2 Objektif.
-		front: Array (N, 2) yang SUDAH DINORMALISASI.
+		Menghitung Hypervolume (exact, lihat modul hypervolume).
+		front: Array (N, M) yang SUDAH DINORMALISASI.
 		ref_point: Biasanya [1.1, 1.1] jika dinormalisasi.
 		"""
-		# Filter solusi yang melebihi reference point (didominasi ref point)
-		valid_points = []
-		for point in front:
-			if point[0] <= ref_point[0] and point[1] <= ref_point[1]:
-				valid_points.append(point)
-		
-		if not valid_points:
-			return 0.0
-
-		valid_points = np.array(valid_points)
-		sorted_front = valid_points[np.argsort(valid_points[:, 0])]
-
-		area = 0.0
-
-		for i in range(len(sorted_front)):
-			current_x = sorted_front[i][0]
-			current_y = sorted_front[i][1]
-
-			if i < len(sorted_front) - 1:
-				next_x = sorted_front[i+1][0]
-			else:
-				next_x = ref_point[0]
-			width = next_x - current_x
-			height = ref_point[1] - current_y
-
-			area += width * height
-
-		return area			
+		return Hypervolume.calculate(front, ref_point)
 
 	@staticmethod
 	def _distance_plus(point_a, point_z):
 		"""Modified Euclidean Distance untuk IGD+/GD+ (hanya menghitung degradasi)"""
 		# d+(a, z) = sqrt( sum( max(a_i - z_i, 0)^2 ) )
 		# Jika a lebih baik dari z (lebih kecil), jaraknya 0.
-		diff = np.maximum(point_a - point_z, 0)
-		return np.linalg.norm(diff)
+		diff = np.maximum(np.asarray(point_a) - np.asarray(point_z), 0)
+		return np.sqrt(np.sum(np.square(diff), axis=-1))
+
+	@staticmethod
+	def _min_distance_plus(points, others):
+		"""
+		Untuk setiap titik a di points: min_z d+(a, z) atas semua z di others.
+		Front besar 2 objektif memakai jalur KD-tree, selain itu broadcast per chunk.
+		"""
+		points = np.asarray(points, dtype=float)
+		others = np.asarray(others, dtype=float)
+		if points.shape[1] == 2 and len(points) * len(others) >= PerformanceMetrics.KDTREE_MIN_PAIRS:
+			return PerformanceMetrics._min_distance_plus_kdtree(points, others)
+		return PerformanceMetrics._min_distance_plus_chunked(points, others)
+
+	@staticmethod
+	def _min_distance_plus_chunked(points, others):
+		"""Broadcast (chunk, |others|, M) dengan memori dibatasi CHUNK_ELEMENTS."""
+		chunk = max(1, PerformanceMetrics.CHUNK_ELEMENTS // max(1, others.size))
+		min_dist = np.empty(len(points))
+		for start in range(0, len(points), chunk):
+			block = points[start:start + chunk]
+			dist = PerformanceMetrics._distance_plus(block[:, np.newaxis, :], others[np.newaxis, :, :])
+			min_dist[start:start + chunk] = np.min(dist, axis=1)
+		return min_dist
+
+	@staticmethod
+	def _min_distance_plus_kdtree(points, others):
+		"""
+		Jalur exact untuk 2 objektif.
+		Minimum d+ selalu tercapai di titik maksimal dari others (staircase untuk maksimasi).
+		Untuk titik a, kandidat z di staircase terbagi 3:
+		  - z_x >= a_x            : d+ = max(a_y - z_y, 0) -> terbaik z pertama di kanan a_x
+		  - z_x < a_x, z_y >= a_y : d+ = a_x - z_x         -> terbaik z terakhir di blok tsb
+		  - z_x < a_x, z_y < a_y  : d+ = Euclidean         -> nearest neighbour Euclidean (KD-tree)
+		Karena d+ <= Euclidean untuk semua z, tetangga Euclidean global pasti berada di blok
+		ketiga bila lebih baik dari dua kandidat lain, jadi min dari 3 kandidat = nilai exact.
+		"""
+		# Titik maksimal: urut x menurun, simpan yang y-nya melebihi y maksimum sebelumnya
+		order = np.lexsort((-others[:, 1], -others[:, 0]))
+		sorted_desc = others[order]
+		running_max = np.maximum.accumulate(sorted_desc[:, 1])
+		is_max = np.ones(len(sorted_desc), dtype=bool)
+		is_max[1:] = sorted_desc[1:, 1] > running_max[:-1]
+		staircase = sorted_desc[is_max][::-1] # x naik, y turun
+
+		m = len(staircase)
+		right = np.searchsorted(staircase[:, 0], points[:, 0], side='left')
+		upper = np.searchsorted(-staircase[:, 1], -points[:, 1], side='right')
+		_, nearest = cKDTree(staircase).query(points)
+
+		candidates = np.column_stack((
+			np.clip(right, 0, m - 1),
+			np.clip(np.minimum(right, upper) - 1, 0, m - 1),
+			nearest,
+		))
+		dist = PerformanceMetrics._distance_plus(points[:, np.newaxis, :], staircase[candidates])
+		return np.min(dist, axis=1)
 
 	@staticmethod
 	def calculate_gd_plus(front, ref_front):
@@ -74,15 +107,9 @@ class PerformanceMetrics:
 		Mengukur seberapa dekat Front kita ke Reference Front.
 		Lebih kecil = Lebih baik (Konvergensi).
 		"""
-		sum_dist = 0.0
-		for solution in front:
-			# Cari jarak terdekat ke salah satu solusi di Reference Front
-			min_dist = float('inf')
-			for ref_sol in ref_front:
-				dist = PerformanceMetrics._distance_plus(solution, ref_sol)
-				if dist < min_dist:
-					min_dist = dist
-			sum_dist += min_dist**2 # GD biasanya dikuadratkan dulu
+		# Jarak terdekat setiap solusi ke salah satu solusi di Reference Front
+		min_dist = PerformanceMetrics._min_distance_plus(front, ref_front)
+		sum_dist = np.sum(np.square(min_dist)) # GD biasanya dikuadratkan dulu
 			
 		return np.sqrt(sum_dist) / len(front)
 
@@ -93,18 +120,11 @@ class PerformanceMetrics:
 		Mengukur konvergensi DAN diversity.
 		Loop dari Reference Front ke Front kita.
 		"""
-		sum_dist = 0.0
-		for ref_sol in ref_front:
-			# Cari solusi terdekat di front kita untuk titik referensi ini
-			min_dist = float('inf')
-			for solution in front:
-				# Perhatikan urutan parameter untuk distance plus!
-				# d+(ref, sol) -> kita mau tahu seberapa jauh sol dari ref
-				# Tapi IGD+ mendefinisikan d+(z, a) = max(a - z, 0)
-				# dimana z element Z (Ref), a element A (Approx)
-				dist = PerformanceMetrics._distance_plus(solution, ref_sol)
-				if dist < min_dist:
-					min_dist = dist
-			sum_dist += min_dist # IGD+ biasanya tidak di-akar rata-rata, tapi rata-rata langsung
+		# IGD+ mendefinisikan d+(z, a) = max(a - z, 0), z element Z (Ref), a element A (Approx).
+		# Dengan negasi kedua himpunan: max(a - z, 0) = max((-z) - (-a), 0),
+		# sehingga bentuknya sama dengan GD+ dengan peran titik dibalik.
+		min_dist = PerformanceMetrics._min_distance_plus(-np.asarray(ref_front, dtype=float),
+														 -np.asarray(front, dtype=float))
+		sum_dist = np.sum(min_dist) # IGD+ biasanya tidak di-akar rata-rata, tapi rata-rata langsung
 			
-		return sum_dist / len(ref_front)
\ No newline at end of file
+		return sum_dist / len(ref_front)
@@ -0,0 +1,400 @@
+import argparse
+import json
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from problem import Problem
+from model_cache import ModelCache
+from online_placement import OnlinePlacement
+from nsga2_classic import NSGA2Classic
+from nsga2_hybrid import NSGA2Hybrid
+
+ENGINES = {'hybrid': NSGA2Hybrid, 'classic': NSGA2Classic}
+
+def _worker_main(conn):
+	"""
+	Loop worker persisten. State (OnlinePlacement) setiap Problem dikirim sekali ('load') dan
+	tetap di worker; job berikutnya hanya membawa event, front, dan penempatan deployed.
+	"""
+	states = {}
+	while True:
+		try:
+			message = conn.recv()
+		except EOFError:
+			break
+		command = message[0]
+		if command == 'stop':
+			break
+		if command == 'load':
+			_, problem_id, state = message
+			states[problem_id] = state
+			continue
+		if command == 'drop':
+			states.pop(message[1], None)
+			continue
+
+		_, problem_id, events, front, deployed, params = message
+		try:
+			state = states[problem_id]
+			if events:
+				state.applyEvents(events)
+			state.front = front
+			state.deployed = deployed
+			if command == 'place':
+				state.initialize(None, params.get('seed'), params.get('time_budget'))
+			else:
+				state.reoptimize(params.get('seed'), params.get('time_budget'))
+			conn.send(('ok', {'front': state.front, 'objectives': state.objectives,
+							  'generations': state.lastGenerations, 'elapsed': state.lastElapsed}))
+		except Exception as e:
+			conn.send(('error', f"{type(e).__name__}: {e}"))
+
+class _Worker:
+	"""Satu proses worker persisten + pipe-nya. generation naik setiap kali proses diganti."""
+	def __init__(self, context):
+		self.context = context
+		self.lock = threading.Lock()
+		self.generation = 0
+		self.problems = 0
+		self._start()
+
+	def _start(self):
+		self.conn, child = self.context.Pipe()
+		self.process = self.context.Process(target=_worker_main, args=(child,), daemon=True)
+		self.process.start()
+		child.close()
+
+	def restart(self):
+		"""Hentikan proses (job yang overrun / crash) dan ganti dengan proses baru yang kosong."""
+		if self.process.is_alive():
+			self.process.terminate()
+		self.process.join()
+		self.conn.close()
+		self.generation += 1
+		self._start()
+
+	def stop(self):
+		try:
+			self.conn.send(('stop',))
+		except OSError:
+			pass
+		self.process.join(timeout=1.0)
+		if self.process.is_alive():
+			self.process.terminate()
+			self.process.join()
+		self.conn.close()
+
+def _to_json(value):
+	if isinstance(value, np.generic):
+		return value.item()
+	if isinstance(value, np.ndarray):
+		return value.tolist()
+	raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+class ServiceError(Exception):
+	def __init__(self, status, message):
+		super().__init__(message)
+		self.status = status
+
+class PlacementService:
+	"""
+	Layanan penempatan jangka panjang: Problem & front terakhir (OnlinePlacement) tetap di
+	memori, sehingga request tidak lagi membayar import, load JSON, dan start dari nol.
+
+	Optimasi berjalan di pool `workers` proses persisten. Setiap Problem ditempelkan ke satu
+	worker (yang paling sedikit Problem-nya) dan state-nya dikirim sekali; request berikutnya
+	hanya mengirim event, front, dan penempatan deployed. Proses utama menyimpan salinan
+	state (event divalidasi & diterapkan di sini juga) untuk listing, commit, dan reload.
+	Budget waktu per request (time_budget, detik): engine berhenti setelah generasi yang
+	melewati budget; worker yang tetap tidak menjawab dalam budget + grace dihentikan dan
+	diganti proses baru (504), worker yang crash juga diganti (500). Problem lain di worker
+	itu dikirim ulang dari salinan di proses utama pada request berikutnya.
+	Request untuk Problem yang sama diserialkan, termasuk load ulang id yang sama; Problem
+	di worker berbeda berjalan paralel. Jumlah Problem di cache dibatasi maxProblems (LRU),
+	id yang tergeser dilaporkan di field 'evicted' jawaban /problems.
+
+	Endpoint (JSON):
+	  GET  /health, /problems
+	  POST /problems   {"id"?, "path" | "data", "engine"?, "population"?, "generations"?,
+	                    "migration_objective"?, "local_search"?}
+	  POST /place      {"problem", "placement"?, "seed"?, "time_budget"?, "select"?, "commit"?}
+	  POST /reoptimize {"problem", "events", "seed"?, "time_budget"?, "select"?, "commit"?}
+	  POST /commit     {"problem", "placement"}
+	Jawaban place/reoptimize: front objektif, semua placement, dan placement terpilih
+	(select: 'balanced' | 'min_power' | 'min_net'), yang langsung di-commit kecuali commit=false.
+	"""
+	def __init__(self, workers=None, maxProblems=16, defaultTimeBudget=30.0, grace=10.0):
+		context = multiprocessing.get_context()
+		self.workers = [_Worker(context) for _ in range(workers or os.cpu_count() or 1)]
+		self.maxProblems = maxProblems
+		self.defaultTimeBudget = defaultTimeBudget
+		self.grace = grace
+		self.entries = OrderedDict()
+		self.lock = threading.Lock()
+
+	def shutdown(self):
+		for worker in self.workers:
+			worker.stop()
+
+	def handle(self, method, path, payload):
+		"""Dispatch satu request. Return dict jawaban atau raise ServiceError."""
+		routes = {
+			('GET', '/health'): lambda _: {'status': 'ok', 'problems': len(self.entries)},
+			('GET', '/problems'): self.listProblems,
+			('POST', '/problems'): self.loadProblem,
+			('POST', '/place'): self.place,
+			('POST', '/reoptimize'): self.reoptimize,
+			('POST', '/commit'): self.commit,
+		}
+		route = routes.get((method, path))
+		if route is None:
+			raise ServiceError(404, f"Unknown endpoint: {method} {path}")
+		return route(payload)
+
+	# ==== Cache Problem ====
+	def _entry(self, problem_id):
+		with self.lock:
+			if problem_id not in self.entries:
+				raise ServiceError(404, f"Unknown problem: {problem_id}")
+			self.entries.move_to_end(problem_id)
+			return self.entries[problem_id]
+
+	def listProblems(self, _=None):
+		with self.lock:
+			return {'problems': [{'id': problem_id, 'num_vms': entry['state'].problem.N_V,
+								  'num_servers': entry['state'].problem.N_P,
+								  'front_size': len(entry['state'].front)}
+								 for problem_id, entry in self.entries.items()]}
+
+	def loadProblem(self, payload):
+		problem = Problem()
+		if 'path' in payload:
+			problem.loadFromFile(payload['path'])
+		elif 'data' in payload:
+			problem.loadFromDict(payload['data'])
+		else:
+			raise ServiceError(400, "Either 'path' or 'data' is required")
+
+		engine = payload.get('engine', 'hybrid')
+		if engine not in ENGINES:
+			raise ServiceError(400, f"Unknown engine: {engine}")
+		problem_id = payload.get('id') or ModelCache.key(problem)[:16]
+		state = OnlinePlacement(problem, ENGINES[engine],
+								populationSize=payload.get('population', 50),
+								maxGeneration=payload.get('generations', 100),
+								migrationObjective=payload.get('migration_objective', False),
+								localSearch=payload.get('local_search', False))
+
+		evicted = []
+		with self.lock:
+			entry = self.entries.get(problem_id)
+			if entry is None:
+				worker = min(range(len(self.workers)), key=lambda k: self.workers[k].problems)
+				self.workers[worker].problems += 1
+				# loaded: generation worker yang sudah menerima state ini (None = belum)
+				entry = {'state': state, 'lock': threading.Lock(), 'worker': worker, 'loaded': None}
+				self.entries[problem_id] = entry
+			self.entries.move_to_end(problem_id)
+			while len(self.entries) > self.maxProblems:
+				evicted.append(self.entries.popitem(last=False))
+				self.workers[evicted[-1][1]['worker']].problems -= 1
+		if entry['state'] is not state:
+			# Id sudah terdaftar: ganti state di bawah lock entry yang sama, setelah
+			# request yang sedang berjalan selesai; worker menerima state baru di job berikutnya
+			with entry['lock']:
+				entry['state'] = state
+				entry['loaded'] = None
+		for evicted_id, evicted_entry in evicted:
+			self._drop(evicted_id, evicted_entry)
+		return {'id': problem_id, 'num_vms': problem.N_V, 'num_servers': problem.N_P,
+				'evicted': [evicted_id for evicted_id, _ in evicted]}
+
+	def _drop(self, problem_id, entry):
+		# Lepaskan state di worker (setelah job yang sedang berjalan di worker itu selesai)
+		worker = self.workers[entry['worker']]
+		with entry['lock'], worker.lock:
+			if entry['loaded'] == worker.generation:
+				worker.conn.send(('drop', problem_id))
+
+	# ==== Optimasi ====
+	def place(self, payload):
+		return self._optimize('place', payload)
+
+	def reoptimize(self, payload):
+		return self._optimize('reoptimize', payload)
+
+	def _optimize(self, action, payload):
+		problem_id = payload.get('problem')
+		entry = self._entry(problem_id)
+		budget = payload.get('time_budget', self.defaultTimeBudget)
+		params = {'seed': payload.get('seed'), 'time_budget': budget}
+
+		with entry['lock']:
+			state = entry['state']
+			events = []
+			if action == 'reoptimize':
+				# Event divalidasi & diterapkan di salinan proses utama dulu: batch invalid ditolak
+				# sebelum sampai ke worker, dan tidak hilang jika worker gagal
+				events = payload.get('events', [])
+				try:
+					state.applyEvents(events)
+				except (KeyError, IndexError, ValueError, TypeError) as e:
+					raise ServiceError(400, f"Invalid events: {e}")
+			elif payload.get('placement') is not None:
+				if len(payload['placement']) != state.problem.N_V:
+					raise ServiceError(400, "Placement must list one server per VM")
+				state.commit(payload['placement'])
+
+			start = time.time()
+			result = self._execute(problem_id, entry, action, events, params,
+								   budget + self.grace if budget is not None else None)
+			state.front = result['front']
+			state.objectives = result['objectives']
+			state.pendingChanges = 0
+			state.lastGenerations = result['generations']
+			state.lastElapsed = result['elapsed']
+
+			response = self._frontResponse(state, payload.get('select', 'balanced'))
+			if response['chosen'] is not None and payload.get('commit', True):
+				state.commit(response['chosen']['placement'])
+			response['elapsed'] = time.time() - start
+			return response
+
+	def _execute(self, problem_id, entry, action, events, params, timeout):
+		"""
+		Jalankan job di worker milik Problem. State dikirim penuh hanya jika worker belum
+		memilikinya (pertama kali, setelah reload, atau setelah worker diganti).
+		"""
+		worker = self.workers[entry['worker']]
+		deadline = time.time() + timeout if timeout is not None else None
+		if not worker.lock.acquire(timeout=timeout if timeout is not None else -1):
+			raise ServiceError(504, f"Worker stayed busy beyond the time budget ({params['time_budget']}s)")
+		try:
+			if not worker.process.is_alive():
+				# Worker mati saat idle: ganti, state dikirim ulang di bawah
+				worker.restart()
+			state = entry['state']
+			if entry['loaded'] != worker.generation:
+				worker.conn.send(('load', problem_id, state))
+				entry['loaded'] = worker.generation
+				# Salinan yang dikirim sudah memuat event batch ini
+				events = []
+			worker.conn.send((action, problem_id, events, state.front, state.deployed, params))
+
+			remaining = max(0.0, deadline - time.time()) if deadline is not None else None
+			if not worker.conn.poll(remaining):
+				worker.restart()
+				raise ServiceError(504, f"Request exceeded time budget ({params['time_budget']}s)")
+			try:
+				status, value = worker.conn.recv()
+			except EOFError:
+				worker.process.join()
+				exitcode = worker.process.exitcode
+				worker.restart()
+				raise ServiceError(500, f"Worker exited unexpectedly (exit code {exitcode})")
+		finally:
+			worker.lock.release()
+
+		if status != 'ok':
+			raise ServiceError(500, value)
+		return value
+
+	def commit(self, payload):
+		entry = self._entry(payload.get('problem'))
+		placement = payload.get('placement')
+		with entry['lock']:
+			if placement is None or len(placement) != entry['state'].problem.N_V:
+				raise ServiceError(400, "Placement must list one server per VM")
+			entry['state'].commit(placement)
+		return {'id': payload.get('problem'), 'committed': True}
+
+	@staticmethod
+	def _select(objectives, select):
+		power = np.array([obj['power_consumption'] for obj in objectives], dtype=float)
+		net = np.array([obj['net_communication'] for obj in objectives], dtype=float)
+		if select == 'min_power':
+			return int(np.lexsort((net, power))[0])
+		if select == 'min_net':
+			return int(np.lexsort((power, net))[0])
+		if select != 'balanced':
+			raise ServiceError(400, f"Unknown select strategy: {select}")
+		# Jumlah objektif ternormalisasi terkecil (titik "knee" sederhana)
+		scale = lambda values: (values - values.min()) / ((values.max() - values.min()) or 1.0)
+		return int(np.argmin(scale(power) + scale(net)))
+
+	def _frontResponse(self, state, select):
+		keys = list(state.objectives[0].keys()) if state.objectives else []
+		chosen = None
+		if state.objectives:
+			idx = self._select(state.objectives, select)
+			chosen = {'index': idx, 'placement': state.front[idx]}
+		return {
+			'objectives': keys,
+			'front': [[obj[key] for key in keys] for obj in state.objectives],
+			'placements': state.front,
+			'chosen': chosen,
+			'generations': state.lastGenerations,
+		}
+
+def _make_handler(service):
+	class PlacementRequestHandler(BaseHTTPRequestHandler):
+		def _reply(self, status, body):
+			data = json.dumps(body, default=_to_json).encode()
+			self.send_response(status)
+			self.send_header('Content-Type', 'application/json')
+			self.send_header('Content-Length', str(len(data)))
+			self.end_headers()
+			self.wfile.write(data)
+
+		def _dispatch(self, method):
+			try:
+				payload = {}
+				length = int(self.headers.get('Content-Length') or 0)
+				if length:
+					payload = json.loads(self.rfile.read(length))
+				self._reply(200, service.handle(method, self.path, payload))
+			except ServiceError as e:
+				self._reply(e.status, {'error': str(e)})
+			except (ValueError, OSError) as e:
+				self._reply(400, {'error': str(e)})
+			except Exception as e:
+				self._reply(500, {'error': f"{type(e).__name__}: {e}"})
+
+		def do_GET(self):
+			self._dispatch('GET')
+
+		def do_POST(self):
+			self._dispatch('POST')
+
+		def log_message(self, format, *args):
+			print(f"[Service] {self.address_string()} {format % args}")
+
+	return PlacementRequestHandler
+
+def serve(host='127.0.0.1', port=8765, workers=None, maxProblems=16, defaultTimeBudget=30.0):
+	service = PlacementService(workers, maxProblems, defaultTimeBudget)
+	server = ThreadingHTTPServer((host, port), _make_handler(service))
+	print(f"[Service] Listening on http://{host}:{server.server_address[1]}")
+	try:
+		server.serve_forever()
+	except KeyboardInterrupt:
+		pass
+	finally:
+		server.server_close()
+		service.shutdown()
+
+if __name__ == "__main__":
+	parser = argparse.ArgumentParser(description="Long-lived VM placement service (JSON over HTTP)")
+	parser.add_argument('--host', default='127.0.0.1')
+	parser.add_argument('--port', type=int, default=8765)
+	parser.add_argument('--workers', type=int, default=None)
+	parser.add_argument('--max-problems', type=int, default=16)
+	parser.add_argument('--time-budget', type=float, default=30.0)
+	args = parser.parse_args()
+	serve(args.host, args.port, args.workers, args.max_problems, args.time_budget)
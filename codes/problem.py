@@ -22,10 +22,17 @@ class Problem:
 		e_vector: np.ndarray = None
 		g_vector: np.ndarray = None
 
+		# Penempatan sebelumnya (server per VM, -1 = VM baru) untuk objektif jumlah migrasi.
+		# None = objektif migrasi tidak dipakai.
+		self.previous_placement = None
+
 	def loadFromFile(self, filepath):
 		with open(filepath, 'r') as f:
 			data = json.load(f)
+		self.loadFromDict(data)
 
+	def loadFromDict(self, data):
+		"""Isi Problem dari dict berformat sama dengan file dataset JSON."""
 		self.N_P = data['meta']['num_servers']
 		self.N_V = data['meta']['num_vms']
 
@@ -46,3 +53,128 @@ class Problem:
 
 		self.e_vector = np.array(data['e_vector'])
 		self.g_vector = np.array(data['g_vector'])
+
+
+	def applyEvents(self, events):
+		"""
+		Menerapkan event perubahan VM ke Problem secara in-place (tanpa reload file).
+
+		Event (dict):
+		  {'type': 'add', 'v_cpu', 'v_mem', 'e': trafik eksternal,
+		   'traffic': {vm_idx: trafik}}      -> VM baru ditambahkan di akhir
+		  {'type': 'remove', 'vm': vm_idx}
+		  {'type': 'resize', 'vm': vm_idx, 'v_cpu', 'v_mem'}  (field opsional)
+		Semua vm_idx >= 0 mengacu pada penomoran sebelum batch event ini. Peer trafik negatif
+		mengacu pada VM yang ditambahkan di batch yang sama: -1 = event add pertama, -2 = kedua,
+		dst. Trafik VM baru dibuat simetris (jika dua VM baru saling menyebut, nilai terbesar
+		yang dipakai).
+
+		Return (vm_map, new_vms): vm_map[old_idx] = indeks baru atau -1 jika dihapus,
+		new_vms = indeks VM yang ditambahkan.
+
+		Semua event divalidasi dulu (field wajib, 0 <= vm_idx < N_V, peer trafik valid) dan
+		array baru dibangun lengkap sebelum di-assign, sehingga batch yang gagal
+		(ValueError / IndexError) tidak mengubah Problem sama sekali.
+		"""
+		adds = self._validateEvents(events)
+
+		keep = np.ones(self.N_V, dtype=bool)
+		v_cpu = self.v_cpu.astype(float)
+		v_mem = self.v_mem.astype(float)
+		for event in events:
+			if event['type'] == 'remove':
+				keep[int(event['vm'])] = False
+			elif event['type'] == 'resize':
+				vm_idx = int(event['vm'])
+				v_cpu[vm_idx] = event.get('v_cpu', v_cpu[vm_idx])
+				v_mem[vm_idx] = event.get('v_mem', v_mem[vm_idx])
+
+		vm_map = np.full(self.N_V, -1)
+		vm_map[keep] = np.arange(np.count_nonzero(keep))
+
+		# Trafik VM baru ke VM lama (penomoran lama), VM lama yang dihapus diabaikan
+		new_traffic = np.zeros((len(adds), self.N_V))
+		# Trafik antar VM baru dalam batch yang sama (peer negatif)
+		batch_traffic = np.zeros((len(adds), len(adds)))
+		for row, event in enumerate(adds):
+			for peer, value in event.get('traffic', {}).items():
+				peer = int(peer)
+				if peer >= 0:
+					new_traffic[row, peer] = value
+				else:
+					other = -peer - 1
+					batch_traffic[row, other] = batch_traffic[other, row] = max(batch_traffic[row, other], value)
+		new_traffic = new_traffic[:, keep]
+
+		kept = np.count_nonzero(keep)
+		size = kept + len(adds)
+		T_matrix = np.zeros((size, size))
+		T_matrix[:kept, :kept] = self.T_matrix[np.ix_(keep, keep)]
+		T_matrix[kept:, :kept] = new_traffic
+		T_matrix[:kept, kept:] = new_traffic.T
+		T_matrix[kept:, kept:] = batch_traffic
+
+		new_v_cpu = np.concatenate([v_cpu[keep], [float(event['v_cpu']) for event in adds]])
+		new_v_mem = np.concatenate([v_mem[keep], [float(event['v_mem']) for event in adds]])
+		new_e_vector = np.concatenate([self.e_vector[keep], [float(event.get('e', 0.0)) for event in adds]])
+		previous = None
+		if self.previous_placement is not None:
+			previous = np.concatenate([np.asarray(self.previous_placement)[keep], np.full(len(adds), -1)])
+
+		# Semua array sudah jadi: baru sekarang Problem diubah
+		self.v_cpu, self.v_mem, self.e_vector = new_v_cpu, new_v_mem, new_e_vector
+		self.T_matrix = T_matrix
+		self.N_V = size
+		if previous is not None:
+			self.previous_placement = previous
+
+		return vm_map, list(range(kept, size))
+
+	def _validateEvents(self, events):
+		"""Periksa semua event tanpa mengubah apa pun. Return list event add (urutan batch)."""
+		adds = [event for event in events if isinstance(event, dict) and event.get('type') == 'add']
+		for position, event in enumerate(events):
+			if not isinstance(event, dict) or 'type' not in event:
+				raise ValueError(f"Event {position} must be an object with a 'type' field")
+			kind = event['type']
+			if kind == 'add':
+				for field in ('v_cpu', 'v_mem'):
+					if field not in event:
+						raise ValueError(f"Event {position} (add) is missing '{field}'")
+				for peer in event.get('traffic', {}):
+					peer = int(peer)
+					if peer >= self.N_V:
+						raise IndexError(f"Event {position} (add): traffic peer {peer} out of range (N_V={self.N_V})")
+					if peer < 0 and (-peer - 1 >= len(adds) or adds[-peer - 1] is event):
+						raise IndexError(f"Event {position} (add): invalid new-VM traffic peer {peer} ({len(adds)} adds in batch)")
+			elif kind in ('remove', 'resize'):
+				if 'vm' not in event:
+					raise ValueError(f"Event {position} ({kind}) is missing 'vm'")
+				vm_idx = int(event['vm'])
+				# Indeks negatif hanya berlaku untuk peer trafik, bukan untuk remove/resize
+				if not 0 <= vm_idx < self.N_V:
+					raise IndexError(f"Event {position} ({kind}): vm {vm_idx} out of range (N_V={self.N_V})")
+			else:
+				raise ValueError(f"Unknown event type: {kind}")
+		return adds
+
+	def subProblem(self, vm_indices, server_indices):
+		"""Problem baru yang hanya berisi VM & server terpilih (penomoran lokal sesuai urutan indeks)."""
+		vm_indices = np.asarray(vm_indices, dtype=int)
+		server_indices = np.asarray(server_indices, dtype=int)
+
+		sub = Problem()
+		sub.N_V = len(vm_indices)
+		sub.N_P = len(server_indices)
+		sub.v_cpu = self.v_cpu[vm_indices]
+		sub.v_mem = self.v_mem[vm_indices]
+		sub.e_vector = self.e_vector[vm_indices]
+		sub.T_matrix = self.T_matrix[np.ix_(vm_indices, vm_indices)]
+		sub.p_cpu = self.p_cpu[server_indices]
+		sub.p_mem = self.p_mem[server_indices]
+		sub.p_net = self.p_net[server_indices]
+		sub.PC_idle = self.PC_idle[server_indices]
+		sub.PC_max = self.PC_max[server_indices]
+		sub.g_vector = self.g_vector[server_indices]
+		sub.C_matrix = self.C_matrix[np.ix_(server_indices, server_indices)]
+		return sub
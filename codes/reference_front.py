@@ -0,0 +1,81 @@
+import hashlib
+import numpy as np
+
+class ReferenceFrontBuilder:
+	"""
+	Per-scenario reference fronts, built incrementally as fronts stream in.
+	Each scenario keeps its non-dominated set (sorted by power) and the objective
+	bounds of every point seen so far, used for normalization.
+	"""
+	def __init__(self):
+		self.fronts = {}
+		self.min_objectives = {}
+		self.max_objectives = {}
+		# Naik setiap kali front / bounds sebuah skenario berubah
+		self.versions = {}
+
+	def __contains__(self, scenario):
+		return scenario in self.fronts
+
+	def scenarios(self):
+		return list(self.fronts.keys())
+
+	def add(self, scenario, points):
+		"""Merge new objective points into the scenario's reference front. Returns True if it changed."""
+		points = np.asarray(points, dtype=float).reshape(-1, 2)
+		if len(points) == 0:
+			return False
+
+		if scenario not in self.fronts:
+			self.fronts[scenario] = np.empty((0, 2))
+			self.min_objectives[scenario] = np.min(points, axis=0)
+			self.max_objectives[scenario] = np.max(points, axis=0)
+			self.versions[scenario] = 0
+			changed = True
+		else:
+			new_min = np.minimum(self.min_objectives[scenario], np.min(points, axis=0))
+			new_max = np.maximum(self.max_objectives[scenario], np.max(points, axis=0))
+			changed = not (np.array_equal(new_min, self.min_objectives[scenario]) and
+						   np.array_equal(new_max, self.max_objectives[scenario]))
+			self.min_objectives[scenario] = new_min
+			self.max_objectives[scenario] = new_max
+
+		merged = ReferenceFrontBuilder.nonDominated(np.vstack((self.fronts[scenario], points)))
+		if not np.array_equal(merged, self.fronts[scenario]):
+			self.fronts[scenario] = merged
+			changed = True
+
+		if changed:
+			self.versions[scenario] += 1
+		return changed
+
+	def getFront(self, scenario):
+		return self.fronts.get(scenario, np.empty((0, 2)))
+
+	def fingerprint(self, scenario):
+		"""Content hash of the scenario's front and bounds; stable across processes (unlike versions)."""
+		digest = hashlib.sha1()
+		for arr in (self.fronts[scenario], self.min_objectives[scenario], self.max_objectives[scenario]):
+			digest.update(np.ascontiguousarray(arr, dtype=float).tobytes())
+		return digest.hexdigest()
+
+	def normalize(self, scenario, front):
+		range_vals = self.max_objectives[scenario] - self.min_objectives[scenario]
+		range_vals[range_vals == 0] = 1.0
+		return (np.asarray(front) - self.min_objectives[scenario]) / range_vals
+
+	@staticmethod
+	def nonDominated(points):
+		"""
+		2D skyline in O(n log n): sort by (power, net) and keep a point only if its net
+		is strictly below every net before it. Duplicate points are kept once.
+		"""
+		if len(points) == 0:
+			return np.empty((0, 2))
+		order = np.lexsort((points[:, 1], points[:, 0]))
+		sorted_points = points[order]
+
+		prev_min = np.empty(len(sorted_points))
+		prev_min[0] = np.inf
+		prev_min[1:] = np.minimum.accumulate(sorted_points[:-1, 1])
+		return sorted_points[sorted_points[:, 1] < prev_min]
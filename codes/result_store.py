@@ -0,0 +1,148 @@
+import glob
+import json
+import os
+import re
+import numpy as np
+import pandas as pd
+
+class ResultStore:
+	"""
+	Append-only store for the final fronts of every run, replacing one CSV per run.
+
+	Two files, regardless of the number of runs:
+	  fronts.f64   : all objective rows [power, net] as raw float64, appended back to back
+	  index.jsonl  : one line per run {scenario, algorithm, run, offset, count}
+
+	An append writes (and fsyncs) the rows before the index line that points to them,
+	so a crash can only leave unreferenced trailing bytes or a partial last index line;
+	both are discarded when the store is opened. Loading memory-maps the data file and
+	reads only the rows of the selected runs. A later entry for the same
+	(scenario, algorithm, run) supersedes the earlier one. Single writer only.
+	"""
+	ROW_WIDTH = 2
+	ROW_BYTES = ROW_WIDTH * 8
+
+	def __init__(self, root):
+		self.root = root
+		self.data_path = os.path.join(root, 'fronts.f64')
+		self.index_path = os.path.join(root, 'index.jsonl')
+		os.makedirs(root, exist_ok=True)
+
+		# Format: self.entries[(scenario, algorithm, run)] = (offset, count)
+		self.entries = {}
+		self._recover()
+
+	def _recover(self):
+		valid_bytes = 0
+		data_end = 0
+		if os.path.exists(self.index_path):
+			with open(self.index_path, 'rb') as f:
+				for line in f:
+					if not line.endswith(b'\n'):
+						break # Partial line dari append yang terputus
+					try:
+						entry = json.loads(line)
+					except ValueError:
+						break
+					key = (entry['scenario'], entry['algorithm'], int(entry['run']))
+					self.entries[key] = (entry['offset'], entry['count'])
+					data_end = max(data_end, entry['offset'] + entry['count'])
+					valid_bytes += len(line)
+
+			if valid_bytes < os.path.getsize(self.index_path):
+				with open(self.index_path, 'r+b') as f:
+					f.truncate(valid_bytes)
+
+		# Buang baris data yang belum sempat direferensikan index
+		if os.path.exists(self.data_path) and os.path.getsize(self.data_path) > data_end * self.ROW_BYTES:
+			with open(self.data_path, 'r+b') as f:
+				f.truncate(data_end * self.ROW_BYTES)
+
+	def __len__(self):
+		return len(self.entries)
+
+	def has(self, scenario, algorithm, run):
+		return (scenario, algorithm, int(run)) in self.entries
+
+	def keys(self, scenario=None, algorithm=None):
+		"""Sorted (scenario, algorithm, run) keys, optionally filtered."""
+		return sorted(key for key in self.entries
+					  if (scenario is None or key[0] == scenario) and
+						 (algorithm is None or key[1] == algorithm))
+
+	def append(self, scenario, algorithm, run, front):
+		self.appendMany([(scenario, algorithm, run, front)])
+
+	def appendMany(self, records):
+		"""Append [(scenario, algorithm, run, front), ...] with one data write and one index write."""
+		if not records:
+			return
+		offset = os.path.getsize(self.data_path) // self.ROW_BYTES if os.path.exists(self.data_path) else 0
+
+		blocks = []
+		lines = []
+		new_entries = {}
+		for scenario, algorithm, run, front in records:
+			rows = np.ascontiguousarray(front, dtype='<f8').reshape(-1, self.ROW_WIDTH)
+			blocks.append(rows.tobytes())
+			key = (scenario, algorithm, int(run))
+			new_entries[key] = (offset, len(rows))
+			lines.append(json.dumps({'scenario': scenario, 'algorithm': algorithm, 'run': int(run),
+									 'offset': offset, 'count': len(rows)}) + '\n')
+			offset += len(rows)
+
+		# 1. Data dulu (fsync), 2. baru index yang menunjuk ke data tsb
+		with open(self.data_path, 'ab') as f:
+			f.write(b''.join(blocks))
+			f.flush()
+			os.fsync(f.fileno())
+		with open(self.index_path, 'a') as f:
+			f.write(''.join(lines))
+			f.flush()
+			os.fsync(f.fileno())
+
+		self.entries.update(new_entries)
+
+	def load(self, scenario=None, algorithm=None):
+		"""Return {(scenario, algorithm, run): array (N, 2)} for the selected runs."""
+		selected = self.keys(scenario, algorithm)
+		if not selected or not os.path.exists(self.data_path) or os.path.getsize(self.data_path) == 0:
+			return {key: np.empty((0, self.ROW_WIDTH)) for key in selected}
+
+		data = np.memmap(self.data_path, dtype='<f8', mode='r').reshape(-1, self.ROW_WIDTH)
+		fronts = {}
+		for key in selected:
+			offset, count = self.entries[key]
+			# np.array menyalin sehingga memmap bisa ditutup
+			fronts[key] = np.array(data[offset:offset + count])
+		del data
+		return fronts
+
+	def importCsvTree(self, base_dir):
+		"""
+		Import the legacy raw_fronts/<scenario>/<Algorithm>_r<k>.csv tree in one append.
+		Runs that are already in the store are skipped. Returns the number imported.
+		"""
+		records = []
+		for fpath in glob.glob(os.path.join(base_dir, "**", "*.csv"), recursive=True):
+			fname = os.path.basename(fpath)
+			scenario = os.path.basename(os.path.dirname(fpath))
+
+			algo = None
+			if "Classic" in fname: algo = 'Classic'
+			elif "Hybrid" in fname: algo = 'Hybrid'
+			match = re.search(r'_r(\d+)', fname)
+			if algo is None or match is None:
+				continue
+
+			run = int(match.group(1))
+			if self.has(scenario, algo, run):
+				continue
+			try:
+				df = pd.read_csv(fpath)
+				records.append((scenario, algo, run, df[['Power', 'Net']].values))
+			except Exception as e:
+				print(f"   [Warn] Failed to import {fname}: {e}")
+
+		self.appendMany(records)
+		return len(records)
@@ -0,0 +1,53 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Modul di codes/ diimpor dengan nama datar (from problem import Problem)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from problem import Problem
+from problem_generator import generateProblem, getFatTreeCost
+
+@pytest.fixture(scope='session')
+def generated_file(tmp_path_factory):
+	"""Factory path JSON hasil problem_generator, di-cache per (scenario, seed)."""
+	def path(scenario, seed):
+		target = tmp_path_factory.getbasetemp() / 'problems' / f"{scenario}_{seed}.json"
+		if not target.exists():
+			generateProblem(str(target), scenario, seed)
+		return str(target)
+	return path
+
+@pytest.fixture(scope='session')
+def generated(generated_file):
+	"""Factory Problem hasil problem_generator (objek baru setiap panggilan)."""
+	def load(scenario, seed):
+		problem = Problem()
+		problem.loadFromFile(generated_file(scenario, seed))
+		return problem
+	return load
+
+@pytest.fixture(scope='session')
+def tight_problem():
+	"""Factory instance kecil (default 6 VM x 4 server) dengan kapasitas ketat agar front berisi beberapa titik."""
+	def build(seed, num_vms=6, num_servers=4):
+		rng = np.random.default_rng(seed)
+		problem = Problem()
+		problem.N_V, problem.N_P = num_vms, num_servers
+		problem.v_cpu = rng.choice([1.0, 2.0, 4.0], num_vms)
+		problem.v_mem = rng.choice([2.0, 4.0, 8.0], num_vms)
+		problem.p_cpu = rng.choice([4.0, 6.0, 8.0], num_servers)
+		problem.p_mem = rng.choice([16.0, 32.0], num_servers)
+		problem.p_net = rng.uniform(3, 10, num_servers)
+		problem.PC_idle = rng.uniform(50, 150, num_servers)
+		problem.PC_max = problem.PC_idle + rng.uniform(50, 400, num_servers)
+		T = np.triu(rng.uniform(0, 2, (num_vms, num_vms)) * (rng.random((num_vms, num_vms)) < 0.5), 1)
+		problem.T_matrix = T + T.T
+		problem.C_matrix = np.array([[getFatTreeCost(a, b, 2, 2) for b in range(num_servers)]
+									 for a in range(num_servers)], dtype=float)
+		problem.e_vector = rng.uniform(0, 0.5, num_vms)
+		problem.g_vector = np.full(num_servers, 4.0)
+		return problem
+	return build
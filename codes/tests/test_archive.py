@@ -0,0 +1,16 @@
+import numpy as np
+import pytest
+
+from archive import ParetoArchive
+
+@pytest.mark.parametrize('maxSize', [0, 1])
+def test_rejects_archive_smaller_than_two(maxSize):
+	with pytest.raises(ValueError):
+		ParetoArchive(maxSize)
+
+@pytest.mark.parametrize('pruning', ['crowding', 'hypervolume'])
+def test_smallest_archive_keeps_extremes(pruning):
+	archive = ParetoArchive(2, pruning)
+	for power, net in [(1, 5), (3, 3), (2, 4), (5, 1)]:
+		archive.add(power, net)
+	np.testing.assert_array_equal(archive.toArray(), [[1, 5], [5, 1]])
@@ -0,0 +1,21 @@
+import pytest
+
+from convergence_trace import ConvergenceTrace
+from nsga2_classic import NSGA2Classic
+from nsga2_steady_state import NSGA2SteadyStateClassic
+
+@pytest.mark.parametrize('engine_class', [NSGA2Classic, NSGA2SteadyStateClassic])
+def test_time_limited_run_records_last_generation(generated, tmp_path, engine_class):
+	path = str(tmp_path / 'trace.npy')
+	engine = engine_class(generated('small', 11), populationSize=10, maxGeneration=100000)
+	engine.setSeed(3)
+	engine.enableTrace(path, every=1000)
+	engine.setTimeLimit(0.5)
+	engine.run(verbose=False)
+
+	records = ConvergenceTrace.load(path)
+	assert 0 < engine.generationsDone < 1000
+	# Generasi 0 dan generasi terakhir sebelum timeLimit, walau bukan kelipatan `every`
+	assert [generation for generation, _, _ in records] == [0, engine.generationsDone]
+	assert records[-1][1] <= engine.evaluations
+	assert len(records[-1][2]) > 0
@@ -0,0 +1,66 @@
+import itertools
+import random
+
+import pytest
+
+import decomposition as decomposition_module
+from archive import ParetoArchive
+from decomposition import PodDecomposition
+from individual_classic import IndividualClassic
+
+def test_large_instance_splits_into_clusters_and_pods(generated):
+	problem = generated('large', 2)
+	decomposition = PodDecomposition(problem, workers=4)
+
+	# Noise antar-cluster generator (<= 1e-3) tidak boleh menyambung cluster
+	assert len(decomposition.trafficClusters()) > 1
+	parts = decomposition.partition()
+	assert len(parts) > 1
+	assert sum(len(vms) for vms, _ in parts) == problem.N_V
+
+def test_solve_returns_feasible_global_front(generated):
+	problem = generated('small', 3)
+	decomposition = PodDecomposition(problem, populationSize=20, maxGeneration=5, workers=2)
+	decomposition.setSeed(1)
+	archive = decomposition.solve(verbose=False)
+
+	assert len(archive) > 0
+	for power, net, chromosome in archive:
+		individual = IndividualClassic(problem, list(chromosome))
+		individual.evaluateFull()
+		assert not individual.isConstraintViolated
+		assert individual.objectives['power_consumption'] == pytest.approx(power)
+		assert individual.objectives['net_communication'] == pytest.approx(net)
+
+def test_single_pod_runs_without_process_pool(generated, monkeypatch):
+	def no_pool(*args, **kwargs):
+		raise AssertionError("single pod must not start a process pool")
+	monkeypatch.setattr(decomposition_module, 'ProcessPoolExecutor', no_pool)
+
+	decomposition = PodDecomposition(generated('small', 3), populationSize=10, maxGeneration=2, workers=2, minPods=1)
+	archive = decomposition.solve(verbose=False)
+	assert len(decomposition.parts) == 1
+	assert len(archive) > 0
+
+@pytest.mark.parametrize('seed', range(5))
+def test_merge_prunes_only_the_final_front(generated, seed):
+	rng = random.Random(seed)
+	subfronts = []
+	for _ in range(3):
+		powers = sorted(rng.sample(range(100), 4))
+		nets = sorted(rng.sample(range(100), 4), reverse=True)
+		subfronts.append([(float(power), float(net), []) for power, net in zip(powers, nets)])
+
+	decomposition = PodDecomposition(generated('small', 3), maxFrontSize=5)
+	combos = decomposition._merge(subfronts)
+
+	# Referensi: front non-dominated eksak dari seluruh kombinasi, baru dipangkas ke maxFrontSize
+	expected = ParetoArchive()
+	for combo in itertools.product(range(4), repeat=3):
+		expected.add(sum(subfronts[k][idx][0] for k, idx in enumerate(combo)),
+					 sum(subfronts[k][idx][1] for k, idx in enumerate(combo)), combo)
+	expected.shrink(5)
+
+	points = sorted((sum(subfronts[k][idx][0] for k, idx in enumerate(combo)),
+					 sum(subfronts[k][idx][1] for k, idx in enumerate(combo))) for combo in combos)
+	assert points == [(power, net) for power, net, _ in expected]
@@ -0,0 +1,36 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from exact_solver import ExactParetoSolver
+from individual_classic import IndividualClassic
+from reference_front import ReferenceFrontBuilder
+
+def _evaluate(problem, assignment):
+	individual = IndividualClassic(problem, list(assignment))
+	individual.evaluateFull()
+	return individual
+
+@pytest.mark.parametrize('seed', range(10))
+def test_exact_front_matches_brute_force(tight_problem, seed):
+	problem = tight_problem(seed)
+	solver = ExactParetoSolver(problem)
+	front = solver.solve()
+	assert solver.optimal
+
+	points = []
+	for assignment in itertools.product(range(problem.N_P), repeat=problem.N_V):
+		individual = _evaluate(problem, assignment)
+		if not individual.isConstraintViolated:
+			points.append((individual.objectives['power_consumption'], individual.objectives['net_communication']))
+	expected = ReferenceFrontBuilder.nonDominated(np.array(points)) if points else np.empty((0, 2))
+
+	assert front.shape == expected.shape
+	np.testing.assert_allclose(front, expected, rtol=1e-9, atol=1e-9)
+	# Setiap titik punya assignment feasible yang benar-benar menghasilkan objektif tersebut
+	for assignment, (power, net) in zip(solver.solutions, front):
+		individual = _evaluate(problem, [int(server) for server in assignment])
+		assert not individual.isConstraintViolated
+		assert individual.objectives['power_consumption'] == pytest.approx(power)
+		assert individual.objectives['net_communication'] == pytest.approx(net)
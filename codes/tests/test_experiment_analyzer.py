@@ -0,0 +1,7 @@
+import pytest
+
+from experiment_analyzer import ExperimentAnalyzer
+
+def test_load_from_store_requires_store():
+	with pytest.raises(ValueError, match="No result store"):
+		ExperimentAnalyzer().loadResultsFromStore()
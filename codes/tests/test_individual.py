@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from individual_classic import IndividualClassic
+from nsga2_classic import NSGA2Classic
+from nsga2_hybrid import NSGA2Hybrid
+
+@pytest.mark.parametrize('scenario, seed', [('small', 11), ('large', 1)])
+@pytest.mark.parametrize('engine_class', [NSGA2Classic, NSGA2Hybrid])
+def test_delta_state_matches_full_evaluation(generated, scenario, seed, engine_class):
+	problem = generated(scenario, seed)
+	engine = engine_class(problem)
+	rng = np.random.default_rng(0)
+
+	for _ in range(5):
+		# Sebagian kecil server dipakai agar pelanggaran muncul & hilang selama move acak
+		servers = int(rng.integers(1, problem.N_P))
+		individual = engine._create_individual_from_list([int(s) for s in rng.integers(0, servers, problem.N_V)])
+		individual.evaluateFull()
+		for _ in range(200):
+			individual.evaluateDelta(int(rng.integers(problem.N_V)), int(rng.integers(servers)))
+
+		reference = IndividualClassic(problem, list(individual.chromosome_list))
+		reference.evaluateFull()
+		for key, value in reference.objectives.items():
+			assert individual.objectives[key] == pytest.approx(value, rel=1e-9, abs=1e-9), key
+		np.testing.assert_allclose(individual.total_cpu_per_server, reference.total_cpu_per_server)
+		np.testing.assert_allclose(individual.total_mem_per_server, reference.total_mem_per_server)
+		np.testing.assert_allclose(individual.total_net_per_server, reference.total_net_per_server, atol=1e-9)
+		np.testing.assert_allclose(individual.v_net_per_vm, reference.v_net_per_vm, atol=1e-9)
+		for key, violations in reference.constraintViolations.items():
+			np.testing.assert_allclose(individual.constraintViolations[key], violations, atol=1e-9)
+			assert individual.violationTotals[key] == pytest.approx(reference.violationTotals[key], abs=1e-9)
+		assert individual.violatingServers == reference.violatingServers
+		assert individual.isConstraintViolated == reference.isConstraintViolated
+		assert individual.totalViolation == pytest.approx(reference.totalViolation, abs=1e-9)
@@ -0,0 +1,167 @@
+import itertools
+import re
+
+import numpy as np
+import pytest
+
+from exact_solver import ExactParetoSolver
+from lp_writer import server_equivalence_classes, stream_VMP_MOMILP_File
+
+def _read_lp(path):
+	"""Pembaca LP minimal (independen dari lp_writer): {baris: {var: koef}}, sense, rhs, binaries."""
+	text = open(path).read()
+	head, rest = text.split("Subject To\n")
+	constraints, tail = rest.split("Bounds\n")
+	binaries = set(tail.split("Binaries\n")[1].replace("End", "").split())
+
+	rows, senses, rhs = {}, {}, {}
+	term = re.compile(r'([+-])?\s*(\d[\d.]*(?:e[+-]?\d+)?)?\s*([A-Za-z]\w*\[[\d,]+\])')
+	def coefs(expression):
+		result = {}
+		for sign, coef, var in term.findall(expression):
+			result[var] = (-1 if sign == '-' else 1) * (float(coef) if coef else 1.0)
+		return result
+
+	for name, body in re.findall(r'^ (\w+): .*?\n((?:   .*\n)+)', head, re.M):
+		rows[name], senses[name] = coefs(body), 'N'
+	for name, body, sense, value in re.findall(r'^ ([\w\[\],]+): (.*?) (<=|>=|=) (\S+)\n', constraints, re.M | re.S):
+		rows[name], senses[name], rhs[name] = coefs(body), {'<=': 'L', '>=': 'G', '=': 'E'}[sense], float(value)
+	return rows, senses, rhs, binaries
+
+def _read_mps(path):
+	rows, senses, rhs, binaries = {}, {}, {}, set()
+	section = None
+	for line in open(path):
+		if line.startswith('*'):
+			continue
+		if not line.startswith(' '):
+			section = line.split()[0]
+			continue
+		fields = line.split()
+		if section == 'ROWS':
+			senses[fields[1]] = fields[0]
+			rows[fields[1]] = {}
+		elif section == 'COLUMNS' and fields[1] != "'MARKER'":
+			if float(fields[2]) != 0:
+				rows[fields[1]][fields[0]] = float(fields[2])
+		elif section == 'RHS':
+			rhs[fields[1]] = float(fields[2])
+		elif section == 'BOUNDS' and fields[0] == 'BV':
+			binaries.add(fields[2])
+	return rows, senses, rhs, binaries
+
+@pytest.mark.parametrize('formulation', ['linearized', 'compact'])
+def test_mps_matches_lp(generated, tmp_path, formulation):
+	problem = generated('small', 11).subProblem(np.arange(8), np.arange(6))
+	lp_path, mps_path = str(tmp_path / 'model.lp'), str(tmp_path / 'model.mps')
+	stream_VMP_MOMILP_File(problem, lp_path, formulation=formulation, symmetry_breaking=True)
+	stream_VMP_MOMILP_File(problem, mps_path, formulation=formulation, symmetry_breaking=True)
+
+	lp_rows, lp_senses, lp_rhs, lp_binaries = _read_lp(lp_path)
+	mps_rows, mps_senses, mps_rhs, mps_binaries = _read_mps(mps_path)
+
+	assert list(mps_senses) == list(lp_senses)
+	assert mps_senses == lp_senses
+	assert mps_binaries == lp_binaries
+	assert mps_rhs == {name: value for name, value in lp_rhs.items() if value != 0}
+	for name, coefs in lp_rows.items():
+		assert mps_rows[name] == pytest.approx(coefs), name
+	assert not list(tmp_path.glob('*.tmp.lp'))
+
+def test_matches_gurobipy_writer(generated, tmp_path):
+	pytest.importorskip('gurobipy')
+	from lp_generator import create_VMP_MOMILP_File
+
+	problem = generated('small', 11)
+	reference, streamed = tmp_path / 'gurobi.lp', tmp_path / 'stream.lp'
+	create_VMP_MOMILP_File(problem, str(reference))
+	if not reference.exists():
+		pytest.skip("gurobipy could not write the model (license size limit?)")
+	stream_VMP_MOMILP_File(problem, str(streamed))
+
+	# Baris komentar (signature Gurobi) tidak bisa direproduksi
+	strip = lambda path: [line for line in path.read_text().splitlines() if not line.startswith('\\')]
+	assert strip(streamed) == strip(reference)
+
+def _epsilon_constraint(path, power_bounds):
+	"""Selesaikan model LP dengan scipy: min CommunicationCost s.t. PowerConsumption <= eps, untuk setiap eps."""
+	optimize = pytest.importorskip('scipy.optimize')
+	rows, senses, rhs, binaries = _read_lp(path)
+	names = sorted({var for coefs in rows.values() for var in coefs})
+	index = {var: n for n, var in enumerate(names)}
+	def dense(coefs):
+		vector = np.zeros(len(names))
+		for var, coef in coefs.items():
+			vector[index[var]] = coef
+		return vector
+
+	constraints = [name for name in senses if senses[name] != 'N']
+	A = np.array([dense(rows[name]) for name in constraints])
+	b = np.array([rhs[name] for name in constraints])
+	lower = np.where([senses[name] == 'L' for name in constraints], -np.inf, b)
+	upper = np.where([senses[name] == 'G' for name in constraints], np.inf, b)
+	power, net = dense(rows['PowerConsumption']), dense(rows['CommunicationCost'])
+	integrality = np.array([var in binaries for var in names], dtype=int)
+	bounds = optimize.Bounds(0, np.where(integrality, 1, np.inf))
+
+	values = []
+	for eps in power_bounds:
+		result = optimize.milp(net, integrality=integrality, bounds=bounds, constraints=[
+			optimize.LinearConstraint(A, lower, upper), optimize.LinearConstraint(power, -np.inf, eps + 1e-6)])
+		assert result.success
+		values.append(result.fun)
+	return np.array(values)
+
+@pytest.mark.parametrize('seed', range(4))
+def test_formulations_reach_exact_front(tight_problem, tmp_path, seed):
+	problem = tight_problem(seed)
+	front = ExactParetoSolver(problem).solve()
+	assert len(front)
+
+	# epsilon-constraint di setiap titik front eksak: kedua formulasi harus memberi CommunicationCost yang sama
+	for formulation in ('linearized', 'compact'):
+		path = str(tmp_path / f"{formulation}.lp")
+		stream_VMP_MOMILP_File(problem, path, formulation=formulation)
+		np.testing.assert_allclose(_epsilon_constraint(path, front[:, 0]), front[:, 1], rtol=1e-7, atol=1e-7)
+
+def _non_ultrametric(problem, seed):
+	"""Spesifikasi server diseragamkan sebagian & C_matrix simetris acak (bukan fat-tree)."""
+	rng = np.random.default_rng(seed)
+	N_P = problem.N_P
+	for name in ('p_cpu', 'p_mem', 'p_net', 'PC_idle', 'PC_max'):
+		values = getattr(problem, name)
+		setattr(problem, name, values[rng.integers(0, 2, N_P)])
+	C = np.triu(rng.choice([1.0, 2.0, 3.0], (N_P, N_P)), 1)
+	problem.C_matrix = C + C.T
+	return problem
+
+@pytest.mark.parametrize('seed', range(20))
+def test_equivalence_classes_are_exact_automorphisms(tight_problem, seed):
+	problem = _non_ultrametric(tight_problem(seed, num_servers=6), seed)
+	specs = np.column_stack((problem.p_cpu, problem.p_mem, problem.p_net, problem.PC_idle, problem.PC_max, problem.g_vector))
+	label = np.arange(problem.N_P)
+	for members in server_equivalence_classes(problem):
+		label[members] = members[0]
+
+	# u ~ v tepat ketika menukar u & v mempertahankan spesifikasi dan seluruh C_matrix
+	for u, v in itertools.combinations(range(problem.N_P), 2):
+		perm = np.arange(problem.N_P)
+		perm[[u, v]] = [v, u]
+		swappable = (np.array_equal(specs[perm], specs) and
+					 np.array_equal(problem.C_matrix[np.ix_(perm, perm)], problem.C_matrix))
+		assert (label[u] == label[v]) == swappable, (u, v)
+
+@pytest.mark.parametrize('seed', range(4))
+def test_symmetry_breaking_keeps_front_non_ultrametric(tight_problem, tmp_path, seed):
+	problem = tight_problem(seed)
+	for name in ('p_cpu', 'p_mem', 'p_net', 'PC_idle', 'PC_max'):
+		setattr(problem, name, np.full(problem.N_P, getattr(problem, name).max()))
+	# C[0,2] = 3 > max(C[0,3], C[3,2]) = 2: bukan ultrametrik. Biaya ke luar kelas saja sama untuk
+	# keempat server, tetapi hanya server 0 & 1 yang benar-benar dapat ditukar
+	problem.C_matrix = np.array([[0, 1, 3, 2], [1, 0, 3, 2], [3, 3, 0, 2], [2, 2, 2, 0]], dtype=float)
+	assert server_equivalence_classes(problem) == [[0, 1]]
+	front = ExactParetoSolver(problem).solve()
+
+	path = str(tmp_path / 'symmetry.lp')
+	stream_VMP_MOMILP_File(problem, path, symmetry_breaking=True)
+	np.testing.assert_allclose(_epsilon_constraint(path, front[:, 0]), front[:, 1], rtol=1e-7, atol=1e-7)
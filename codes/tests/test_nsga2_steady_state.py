@@ -0,0 +1,113 @@
+import random
+import time
+
+import pytest
+
+from individual import Individual
+from nsga2 import NSGA2
+import nsga2_steady_state
+from nsga2_steady_state import IncrementalFronts, NSGA2SteadyStateClassic, NSGA2SteadyStateHybrid
+from population import Population
+
+class _Point:
+	"""Individu tiruan: hanya objektif & pelanggaran yang dipakai sorting."""
+	dominates = Individual.dominates
+
+	def __init__(self, power, net, violation):
+		self.objectives = {'power_consumption': power, 'net_communication': net}
+		self.totalViolation = violation
+		self.isConstraintViolated = violation > 0
+		self.crowdingDistance = 0.0
+
+class _Sorter:
+	calculateCrowdingDistance = NSGA2.calculateCrowdingDistance
+	fastNonDominatedSort = NSGA2.fastNonDominatedSort
+
+def _reference_ranks(engine, individuals):
+	"""Rank dari fastNonDominatedSort; rank inkremental dikembalikan setelahnya."""
+	incremental = [ind.frontRank for ind in individuals]
+	engine.fastNonDominatedSort(Population(list(individuals)))
+	reference = [ind.frontRank for ind in individuals]
+	for ind, rank in zip(individuals, incremental):
+		ind.frontRank = rank
+	return incremental, reference
+
+def test_incremental_fronts_match_fast_non_dominated_sort():
+	random.seed(3)
+	sorter = _Sorter()
+	for _ in range(100):
+		fronts = IncrementalFronts(sorter)
+		live = []
+		for _ in range(40):
+			point = _Point(random.randint(0, 15), random.randint(0, 15), random.choice([0, 0, 0, 0, 1, 2, 2]))
+			fronts.insert(point)
+			live.append(point)
+			if len(live) > 25:
+				live.remove(fronts.popWorst())
+			incremental, reference = _reference_ranks(sorter, live)
+			assert incremental == reference
+
+@pytest.mark.parametrize('engine_class', [NSGA2SteadyStateClassic, NSGA2SteadyStateHybrid])
+@pytest.mark.parametrize('workers', [None, 2])
+def test_engine_fronts_match_fast_non_dominated_sort(generated, engine_class, workers):
+	checks = []
+
+	class Checked(engine_class):
+		def _admit(self, offspring, budget):
+			added = super()._admit(offspring, budget)
+			checks.append(_reference_ranks(self, self.population.individuals))
+			return added
+
+	engine = Checked(generated('small', 11), populationSize=20, maxGeneration=5, workers=workers)
+	engine.setSeed(4)
+	engine.run(verbose=False)
+
+	assert checks
+	for incremental, reference in checks:
+		assert incremental == reference
+	# Front akhir = partisi populasi menurut rank
+	assert sum(len(front) for front in engine.population.fronts) == engine.populationSize
+	for rank, front in enumerate(engine.population.fronts):
+		assert all(ind.frontRank == rank for ind in front)
+
+@pytest.mark.parametrize('engine_class', [NSGA2SteadyStateClassic, NSGA2SteadyStateHybrid])
+def test_worker_reuses_parent_evaluation(generated, monkeypatch, engine_class):
+	problem = generated('small', 11)
+	engine = engine_class(problem, populationSize=10, maxGeneration=1, crossoverProbability=0.0, mutationProbability=0.0)
+	engine.setSeed(2)
+	engine.generatePopulation()
+	engine.fronts = IncrementalFronts(engine)
+	for ind in engine.population.individuals:
+		engine.fronts.insert(ind)
+
+	class Pool:
+		def submit(self, function, *args):
+			return args
+	payload, seed = engine._submitJob(Pool())
+
+	nsga2_steady_state._init_worker(engine_class, problem, 0.0, 0.0)
+	calls = []
+	monkeypatch.setattr(Individual, 'evaluateFull', lambda self: calls.append(self))
+	offspring = nsga2_steady_state._reproduce_job(payload, seed)
+
+	# Tanpa crossover/mutasi anak = clone parent: objektif & load terbawa tanpa evaluasi ulang
+	assert calls == []
+	for child in offspring:
+		parent = next(ind for ind in engine.population.individuals if ind.chromosome_list == child.chromosome_list)
+		assert child.objectives == parent.objectives
+		assert child.isConstraintViolated == parent.isConstraintViolated
+		assert (child.total_cpu_per_server == parent.total_cpu_per_server).all()
+
+@pytest.mark.parametrize('workers', [None, 2])
+def test_time_limit_stops_run(generated, workers):
+	engine = NSGA2SteadyStateClassic(generated('small', 11), populationSize=20, maxGeneration=100000, workers=workers)
+	engine.setSeed(1)
+	engine.setTimeLimit(1.0)
+	start = time.time()
+	engine.run(verbose=False)
+
+	assert time.time() - start < 5.0
+	assert 0 < engine.generationsDone < engine.maxGeneration
+	# generationsDone = jumlah offspring (evaluasi di luar populasi awal) / populationSize
+	assert engine.generationsDone == (engine.evaluations - engine.populationSize) // engine.populationSize
+	assert len(engine.population) == engine.populationSize
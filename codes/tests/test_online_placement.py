@@ -0,0 +1,109 @@
+import random
+
+import numpy as np
+import pytest
+
+from individual_classic import IndividualClassic
+from individual_hybrid import IndividualHybrid
+from nsga2_hybrid import NSGA2Hybrid
+from nsga2_steady_state import NSGA2SteadyStateHybrid
+from online_placement import OnlinePlacement
+
+def _events():
+	return [
+		{'type': 'add', 'v_cpu': 2, 'v_mem': 4, 'e': 0.5, 'traffic': {'0': 1.0, '-2': 1.5}},
+		{'type': 'add', 'v_cpu': 1, 'v_mem': 2, 'traffic': {'-1': 0.7, '3': 0.2}},
+		{'type': 'remove', 'vm': 3},
+		{'type': 'resize', 'vm': 5, 'v_cpu': 4},
+	]
+
+def test_apply_events_supports_intra_batch_traffic(generated):
+	problem = generated('small', 11)
+	old_T = problem.T_matrix.copy()
+	vm_map, new_vms = problem.applyEvents(_events())
+
+	first, second = new_vms
+	assert problem.N_V == 51
+	assert vm_map[3] == -1 and vm_map[5] == 4
+	assert problem.v_cpu[vm_map[5]] == 4
+	np.testing.assert_allclose(problem.T_matrix, problem.T_matrix.T)
+	# Nilai terbesar dipakai jika dua VM baru saling menyebut
+	assert problem.T_matrix[first, second] == 1.5
+	assert problem.T_matrix[first, vm_map[0]] == 1.0
+	# Peer lama yang dihapus di batch yang sama diabaikan
+	assert problem.T_matrix[second].sum() == pytest.approx(1.5)
+	np.testing.assert_allclose(problem.T_matrix[:49, :49], np.delete(np.delete(old_T, 3, 0), 3, 1))
+
+@pytest.mark.parametrize('peer', ['-1', '-3'])
+def test_apply_events_rejects_invalid_new_peers(generated, peer):
+	problem = generated('small', 11)
+	with pytest.raises(IndexError):
+		problem.applyEvents([{'type': 'add', 'v_cpu': 1, 'v_mem': 1, 'traffic': {peer: 1.0}},
+							 {'type': 'add', 'v_cpu': 1, 'v_mem': 1}])
+
+def test_migration_objective_requires_generational_engine(generated):
+	problem = generated('small', 11)
+	with pytest.raises(ValueError):
+		OnlinePlacement(problem, NSGA2SteadyStateHybrid, migrationObjective=True)
+
+	problem.previous_placement = np.zeros(problem.N_V, dtype=int)
+	engine = NSGA2Hybrid(problem, 10, 1)
+	engine.enableArchive(20)
+	with pytest.raises(ValueError):
+		engine.run(verbose=False)
+
+@pytest.mark.parametrize('representation', ['classic', 'hybrid'])
+def test_delta_matches_full_evaluation_with_migrations(generated, representation):
+	problem = generated('small', 11)
+	online = OnlinePlacement(problem, populationSize=10, maxGeneration=3, migrationObjective=True)
+	online.initialize(seed=1)
+	online.commit(online.front[0])
+	online.applyEvents(_events())
+
+	random.seed(2)
+	deployed = np.array(online.deployed)
+	problem.previous_placement = deployed
+	chromosome = [server if server >= 0 else random.randrange(problem.N_P) for server in deployed.tolist()]
+
+	def build(chromosome):
+		if representation == 'classic':
+			individual = IndividualClassic(problem, list(chromosome))
+		else:
+			server_map = {}
+			for vm_idx, server_idx in enumerate(chromosome):
+				server_map.setdefault(server_idx, []).append(vm_idx)
+			individual = IndividualHybrid(problem, server_map)
+		individual.evaluateFull()
+		return individual
+
+	individual = build(chromosome)
+	for _ in range(200):
+		individual.evaluateDelta(random.randrange(problem.N_V), random.randrange(problem.N_P))
+
+	reference = build(individual.chromosome_list)
+	assert reference.objectives['migrations'] > 0
+	for key, value in reference.objectives.items():
+		assert individual.objectives[key] == pytest.approx(value), key
+	assert individual.totalViolation == pytest.approx(reference.totalViolation)
+	assert individual.violatingServers == reference.violatingServers
+	problem.previous_placement = None
+
+@pytest.mark.parametrize('bad_event, error', [
+	({'type': 'add', 'v_cpu': 3.0}, ValueError),
+	({'type': 'remove', 'vm': -1}, IndexError),
+	({'type': 'resize', 'vm': 50, 'v_cpu': 2}, IndexError),
+	({'type': 'add', 'v_cpu': 1, 'v_mem': 1, 'traffic': {'50': 1.0}}, IndexError),
+	({'type': 'remove'}, ValueError),
+])
+def test_failed_batch_leaves_problem_unchanged(generated, bad_event, error):
+	problem = generated('small', 11)
+	before = {name: np.copy(getattr(problem, name)) for name in ('v_cpu', 'v_mem', 'e_vector', 'T_matrix')}
+	with pytest.raises(error):
+		problem.applyEvents([{'type': 'add', 'v_cpu': 1, 'v_mem': 1}, {'type': 'remove', 'vm': 0}, bad_event])
+
+	assert problem.N_V == 50
+	for name, value in before.items():
+		np.testing.assert_array_equal(getattr(problem, name), value)
+	# Problem tetap bisa dipakai batch berikutnya
+	problem.applyEvents([{'type': 'remove', 'vm': 1}])
+	assert problem.N_V == len(problem.v_mem) == len(problem.v_cpu) == 49
@@ -0,0 +1,129 @@
+import json
+import os
+import stat
+import sys
+import time
+
+import pytest
+
+from pamilo_runner import PaMILOJobQueue, PaMILORunner
+
+# Pengganti pamilo_cli: argumen sama (<lp> -o <base> -t <threads>), perilaku diatur oleh isi file .lp
+STUB = f"""#!{sys.executable}
+import json, signal, sys, time
+lp, base, threads = sys.argv[1], sys.argv[3], sys.argv[5]
+mode = open(lp).read().strip()
+print(f"stub start t={{threads}}", flush=True)
+print("stub stderr", file=sys.stderr, flush=True)
+if mode == 'fail':
+	sys.exit(3)
+if mode in ('slow', 'stubborn'):
+	if mode == 'stubborn':
+		signal.signal(signal.SIGTERM, signal.SIG_IGN)
+	with open(base + "_sol.json", 'w') as f:
+		json.dump({{'partial': True}}, f)
+	for i in range(600):
+		print(f"iteration {{i}}", flush=True)
+		time.sleep(0.1)
+time.sleep(float(mode) if mode.replace('.', '', 1).isdigit() else 0.2)
+with open(base + "_sol.json", 'w') as f:
+	json.dump({{'ok': True}}, f)
+print("done", flush=True)
+"""
+
+@pytest.fixture
+def stub(tmp_path):
+	path = tmp_path / 'pamilo_stub'
+	path.write_text(STUB)
+	path.chmod(path.stat().st_mode | stat.S_IEXEC)
+	return str(path)
+
+def _queue(stub, tmp_path, modes, timeouts=None, **options):
+	options = dict({'total_threads': 4, 'threads_per_job': 2, 'log_dir': str(tmp_path / 'logs'),
+					'poll_interval': 0.02, 'progress_interval': 0}, **options)
+	queue = PaMILOJobQueue(stub, **options)
+	for name, mode in modes.items():
+		lp = tmp_path / f"{name}.lp"
+		lp.write_text(mode)
+		queue.add(name, str(lp), str(tmp_path / 'out' / name), timeout_sec=(timeouts or {}).get(name, 60))
+	return queue
+
+def test_jobs_run_concurrently_within_thread_budget(stub, tmp_path):
+	queue = _queue(stub, tmp_path, {'a': '0.5', 'b': '0.5', 'c': '0.5'})
+	start = time.time()
+	queue.run()
+	elapsed = time.time() - start
+
+	assert [job.status for job in queue.jobs] == ['success'] * 3
+	# max_parallel = 4 // 2: a & b bersamaan, c menunggu slot
+	assert queue.max_parallel == 2
+	assert 1.0 <= elapsed < 1.5
+	assert queue.jobs[2].start_time - queue.jobs[0].start_time >= 0.4
+	for job in queue.jobs:
+		assert json.load(open(job.solution_path)) == {'ok': True}
+
+def test_log_captures_stdout_stderr_incrementally(stub, tmp_path):
+	queue = _queue(stub, tmp_path, {'slow': 'slow', 'fail': 'fail'}, timeouts={'slow': 0.6})
+	queue.run()
+	slow, fail = queue.jobs
+
+	# Log tertulis selama job berjalan, bukan hanya setelah selesai
+	log = open(slow.log_path).read()
+	assert log.startswith(f"$ {stub} ")
+	assert 'stub stderr' in log and 'iteration 3' in log
+
+	assert fail.status == 'failed' and fail.returncode == 3
+	assert 'stub stderr' in open(fail.log_path).read()
+	assert fail.solution_path is None
+
+def test_timeout_collects_partial_front(stub, tmp_path):
+	queue = _queue(stub, tmp_path, {'slow': 'slow'}, timeouts={'slow': 0.5})
+	queue.run()
+	job = queue.jobs[0]
+
+	assert job.status == 'timeout' and job.partial
+	assert json.load(open(job.solution_path)) == {'partial': True}
+	assert job.elapsed < 2.0
+
+def test_stale_solution_is_not_collected(stub, tmp_path):
+	queue = _queue(stub, tmp_path, {'fail': 'fail'})
+	stale = tmp_path / 'out' / 'fail_sol.json'
+	stale.parent.mkdir()
+	stale.write_text('{}')
+	old = time.time() - 60
+	os.utime(stale, (old, old))
+
+	queue.run()
+	assert queue.jobs[0].status == 'failed' and queue.jobs[0].solution_path is None
+
+def test_grace_period_does_not_block_other_jobs(stub, tmp_path):
+	queue = _queue(stub, tmp_path, {'stubborn': 'stubborn', 'fast': '0.8'}, timeouts={'stubborn': 0.3})
+	queue.TERMINATE_GRACE_SEC = 2.0
+	queue.run()
+	stubborn, fast = queue.jobs
+
+	# SIGTERM diabaikan -> SIGKILL setelah grace; job lain tetap dipanen tepat waktu
+	assert stubborn.status == 'timeout' and stubborn.partial
+	assert stubborn.returncode == -9
+	assert stubborn.elapsed >= 2.3
+	assert fast.status == 'success' and fast.elapsed < 1.5
+
+def test_global_timeout_stops_running_and_skips_pending(stub, tmp_path):
+	queue = _queue(stub, tmp_path, {'a': 'slow', 'b': 'slow', 'c': '0.1'}, global_timeout_sec=0.5)
+	start = time.time()
+	queue.run()
+
+	assert [job.status for job in queue.jobs] == ['timeout', 'timeout', 'skipped']
+	assert all(job.partial for job in queue.jobs[:2])
+	assert time.time() - start < 2.0
+
+def test_missing_executable_fails_all_jobs(tmp_path):
+	queue = _queue(str(tmp_path / 'missing'), tmp_path, {'a': '0.1'})
+	queue.run()
+	assert queue.jobs[0].status == 'failed'
+
+def test_runner_single_job(stub, tmp_path):
+	lp = tmp_path / 'single.lp'
+	lp.write_text('0.1')
+	assert PaMILORunner(stub).solve(str(lp), str(tmp_path / 'single' / 'out'), timeout_sec=30)
+	assert os.path.exists(tmp_path / 'single' / 'out_sol.json')
@@ -0,0 +1,117 @@
+import os
+import signal
+import threading
+import time
+
+import pytest
+
+from placement_service import PlacementService, ServiceError
+
+@pytest.fixture
+def service():
+	service = PlacementService(workers=2, grace=0.0)
+	yield service
+	service.shutdown()
+
+def _load(service, path, problem_id='p', **options):
+	return service.handle('POST', '/problems', dict({'id': problem_id, 'path': path, 'generations': 5, 'population': 10}, **options))
+
+def _record_commands(worker):
+	"""Catat perintah yang dikirim proses utama ke worker."""
+	commands = []
+	send = worker.conn.send
+	def recording(message):
+		commands.append(message[0])
+		send(message)
+	worker.conn.send = recording
+	return commands
+
+def test_state_stays_resident_in_worker(service, generated_file):
+	_load(service, generated_file('small', 11))
+	worker = service.workers[service.entries['p']['worker']]
+	commands = _record_commands(worker)
+
+	service.handle('POST', '/place', {'problem': 'p', 'seed': 1})
+	response = service.handle('POST', '/reoptimize', {'problem': 'p', 'seed': 1, 'events': [
+		{'type': 'add', 'v_cpu': 1, 'v_mem': 2, 'traffic': {'0': 0.5}}, {'type': 'remove', 'vm': 3}]})
+	service.handle('POST', '/reoptimize', {'problem': 'p', 'seed': 2, 'events': []})
+
+	# Problem dikirim sekali; request berikutnya hanya membawa event & front
+	assert commands == ['load', 'place', 'reoptimize', 'reoptimize']
+	assert all(len(placement) == 50 for placement in response['placements'])
+	assert worker.process.pid == service.workers[service.entries['p']['worker']].process.pid
+
+def test_problems_spread_over_workers(service, generated_file):
+	_load(service, generated_file('small', 11), 'a')
+	_load(service, generated_file('small', 12), 'b')
+	assert {service.entries['a']['worker'], service.entries['b']['worker']} == {0, 1}
+
+def test_timeout_respawns_worker(service, generated_file):
+	_load(service, generated_file('large', 1), generations=1000)
+	worker = service.workers[service.entries['p']['worker']]
+	pid = worker.process.pid
+	with pytest.raises(ServiceError) as error:
+		service.handle('POST', '/place', {'problem': 'p', 'seed': 1, 'time_budget': 0.0})
+	assert error.value.status == 504
+	# Worker yang overrun diganti proses baru; state dikirim ulang dari salinan proses utama
+	assert worker.process.pid != pid and worker.process.is_alive()
+	service.grace = 60.0
+	response = service.handle('POST', '/place', {'problem': 'p', 'seed': 1, 'time_budget': 0.5})
+	assert response['generations'] < 1000
+
+def test_crashed_worker_fails_only_its_request(service, generated_file):
+	_load(service, generated_file('large', 1), generations=1000)
+	service.grace = 60.0
+	worker = service.workers[service.entries['p']['worker']]
+	errors = []
+
+	def request():
+		try:
+			service.handle('POST', '/place', {'problem': 'p', 'seed': 1, 'time_budget': 30.0})
+		except ServiceError as e:
+			errors.append(e)
+
+	thread = threading.Thread(target=request)
+	thread.start()
+	time.sleep(1.0)
+	os.kill(worker.process.pid, signal.SIGKILL)
+	thread.join()
+	assert errors and errors[0].status == 500 and 'exit code' in str(errors[0])
+
+	assert service.handle('POST', '/place', {'problem': 'p', 'seed': 1, 'time_budget': 0.5})['front']
+
+def test_invalid_events_do_not_reach_worker(service, generated_file):
+	_load(service, generated_file('small', 11))
+	service.handle('POST', '/place', {'problem': 'p', 'seed': 1})
+	with pytest.raises(ServiceError) as error:
+		service.handle('POST', '/reoptimize', {'problem': 'p', 'events': [{'type': 'add', 'v_cpu': 3.0}]})
+	assert error.value.status == 400
+	response = service.handle('POST', '/reoptimize', {'problem': 'p', 'seed': 1, 'events': [{'type': 'remove', 'vm': 0}]})
+	assert all(len(placement) == 49 for placement in response['placements'])
+
+def test_eviction_is_reported(generated_file):
+	service = PlacementService(workers=1, maxProblems=1)
+	try:
+		_load(service, generated_file('small', 11), 'a')
+		assert _load(service, generated_file('small', 12), 'b')['evicted'] == ['a']
+	finally:
+		service.shutdown()
+
+def test_reload_waits_for_in_flight_request(service, generated_file):
+	_load(service, generated_file('small', 11))
+	entry = service.entries['p']
+	old_state = entry['state']
+
+	# Simulasikan request yang sedang berjalan: lock entry dipegang
+	entry['lock'].acquire()
+	reload = threading.Thread(target=_load, args=(service, generated_file('small', 12)))
+	reload.start()
+	reload.join(timeout=0.5)
+	assert reload.is_alive()
+	assert entry['state'] is old_state
+	entry['lock'].release()
+	reload.join()
+
+	assert service.entries['p'] is entry
+	assert entry['state'] is not old_state
+	assert entry['loaded'] is None
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from individual_classic import IndividualClassic
+from nsga2_classic import NSGA2Classic
+from nsga2_hybrid import NSGA2Hybrid
+
+@pytest.mark.parametrize('scenario, seed', [('small', 11), ('large', 1)])
+@pytest.mark.parametrize('engine_class', [NSGA2Classic, NSGA2Hybrid])
+def test_repair_leaves_individual_feasible(generated, scenario, seed, engine_class):
+	problem = generated(scenario, seed)
+	engine = engine_class(problem)
+	rng = np.random.default_rng(0)
+
+	repaired = 0
+	for _ in range(10):
+		# Semua VM ditumpuk di 1-3 server terkecil: hampir pasti overload
+		crowded = np.argsort(problem.p_cpu)[:int(rng.integers(1, 4))]
+		individual = engine._create_individual_from_list([int(s) for s in rng.choice(crowded, problem.N_V)])
+		individual.evaluateFull()
+		if not individual.isConstraintViolated:
+			continue
+
+		moved = engine.repair(individual)
+		repaired += 1
+		assert moved > 0
+		assert not individual.isConstraintViolated
+		assert individual.totalViolation == 0
+
+		# State hasil delta sama dengan evaluasi penuh kromosom hasil repair
+		reference = IndividualClassic(problem, list(individual.chromosome_list))
+		reference.evaluateFull()
+		assert not reference.isConstraintViolated
+		for key, value in reference.objectives.items():
+			assert individual.objectives[key] == pytest.approx(value), key
+	assert repaired > 0